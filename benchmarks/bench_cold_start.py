@@ -0,0 +1,95 @@
+"""Benchmark cold start to first frame, standalone against through the hub.
+
+Each standalone launch starts a fresh interpreter that imports one game,
+opens its window and draws a frame, as the play_*.py scripts do; the time
+runs from spawning the process to the frame being presented. The "via hub"
+launch is timed the same way, in a fresh interpreter that draws the hub
+menu and then picks the game, so it compares like for like with the
+standalone launch. Within a running hub a game costs only its first-use
+import and constructor, measured in-process on a first and a repeated
+selection. SDL's dummy video driver is used throughout:
+    python -m benchmarks.bench_cold_start
+"""
+
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from shared.hub import GAMES, GameHub
+
+REPEATS = 5
+
+
+def child(target):
+    """Draw one frame of target, then report it on stdout.
+
+    Args:
+        target: "hub" for the hub menu, a game key for the game on its own,
+            or "hub:<game key>" for the hub menu followed by that game
+    """
+    if target.startswith("hub:"):
+        hub = GameHub()
+        hub.draw()
+        game = hub.launch(target[len("hub:") :])
+    elif target == "hub":
+        game = GameHub()
+    else:
+        module_name, class_name = next((module, name) for key, _, module, name in GAMES if key == target)
+        game = getattr(importlib.import_module(module_name), class_name)()
+    game.draw()
+    print("frame", flush=True)
+
+
+def spawn_to_first_frame(target):
+    """Return seconds from spawning a child process to its first frame."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_cold_start", target],
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    line = process.stdout.readline()
+    elapsed = time.perf_counter() - start
+    process.wait()
+    if line.strip() != "frame":
+        raise RuntimeError(f"{target} exited without drawing a frame")
+    return elapsed
+
+
+def switch_to_first_frame(hub, key):
+    """Return seconds for the hub to launch a game and draw its first frame."""
+    start = time.perf_counter()
+    hub.launch(key).draw()
+    elapsed = time.perf_counter() - start
+    hub.restore_window()
+    return elapsed
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    hub_ms = statistics.median(spawn_to_first_frame("hub") for _ in range(REPEATS)) * 1000
+    hub = GameHub(seed=0)
+    hub.draw()
+
+    print(f"hub menu, new process: {hub_ms:.1f} ms")
+    print("new process to the game's first frame, then switches within a running hub:")
+    print(f"{'game':>13} {'standalone ms':>14} {'via hub ms':>11} {'hub first ms':>13} {'hub again ms':>13}")
+    for key, _, _, _ in GAMES:
+        standalone_ms = statistics.median(spawn_to_first_frame(key) for _ in range(REPEATS)) * 1000
+        via_hub_ms = statistics.median(spawn_to_first_frame(f"hub:{key}") for _ in range(REPEATS)) * 1000
+        first_ms = switch_to_first_frame(hub, key) * 1000
+        again_ms = statistics.median(switch_to_first_frame(hub, key) for _ in range(REPEATS)) * 1000
+        print(f"{key:>13} {standalone_ms:14.1f} {via_hub_ms:11.1f} {first_ms:13.1f} {again_ms:13.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        child(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,71 @@
+"""Benchmark Space Combat bullet/enemy collision detection.
+
+Compares the original all-pairs scan against the spatial hash broad phase
+for growing entity counts:
+    python -m benchmarks.bench_collisions
+"""
+
+import random
+import time
+
+from games.space_combat.constants import WINDOW_WIDTH, WINDOW_HEIGHT, ENEMY_WIDTH, ENEMY_HEIGHT
+from games.space_combat.entities import Bullet, Enemy
+from games.space_combat.physics import check_bullet_enemy_collisions, check_collision
+
+ENTITY_COUNTS = [10, 100, 1000, 10000]
+
+
+def naive_bullet_enemy_collisions(bullets, enemies):
+    """All-pairs reference implementation the spatial hash replaced."""
+    collisions = []
+    for bullet_idx, bullet in enumerate(bullets):
+        for enemy_idx, enemy in enumerate(enemies):
+            if check_collision(bullet.get_rect(), enemy.get_rect()):
+                collisions.append((bullet_idx, enemy_idx))
+    return collisions
+
+
+def make_workload(count, seed=0):
+    """Create `count` bullets and `count` enemies scattered over the play field."""
+    rng = random.Random(seed)
+    bullets = [Bullet(rng.randint(0, WINDOW_WIDTH), rng.randint(0, WINDOW_HEIGHT), -7) for _ in range(count)]
+    enemies = [
+        Enemy(rng.randint(0, WINDOW_WIDTH - ENEMY_WIDTH), rng.randint(-ENEMY_HEIGHT, WINDOW_HEIGHT))
+        for _ in range(count)
+    ]
+    return bullets, enemies
+
+
+def time_call(func, *args, repeat=3):
+    """Return the best wall time in seconds over `repeat` calls, and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"{'entities':>9} {'naive ms':>12} {'hashed ms':>12} {'speedup':>9} {'hits':>7}")
+    for count in ENTITY_COUNTS:
+        bullets, enemies = make_workload(count)
+        hashed_time, hashed = time_call(check_bullet_enemy_collisions, bullets, enemies)
+
+        # The quadratic scan takes minutes at 10k, so only time it where it is practical
+        if count <= 1000:
+            naive_time, naive = time_call(naive_bullet_enemy_collisions, bullets, enemies, repeat=1)
+            assert naive == hashed, "spatial hash disagrees with all-pairs scan"
+            naive_ms = f"{naive_time * 1000:12.2f}"
+            speedup = f"{naive_time / hashed_time:8.1f}x"
+        else:
+            naive_ms = f"{'skipped':>12}"
+            speedup = f"{'-':>9}"
+
+        print(f"{count:>9} {naive_ms} {hashed_time * 1000:12.2f} {speedup} {len(hashed):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark dirty-rect rendering in Snake and Pong.
+
+Plays each game at several window sizes with dirty-rect rendering off and
+on, and reports the draw-plus-present time per frame and the share of the
+window presented. SDL's dummy video driver is used, so presenting itself is
+nearly free here; on a real display the uploaded share is what shrinks:
+    python -m benchmarks.bench_dirty_rects
+"""
+
+import random
+import time
+
+import pygame
+
+from games.pong.game import PongGame
+from games.snake.entities import Direction
+from games.snake.game import SnakeGame
+from shared.base_game import init_pygame
+
+WINDOW_SIZES = [(800, 600), (1920, 1080), (3840, 2160)]
+FRAMES = 600
+
+
+def make_game(game_class, size):
+    """Build a game with a window of the given size, ready to play."""
+    game = game_class(seed=0)
+    pygame.display.set_mode(size)
+    game.handle_resize(*size)
+    if isinstance(game, PongGame):
+        game.start_match()
+        game.left_paddle.is_ai = True
+    else:
+        game.reset_game()
+    return game
+
+
+def play(game, dirty, seed=0):
+    """Play FRAMES frames. Returns (ms per draw, share of the window presented)."""
+    game.dirty_rendering = dirty
+    game.request_full_redraw()
+    rng = random.Random(seed)
+    window_area = game.window_width * game.window_height
+    presented = 0
+    seconds = 0.0
+    for frame in range(FRAMES):
+        if isinstance(game, SnakeGame):
+            if rng.random() < 0.2:
+                game.snake.change_direction(rng.choice(list(Direction)))
+            if frame % 6 == 0:
+                game.update()
+            if game.game_over:
+                game.reset_game()
+        else:
+            game.left_paddle.ai_update(game.ball)
+            game.update()
+        start = time.perf_counter()
+        game.draw(rng.random())
+        seconds += time.perf_counter() - start
+        if game._full_frame:
+            presented += window_area
+        else:
+            presented += min(sum(rect.width * rect.height for rect in game.dirty_rects), window_area)
+    return seconds * 1000 / FRAMES, presented / (FRAMES * window_area)
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    init_pygame(headless=True)
+    print(f"{'game':>6} {'window':>10} {'full ms':>8} {'dirty ms':>9} {'presented %':>12}")
+    for game_class in (SnakeGame, PongGame):
+        for size in WINDOW_SIZES:
+            game = make_game(game_class, size)
+            full_ms, _ = play(game, dirty=False)
+            dirty_ms, share = play(game, dirty=True)
+            name = game_class.__name__.removesuffix("Game")
+            print(f"{name:>6} {size[0]:>5}x{size[1]:<4} {full_ms:8.3f} {dirty_ms:9.3f} {100 * share:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
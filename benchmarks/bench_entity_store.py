@@ -0,0 +1,121 @@
+"""Benchmark the Space Combat array-backed entity store at bullet-hell densities.
+
+Times one simulation frame (move, cull, compact and bullet/enemy overlap) for
+growing projectile counts against the per-object list loop it replaced.
+First checks that the overlap queries skip entities killed but not yet
+compacted:
+    python -m benchmarks.bench_entity_store
+"""
+
+import random
+import time
+
+import numpy as np
+import pygame
+
+from games.space_combat.constants import WINDOW_WIDTH, WINDOW_HEIGHT, BULLET_WIDTH, BULLET_HEIGHT, BULLET_SPEED
+from games.space_combat.constants import ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED
+from games.space_combat.entities import Bullet, Enemy
+from games.space_combat.entity_store import EntityStore
+from games.space_combat.physics import check_bullet_enemy_collisions
+
+BULLET_COUNTS = [1000, 10000, 50000, 100000]
+ENEMY_COUNT = 50
+FRAMES = 30
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def make_store_workload(bullet_count, seed=0):
+    """Build bullet and enemy stores filled with random positions."""
+    rng = np.random.default_rng(seed)
+    bullets = EntityStore(Bullet, bullet_count)
+    bullets.spawn_many(
+        rng.integers(0, WINDOW_WIDTH, bullet_count),
+        rng.integers(0, WINDOW_HEIGHT, bullet_count),
+        -BULLET_SPEED,
+        BULLET_WIDTH,
+        BULLET_HEIGHT,
+    )
+    enemies = EntityStore(Enemy, ENEMY_COUNT)
+    enemies.spawn_many(
+        rng.integers(0, WINDOW_WIDTH - ENEMY_WIDTH, ENEMY_COUNT),
+        rng.integers(-ENEMY_HEIGHT, WINDOW_HEIGHT, ENEMY_COUNT),
+        ENEMY_SPEED,
+        ENEMY_WIDTH,
+        ENEMY_HEIGHT,
+    )
+    return bullets, enemies
+
+
+def store_frame(bullets, enemies):
+    """One frame of store-based simulation."""
+    bullets.update(WINDOW_HEIGHT)
+    enemies.update(WINDOW_HEIGHT)
+    check_bullet_enemy_collisions(bullets, enemies)
+
+
+def list_frame(bullets, enemies):
+    """One frame of the original per-object update loop (collisions excluded)."""
+    for bullet in bullets[:]:
+        bullet.update()
+        if bullet.is_off_screen():
+            bullets.remove(bullet)
+    for enemy in enemies[:]:
+        enemy.update()
+        if enemy.is_off_screen():
+            enemies.remove(enemy)
+
+
+def time_frames(frame, bullets, enemies):
+    """Return the mean frame time in milliseconds over FRAMES frames."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        frame(bullets, enemies)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def check_killed_entities(bullet_count=2000, seed=0):
+    """Assert overlap_pairs and overlap_mask match an all-pairs scan of the live entities only."""
+    bullets, enemies = make_store_workload(bullet_count, seed)
+    rng = np.random.default_rng(seed)
+    bullets.kill(np.flatnonzero(rng.random(len(bullets)) < 0.5))
+    enemies.kill(np.flatnonzero(rng.random(len(enemies)) < 0.5))
+
+    bullet_boxes = list(zip(*(column.tolist() for column in bullets.boxes())))
+    enemy_boxes = list(zip(*(column.tolist() for column in enemies.boxes())))
+    expected = [
+        (b_idx, e_idx)
+        for b_idx, bullet in enumerate(bullet_boxes)
+        if bullets.alive[b_idx]
+        for e_idx, enemy in enumerate(enemy_boxes)
+        if enemies.alive[e_idx] and pygame.Rect(bullet).colliderect(enemy)
+    ]
+    b_idx, e_idx = bullets.overlap_pairs(enemies)
+    assert list(zip(b_idx.tolist(), e_idx.tolist())) == expected, "overlap_pairs disagrees with the live pairs"
+    for e_idx in np.flatnonzero(enemies.alive[: len(enemies)]).tolist():
+        hits = np.flatnonzero(bullets.overlap_mask(*enemy_boxes[e_idx])).tolist()
+        assert hits == [b_idx for b_idx, e in expected if e == e_idx], "overlap_mask disagrees with the live pairs"
+    return len(expected)
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"killed entities skipped ({check_killed_entities()} live pairs match)\n")
+    print(f"{'bullets':>8} {'list ms':>10} {'store ms':>10} {'budget':>8}")
+    for count in BULLET_COUNTS:
+        bullets, enemies = make_store_workload(count)
+        store_ms = time_frames(store_frame, bullets, enemies)
+
+        rng = random.Random(0)
+        bullet_list = [
+            Bullet(rng.randint(0, WINDOW_WIDTH), rng.randint(0, WINDOW_HEIGHT), -BULLET_SPEED) for _ in range(count)
+        ]
+        enemy_list = [Enemy(rng.randint(0, WINDOW_WIDTH - ENEMY_WIDTH), -ENEMY_HEIGHT) for _ in range(ENEMY_COUNT)]
+        list_ms = time_frames(list_frame, bullet_list, enemy_list)
+
+        verdict = "ok" if store_ms < FRAME_BUDGET_MS else "over"
+        print(f"{count:>8} {list_ms:10.2f} {store_ms:10.2f} {verdict:>8}")
+
+
+if __name__ == "__main__":
+    main()
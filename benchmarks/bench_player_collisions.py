@@ -0,0 +1,106 @@
+"""Benchmark resolving Space Combat player/enemy collisions for two players.
+
+Compares the previous per-player resolution (one overlap scan, kill and
+compaction of the enemy store per player, after the bullet kills' own
+compaction) against the batched pass that tests both players at once and
+compacts the store a single time, for growing enemy counts. Counts up to
+SMALL_ENEMY_COUNT take the batched pass's pure-Python path:
+    python -m benchmarks.bench_player_collisions
+"""
+
+import time
+
+import numpy as np
+
+from games.space_combat.constants import WINDOW_WIDTH, WINDOW_HEIGHT, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED
+from games.space_combat.entities import Enemy, Player
+from games.space_combat.entity_store import EntityStore
+from games.space_combat.physics import (
+    SMALL_ENEMY_COUNT,
+    check_player_enemy_collisions,
+    resolve_player_enemy_collisions,
+)
+
+ENEMY_COUNTS = [10, 40, 100, 1000, 10000, 100000]
+BULLET_KILL_RATE = 0.01  # Share of enemies killed by bullets earlier in the frame
+REPEATS = 20
+
+
+def make_workload(count, seed=0, top=-ENEMY_HEIGHT):
+    """Build two players and an enemy store with some enemies already killed by bullets.
+
+    Enemies are spread over the window below top; a top near the players crowds them in.
+    """
+    rng = np.random.default_rng(seed)
+    enemies = EntityStore(Enemy, count)
+    enemies.spawn_many(
+        rng.integers(0, WINDOW_WIDTH - ENEMY_WIDTH, count),
+        rng.integers(top, WINDOW_HEIGHT, count),
+        ENEMY_SPEED,
+        ENEMY_WIDTH,
+        ENEMY_HEIGHT,
+    )
+    enemies.kill(np.flatnonzero(rng.random(count) < BULLET_KILL_RATE))
+    players = (Player(WINDOW_WIDTH // 3, WINDOW_HEIGHT - 100), Player(2 * WINDOW_WIDTH // 3, WINDOW_HEIGHT - 100))
+    return players, enemies
+
+
+def per_player(players, enemies):
+    """The previous resolution: compact, then scan, kill and compact once per player."""
+    enemies.compact()
+    rammed = []
+    for player in players:
+        hits = check_player_enemy_collisions(player, enemies)
+        enemies.kill(hits)
+        enemies.compact()
+        rammed.append(len(hits))
+    return rammed
+
+
+def batched(players, enemies):
+    """The batched resolution: one scan for both players, one compaction."""
+    rammed = []
+    for hits in resolve_player_enemy_collisions(players, enemies):
+        enemies.kill(hits)
+        rammed.append(len(hits))
+    enemies.compact()
+    return rammed
+
+
+def time_resolution(resolve, count):
+    """Return the median milliseconds per frame of resolve on fresh workloads, and its last result."""
+    times = []
+    for seed in range(REPEATS):
+        players, enemies = make_workload(count, seed)
+        start = time.perf_counter()
+        result = resolve(players, enemies)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2] * 1000, result, len(enemies)
+
+
+def check_small_counts():
+    """Assert both resolutions agree around SMALL_ENEMY_COUNT, with enemies crowding the players."""
+    rammed = 0
+    for count in range(1, 2 * SMALL_ENEMY_COUNT):
+        for seed in range(10):
+            results = [
+                resolve(*make_workload(count, seed, top=WINDOW_HEIGHT - 200)) for resolve in (per_player, batched)
+            ]
+            assert results[0] == results[1], f"batched resolution disagrees at {count} enemies"
+            rammed += sum(results[0])
+    return rammed
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"agrees below and above {SMALL_ENEMY_COUNT} enemies ({check_small_counts()} rammed)\n")
+    print(f"{'enemies':>8} {'per-player ms':>14} {'batched ms':>11} {'speedup':>8} {'rammed':>8}")
+    for count in ENEMY_COUNTS:
+        old_ms, old, old_left = time_resolution(per_player, count)
+        new_ms, new, new_left = time_resolution(batched, count)
+        assert old == new and old_left == new_left, "batched resolution disagrees with per-player resolution"
+        print(f"{count:>8} {old_ms:14.3f} {new_ms:11.3f} {old_ms / new_ms:7.1f}x {sum(new):>8}")
+
+
+if __name__ == "__main__":
+    main()
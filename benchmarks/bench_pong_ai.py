@@ -0,0 +1,92 @@
+"""Benchmark the Pong paddle AIs.
+
+Plays headless AI-vs-AI rallies (a following left paddle against each right
+paddle mode), with the normal and a slow right paddle, and reports how often
+the right paddle misses, how many frames it spends moving and how often the
+predicting AI recomputes. Then times the closed-form prediction vectorized
+over many paddles at once:
+    python -m benchmarks.bench_pong_ai
+"""
+
+import time
+
+import numpy as np
+
+from games.pong.constants import AI_FOLLOW, AI_PREDICT, WINDOW_WIDTH, WINDOW_HEIGHT, BALL_SIZE, PADDLE_SPEED
+from games.pong.game import PongGame
+from games.pong.trajectory import plane_y
+
+FRAMES = 30000
+PADDLE_SPEEDS = [PADDLE_SPEED, 2]  # A slow paddle must move before the ball arrives
+BATCH_SIZES = [1000, 10000, 100000]
+
+
+def play(ai_mode, reaction_delay=0, aim_error=0, paddle_speed=PADDLE_SPEED, seed=0):
+    """Play FRAMES frames and return (misses, moving frames, predictions, ms per AI update)."""
+    game = PongGame(headless=True, seed=seed)
+    game.start_match()
+    misses = moving = predictions = 0
+    ai_seconds = 0.0
+    for _ in range(FRAMES):
+        left, right = game.left_paddle, game.right_paddle
+        right.speed = paddle_speed
+        left.is_ai = True
+        right.ai_mode = ai_mode
+        right.reaction_delay = reaction_delay
+        right.aim_error = aim_error
+        left.ai_update(game.ball)
+
+        before = right.y
+        start = time.perf_counter()
+        right.ai_update(game.ball, left)
+        ai_seconds += time.perf_counter() - start
+        moving += right.y != before
+        # The game already ran this paddle's AI above; skip its own call
+        right.is_ai = False
+        game.update()
+        right.is_ai = True
+
+        if game.left_score:
+            misses += game.left_score
+            game.left_score = 0
+        if game.is_game_over():
+            predictions += right.predictions
+            game.start_match()
+    predictions += game.right_paddle.predictions
+    return misses, moving, predictions, ai_seconds * 1000 / FRAMES
+
+
+def batch_rate(count, seed=0):
+    """Return paddle predictions per second for one vectorized call over count balls."""
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0, WINDOW_WIDTH, count)
+    y = rng.uniform(0, WINDOW_HEIGHT - BALL_SIZE, count)
+    speed_x = rng.choice([-4.0, 4.0], count)
+    speed_y = rng.uniform(-3, 3, count)
+    contact_x = np.where(speed_x > 0, WINDOW_WIDTH - 50.0, 35.0)
+    start = time.perf_counter()
+    plane_y(x, y, speed_x, speed_y, contact_x, 0, WINDOW_HEIGHT - BALL_SIZE)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print the results."""
+    print(f"{'right AI':>22} {'speed':>6} {'misses':>7} {'moving %':>9} {'predictions':>12} {'ms/update':>10}")
+    for paddle_speed in PADDLE_SPEEDS:
+        for label, mode, delay, error in (
+            ("follow", AI_FOLLOW, 0, 0),
+            ("predict", AI_PREDICT, 0, 0),
+            ("predict delay 8 err 30", AI_PREDICT, 8, 30),
+        ):
+            misses, moving, predictions, ms = play(mode, delay, error, paddle_speed)
+            print(
+                f"{label:>22} {paddle_speed:>6} {misses:>7} {100 * moving / FRAMES:9.1f} {predictions:>12} {ms:10.4f}"
+            )
+
+    print(f"\n{'batch':>8} {'predictions/s':>15}")
+    for count in BATCH_SIZES:
+        print(f"{count:>8} {batch_rate(count):15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Check and time the swept Pong ball collisions at large timesteps.
+
+Runs random rallies against static paddles twice, once in 1-frame steps and
+once in 10-frame steps, and reports the largest difference in the ball's
+final state along with frames simulated per second.
+
+Then plays headless matches with moving paddles (both driven by scripted
+keys) and against the AI, in both its modes, at time_scale 1 and 10. Games
+fast-forwarded by PongGame.update must end exactly as at 1x; the old update,
+which moved the paddles for the whole step before sweeping the ball once,
+is timed and compared alongside:
+    python -m benchmarks.bench_pong_physics
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from games.pong.constants import (  # noqa: E402
+    PADDLE_MARGIN,
+    PADDLE_WIDTH,
+    PADDLE_HEIGHT,
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    BALL_SIZE,
+    AI_FOLLOW,
+    AI_PREDICT,
+    WINNING_SCORE,
+)
+from games.pong.entities import Ball, Paddle  # noqa: E402
+from games.pong.game import PongGame  # noqa: E402
+from shared.batch import HeldKeys  # noqa: E402
+
+TRIALS = 500
+FRAMES = 600
+TIME_STEPS = [1, 10]
+BALL_SPEEDS = [4, 12, 40]
+
+# (label, two-player match, right paddle AI mode)
+MATCHES = [
+    ("moving", True, None),
+    ("ai follow", False, AI_FOLLOW),
+    ("ai predict", False, AI_PREDICT),
+]
+MATCH_SEEDS = range(40)
+MATCH_FRAMES = 3600
+FAST_FORWARD = 10
+# Frames each scripted key is held for, per paddle; both divide by FAST_FORWARD,
+# so every time scale sees the same keys on the same frames
+LEFT_HOLD_FRAMES = 40
+RIGHT_HOLD_FRAMES = 70
+LEFT_KEYS = [HeldKeys((pygame.K_w,)), HeldKeys(()), HeldKeys((pygame.K_s,))]
+RIGHT_KEYS = [HeldKeys((pygame.K_DOWN,)), HeldKeys((pygame.K_UP,))]
+
+
+def make_rallies(ball_speed, seed=0):
+    """Build (ball state, left paddle y, right paddle y) start states."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.uniform(100, WINDOW_WIDTH - 100),
+            rng.uniform(0, WINDOW_HEIGHT - BALL_SIZE),
+            rng.choice([-ball_speed, ball_speed]),
+            rng.uniform(-3, 3),
+            rng.uniform(0, WINDOW_HEIGHT - PADDLE_HEIGHT),
+            rng.uniform(0, WINDOW_HEIGHT - PADDLE_HEIGHT),
+        )
+        for _ in range(TRIALS)
+    ]
+
+
+def run(rallies, time_step):
+    """Simulate every rally for FRAMES frames. Returns (final ball states, seconds)."""
+    left = Paddle(PADDLE_MARGIN, 0)
+    right = Paddle(WINDOW_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, 0)
+    paddles = (left, right)
+    ball = Ball(0, 0)
+    finals = []
+    start = time.perf_counter()
+    for x, y, speed_x, speed_y, left_y, right_y in rallies:
+        ball.x, ball.y, ball.speed_x, ball.speed_y = x, y, speed_x, speed_y
+        left.y, right.y = left_y, right_y
+        for _ in range(FRAMES // time_step):
+            ball.update(time_step, paddles)
+        finals.append((ball.x, ball.y, ball.speed_x, ball.speed_y))
+    return finals, time.perf_counter() - start
+
+
+def legacy_update(game):
+    """PongGame.update before it interleaved paddles and ball: all paddle moves, then one sweep."""
+    if game.game_state != "playing" or game.paused:
+        return
+    for _ in range(game.time_scale):
+        game.apply_held_keys()
+        if not game.two_player_mode:
+            game.right_paddle.ai_update(game.ball, game.left_paddle)
+    game.ball.update(game.time_scale, (game.left_paddle, game.right_paddle))
+    if game.ball.is_out_of_bounds_left():
+        game.right_score += 1
+        game.ball.reset_ball()
+    if game.ball.is_out_of_bounds_right():
+        game.left_score += 1
+        game.ball.reset_ball()
+    if max(game.left_score, game.right_score) >= WINNING_SCORE:
+        game.game_state = "game_over"
+
+
+def held_keys(frame, two_player_mode):
+    """Get the scripted keys held on a frame."""
+    keys = LEFT_KEYS[frame // LEFT_HOLD_FRAMES % len(LEFT_KEYS)]
+    if two_player_mode:
+        right = RIGHT_KEYS[frame // RIGHT_HOLD_FRAMES % len(RIGHT_KEYS)]
+        keys = HeldKeys(keys | right)
+    return keys
+
+
+def play_match(seed, two_player_mode, ai_mode, time_scale, update):
+    """Play one headless match for MATCH_FRAMES frames. Returns its final state."""
+    game = PongGame(headless=True, seed=seed)
+    game.start_match(two_player_mode)
+    if ai_mode is not None:
+        game.right_paddle.ai_mode = ai_mode
+    game.time_scale = time_scale
+    for index in range(MATCH_FRAMES // time_scale):
+        game.held_keys = held_keys(index * time_scale, two_player_mode)
+        update(game)
+    ball = game.ball
+    return (game.left_score, game.right_score, game.left_paddle.y, game.right_paddle.y, ball.x, ball.y)
+
+
+def run_matches(two_player_mode, ai_mode, time_scale, update):
+    """Play a match per seed. Returns (final states, seconds)."""
+    start = time.perf_counter()
+    finals = [play_match(seed, two_player_mode, ai_mode, time_scale, update) for seed in MATCH_SEEDS]
+    return finals, time.perf_counter() - start
+
+
+def compare_matches():
+    """Print how fast-forwarded matches with moving paddles compare with 1x play."""
+    print(f"\n{'match':>10} {'update':>8} {'scale':>6} {'frames/s':>12} {'diverged':>9} {'score diff':>11}")
+    for label, two_player_mode, ai_mode in MATCHES:
+        reference, _ = run_matches(two_player_mode, ai_mode, 1, PongGame.update)
+        for name, update in (("current", PongGame.update), ("legacy", legacy_update)):
+            finals, seconds = run_matches(two_player_mode, ai_mode, FAST_FORWARD, update)
+            diverged = sum(final != ref for final, ref in zip(finals, reference))
+            score_diff = sum(abs(a - b) for final, ref in zip(finals, reference) for a, b in zip(final[:2], ref[:2]))
+            frames = len(MATCH_SEEDS) * MATCH_FRAMES / seconds
+            print(
+                f"{label:>10} {name:>8} {FAST_FORWARD:>6} {frames:12,.0f} {diverged:>5}/{len(MATCH_SEEDS):<3}"
+                f" {score_diff:>11}"
+            )
+
+
+def main():
+    """Run the benchmark and print the results tables."""
+    print(f"{'speed':>6} {'step':>5} {'frames/s':>12} {'max diff px':>12}")
+    for ball_speed in BALL_SPEEDS:
+        rallies = make_rallies(ball_speed)
+        reference = None
+        for time_step in TIME_STEPS:
+            finals, seconds = run(rallies, time_step)
+            if reference is None:
+                reference = finals
+            diff = max(abs(a - b) for final, ref in zip(finals, reference) for a, b in zip(final, ref))
+            print(f"{ball_speed:>6} {time_step:>5} {TRIALS * FRAMES / seconds:12,.0f} {diff:12.2e}")
+    compare_matches()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Measure allocation churn and GC pauses of Space Combat under sustained fire.
+
+Runs the same bullet-hell workload two ways: the object path the game used
+to take (Bullet and Enemy objects in lists, built by its old Player.shoot
+and Enemy.spawn_random and stepped one by one, an Explosion per kill, a new
+Rect per get_rect) and the pooled path (shots and spawns written straight
+into the stores, explosions burst into the particle arrays, reused Rects).
+Reports frame times, the mean absolute change in allocated memory blocks
+per frame and garbage collector pauses timed through gc.callbacks:
+    python -m benchmarks.bench_pooling
+"""
+
+import gc
+import random
+import sys
+import time
+
+import pygame
+
+from shared.profiler import percentile
+from games.space_combat.constants import WINDOW_WIDTH, WINDOW_HEIGHT, PLAYER_WIDTH, BULLET_WIDTH, BULLET_SPEED
+from games.space_combat.constants import ENEMY_WIDTH, ENEMY_HEIGHT
+from games.space_combat.entities import Player, Enemy, Bullet
+from games.space_combat.entity_store import EntityStore
+from games.space_combat.particles import ParticleSystem
+from games.space_combat.physics import check_bullet_enemy_collisions
+
+SHOOTERS = 40  # Ships firing every frame
+ENEMY_SPAWNS = 3  # Enemies spawned per frame
+FRAMES = 3000
+
+
+class Explosion:
+    """The growing-circle explosion the game allocated per kill before particles."""
+
+    def __init__(self, x, y):
+        """Initialize explosion at given position."""
+        self.x = x
+        self.y = y
+        self.radius = 5
+        self.max_radius = 25
+        self.growth_rate = 2
+
+    def update(self):
+        """Update explosion animation."""
+        self.radius += self.growth_rate
+
+    def is_finished(self):
+        """Check if explosion animation is finished."""
+        return self.radius >= self.max_radius
+
+
+def shoot(player):
+    """Create a bullet at a player's position, as Player.shoot did before shoot_into."""
+    bullet_x = player.x + player.width // 2 - BULLET_WIDTH // 2
+    return Bullet(bullet_x, player.y, -BULLET_SPEED, player.bullet_color)
+
+
+def spawn_random_enemy(rng=random):
+    """Create an enemy at a random x at the top of the screen, as Enemy.spawn_random did."""
+    return Enemy(rng.randint(0, WINDOW_WIDTH - ENEMY_WIDTH), -ENEMY_HEIGHT)
+
+
+class GCTimer:
+    """Times every garbage collection through gc.callbacks."""
+
+    def __init__(self):
+        """Initialize with no recorded pauses."""
+        self.pauses = []
+        self._start = None
+
+    def __call__(self, phase, info):
+        """gc callback: record the time between each start and stop."""
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.pauses.append((time.perf_counter() - self._start) * 1000)
+            self._start = None
+
+
+def make_shooters():
+    """Build the ships firing every frame, spread along the bottom of the window."""
+    step = WINDOW_WIDTH // SHOOTERS
+    return [Player(i * step, WINDOW_HEIGHT - 50) for i in range(SHOOTERS) if i * step + PLAYER_WIDTH <= WINDOW_WIDTH]
+
+
+def make_object_world():
+    """Build the object path's bullet, enemy and explosion lists."""
+    return [], [], []
+
+
+def make_pooled_world():
+    """Build the pooled path's bullet and enemy stores and particle system."""
+    return EntityStore(Bullet), EntityStore(Enemy), ParticleSystem(seed=0)
+
+
+def object_frame(shooters, bullets, enemies, explosions):
+    """One frame of the game's original loop, allocating a Python object per shot, spawn, kill and rect."""
+    for shooter in shooters:
+        bullets.append(shoot(shooter))
+        pygame.Rect(shooter.x, shooter.y, shooter.width, shooter.height)
+    for _ in range(ENEMY_SPAWNS):
+        enemies.append(spawn_random_enemy())
+    for entities in (bullets, enemies):
+        for entity in entities[:]:
+            entity.update()
+            if entity.is_off_screen():
+                entities.remove(entity)
+    for explosion in explosions[:]:
+        explosion.update()
+        if explosion.is_finished():
+            explosions.remove(explosion)
+    kills = set()
+    hits = set()
+    for b_idx, e_idx in check_bullet_enemy_collisions(bullets, enemies):
+        hits.add(b_idx)
+        if e_idx not in kills:
+            kills.add(e_idx)
+            enemy = enemies[e_idx]
+            explosions.append(Explosion(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2))
+    for b_idx in sorted(hits, reverse=True):
+        bullets.pop(b_idx)
+    for e_idx in sorted(kills, reverse=True):
+        enemies.pop(e_idx)
+
+
+def pooled_frame(shooters, bullets, enemies, particles):
+    """One frame writing into the stores and the particle arrays and reusing rects."""
+    for shooter in shooters:
+        shooter.shoot_into(bullets)
+        shooter.get_rect()
+    for _ in range(ENEMY_SPAWNS):
+        Enemy.spawn_random_into(enemies)
+    bullets.update(WINDOW_HEIGHT)
+    enemies.update(WINDOW_HEIGHT)
+    particles.update(WINDOW_WIDTH, WINDOW_HEIGHT)
+    kills = set()
+    hits = set()
+    for b_idx, e_idx in check_bullet_enemy_collisions(bullets, enemies):
+        hits.add(b_idx)
+        kills.add(e_idx)
+    bullets.kill(list(hits))
+    bullets.compact()
+    kills = sorted(kills)
+    particles.burst(enemies.x[kills] + enemies.width[kills] // 2, enemies.y[kills] + enemies.height[kills] // 2)
+    enemies.kill(kills)
+    enemies.compact()
+
+
+def measure(frame, world):
+    """Run FRAMES frames and return (frame times ms, net blocks per frame, GC pauses ms).
+
+    Args:
+        frame: Frame function, called with the shooters and the world's containers
+        world: (bullets, enemies, explosions) containers the frame works on
+    """
+    random.seed(0)
+    shooters = make_shooters()
+    bullets, enemies, explosions = world
+    timer = GCTimer()
+    gc.collect()
+    gc.callbacks.append(timer)
+    frame_ms = []
+    blocks = []
+    try:
+        for _ in range(FRAMES):
+            blocks_start = sys.getallocatedblocks()
+            start = time.perf_counter()
+            frame(shooters, bullets, enemies, explosions)
+            frame_ms.append((time.perf_counter() - start) * 1000)
+            blocks.append(sys.getallocatedblocks() - blocks_start)
+    finally:
+        gc.callbacks.remove(timer)
+    return frame_ms, blocks, timer.pauses
+
+
+def main():
+    """Run both paths and print a comparison table."""
+    print(f"{'path':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'blocks/frame':>13} {'GCs':>5} {'GC max ms':>10}")
+    for name, frame, make_world in (
+        ("objects", object_frame, make_object_world),
+        ("pooled", pooled_frame, make_pooled_world),
+    ):
+        world = make_world()
+        frame_ms, blocks, pauses = measure(frame, world)
+        frame_ms.sort()
+        mean_blocks = sum(map(abs, blocks)) / len(blocks)
+        print(
+            f"{name:>8} {percentile(frame_ms, 0.5):8.3f} {percentile(frame_ms, 0.99):8.3f} {frame_ms[-1]:8.3f}"
+            f" {mean_blocks:13.1f} {len(pauses):5d} {max(pauses, default=0.0):10.3f}"
+        )
+        explosions = world[2]
+        if isinstance(explosions, ParticleSystem):
+            print(f"{'':>8} {len(explosions)} particles live at the end, {explosions.dropped} dropped over budget")
+
+
+if __name__ == "__main__":
+    main()
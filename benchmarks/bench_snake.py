@@ -0,0 +1,77 @@
+"""Benchmark Snake body updates as the snake fills larger and larger grids.
+
+Builds a snake covering half of a square grid along a serpentine path, then
+times move + self-collision + tail removal per tick, compared with the
+original list body (insert at 0, `head in body[1:]`):
+    python -m benchmarks.bench_snake
+"""
+
+import time
+
+from games.snake.entities import Direction, Snake
+
+GRID_SIDES = [100, 316, 1000]  # Up to a 10^6-cell grid
+SNAKE_FILL = 0.5  # Snake length as a fraction of the grid
+DEQUE_TICKS = 20000
+LIST_TICKS = 200
+
+DIRECTIONS = {direction.value: direction for direction in Direction}
+
+
+def serpentine_cell(i, side):
+    """Get the i-th cell of a row-by-row zigzag walk over a side x side grid."""
+    y, x = divmod(i, side)
+    return (x if y % 2 == 0 else side - 1 - x, y)
+
+
+def step_direction(i, side):
+    """Get the Direction that moves from cell i to cell i + 1 of the walk."""
+    x0, y0 = serpentine_cell(i, side)
+    x1, y1 = serpentine_cell(i + 1, side)
+    return DIRECTIONS[(x1 - x0, y1 - y0)]
+
+
+def deque_ticks(side, length, ticks):
+    """Return the mean milliseconds per tick of the deque-backed Snake."""
+    snake = Snake(*serpentine_cell(0, side))
+    for i in range(length - 1):
+        snake.next_direction = step_direction(i, side)
+        snake.move()
+
+    start = time.perf_counter()
+    for i in range(length - 1, length - 1 + ticks):
+        snake.next_direction = step_direction(i, side)
+        snake.move()
+        if snake.check_self_collision():
+            raise AssertionError("serpentine walk never crosses itself")
+        snake.shrink()
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def list_ticks(side, length, ticks):
+    """Return the mean milliseconds per tick of the original list body."""
+    body = [serpentine_cell(i, side) for i in range(length - 1, -1, -1)]
+
+    start = time.perf_counter()
+    for i in range(length, length + ticks):
+        body.insert(0, serpentine_cell(i, side))
+        if body[0] in body[1:]:
+            raise AssertionError("serpentine walk never crosses itself")
+        body.pop()
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"{'cells':>9} {'length':>8} {'list ms':>10} {'deque ms':>10} {'speedup':>9}")
+    for side in GRID_SIDES:
+        cells = side * side
+        length = int(cells * SNAKE_FILL)
+        ticks = min(DEQUE_TICKS, cells - length - 1)
+        deque_ms = deque_ticks(side, length, ticks)
+        list_ms = list_ticks(side, length, min(LIST_TICKS, ticks))
+        print(f"{cells:>9} {length:>8} {list_ms:10.4f} {deque_ms:10.4f} {list_ms / deque_ms:8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark the vectorized Snake environment against stepping SnakeGame objects.
+
+Drives every board with random actions and reports board-steps per second:
+    python -m benchmarks.bench_snake_env
+"""
+
+import time
+
+import numpy as np
+
+from games.snake.game import SnakeGame
+from games.snake.vector_env import ACTIONS, VectorSnakeEnv
+
+BOARD_COUNTS = [1, 64, 1024, 8192]
+STEPS = 500
+GAME_STEPS = 20000
+
+
+def env_rate(num_boards, seed=0):
+    """Return board-steps per second of a VectorSnakeEnv with num_boards boards."""
+    env = VectorSnakeEnv(num_boards, seed=seed)
+    rng = np.random.default_rng(seed)
+    # Mostly keep going so episodes last long enough to grow the snakes
+    actions = rng.integers(-len(ACTIONS) * 3, len(ACTIONS), size=(STEPS, num_boards))
+    start = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    return num_boards * STEPS / (time.perf_counter() - start)
+
+
+def game_rate():
+    """Return steps per second of one headless SnakeGame."""
+    game = SnakeGame(headless=True)
+    start = time.perf_counter()
+    done = 0
+    while done < GAME_STEPS:
+        done += game.run_headless(max_steps=GAME_STEPS - done)
+        game.reset_game()
+    return GAME_STEPS / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    print(f"{'boards':>7} {'board-steps/s':>15}")
+    print(f"{'game':>7} {game_rate():15,.0f}")
+    for count in BOARD_COUNTS:
+        print(f"{count:>7} {env_rate(count):15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
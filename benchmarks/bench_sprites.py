@@ -0,0 +1,69 @@
+"""Benchmark drawing Space Combat enemies from cached sprites.
+
+Compares issuing the ship's pygame.draw calls per enemy with one blits()
+call over cached sprites, on an off-screen 800x600 surface:
+    python -m benchmarks.bench_sprites
+"""
+
+import time
+
+import numpy as np
+import pygame
+
+from games.space_combat.constants import WINDOW_WIDTH, WINDOW_HEIGHT, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_SPEED
+from games.space_combat.entities import Enemy
+from games.space_combat.entity_store import EntityStore
+from games.space_combat.sprites import draw_enemy_ship, enemy_blits
+from shared.base_game import init_pygame
+
+ENEMY_COUNTS = [50, 500, 5000]
+FRAMES = 20
+
+
+def make_enemies(count, seed=0):
+    """Build an enemy store filled with random on-screen positions."""
+    rng = np.random.default_rng(seed)
+    enemies = EntityStore(Enemy, count)
+    enemies.spawn_many(
+        rng.integers(0, WINDOW_WIDTH - ENEMY_WIDTH, count),
+        rng.integers(0, WINDOW_HEIGHT - ENEMY_HEIGHT, count),
+        ENEMY_SPEED,
+        ENEMY_WIDTH,
+        ENEMY_HEIGHT,
+    )
+    return enemies
+
+
+def primitives_frame(surface, enemies):
+    """Draw every enemy with its individual pygame.draw calls."""
+    for x, y, w, h in zip(*(column.tolist() for column in enemies.boxes())):
+        draw_enemy_ship(surface, x, y, w, h)
+
+
+def sprites_frame(surface, enemies):
+    """Draw every enemy from its cached sprite in one blits() call."""
+    surface.blits(enemy_blits(enemies), doreturn=False)
+
+
+def time_frames(frame, surface, enemies):
+    """Return the mean frame time in milliseconds over FRAMES frames."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        frame(surface, enemies)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    init_pygame(headless=True)
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    print(f"{'enemies':>8} {'draw ms':>10} {'blits ms':>10}")
+    for count in ENEMY_COUNTS:
+        enemies = make_enemies(count)
+        draw_ms = time_frames(primitives_frame, surface, enemies)
+        blits_ms = time_frames(sprites_frame, surface, enemies)
+        print(f"{count:>8} {draw_ms:10.3f} {blits_ms:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
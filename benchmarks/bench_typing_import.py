@@ -0,0 +1,63 @@
+"""Benchmark importing the Typing Rain modules and measuring its font sizes.
+
+Each import runs in a fresh interpreter and reports its time, whether it
+pulled in pygame and whether it initialized any pygame subsystem. Then the
+first font_sizes() call is timed with an empty on-disk cache (measuring the
+font, as every import of games.typing.constants used to) and with the cache
+filled by that run. A temporary XDG_CACHE_HOME keeps the user's cache out
+of it:
+    python -m benchmarks.bench_typing_import
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODULES = ["games.typing", "games.typing.constants", "games.typing.word_index", "games.typing.layout"]
+REPEATS = 5
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+pygame = sys.modules.get("pygame")
+initialized = pygame is not None and (pygame.display.get_init() or pygame.font.get_init())
+print(elapsed, pygame is not None, bool(initialized))
+"""
+
+FONT_SIZES_PROBE = """
+import time
+from games.typing.constants import font_sizes
+import pygame.font
+start = time.perf_counter()
+font_sizes()
+print(time.perf_counter() - start)
+"""
+
+
+def probe(code, cache_home):
+    """Run code in a fresh interpreter and return its output fields."""
+    env = dict(os.environ, XDG_CACHE_HOME=cache_home, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return result.stdout.split()
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    with tempfile.TemporaryDirectory() as cache_home:
+        print(f"{'module':>24} {'import ms':>10} {'pygame':>7} {'init':>5}")
+        for module in MODULES:
+            runs = [probe(IMPORT_PROBE.format(module=module), cache_home) for _ in range(REPEATS)]
+            import_ms = statistics.median(float(run[0]) for run in runs) * 1000
+            print(f"{module:>24} {import_ms:10.2f} {runs[0][1]:>7} {runs[0][2]:>5}")
+
+        cold_ms = float(probe(FONT_SIZES_PROBE, cache_home)[0]) * 1000
+        warm_ms = statistics.median(float(probe(FONT_SIZES_PROBE, cache_home)[0]) for _ in range(REPEATS)) * 1000
+        print(f"first font_sizes(): {cold_ms:.2f} ms measuring, {warm_ms:.2f} ms from the disk cache")
+
+
+if __name__ == "__main__":
+    main()
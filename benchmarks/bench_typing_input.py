@@ -0,0 +1,78 @@
+"""Benchmark matching Typing Rain keystrokes to falling words.
+
+Keeps a fixed number of words on screen, replacing each one completed, and
+times random keystrokes resolved by the old linear scan over every word
+against the WordIndex buckets, in free and locked-target mode:
+    python -m benchmarks.bench_typing_input
+"""
+
+import random
+import string
+import time
+
+import pygame
+
+from games.typing.constants import LEVEL_WORDS
+from games.typing.entities import FallingWord
+from games.typing.word_index import WordIndex
+from shared.base_game import init_pygame
+
+WORD_COUNTS = [10, 100, 1000, 10000]
+KEYSTROKES = 20000
+VOCABULARY = sorted({word for words in LEVEL_WORDS.values() for word in words if len(word) > 1})
+
+
+class LinearMatcher:
+    """The matching TypingGame did before WordIndex: scan all words in spawn order."""
+
+    def __init__(self):
+        """Initialize with no words."""
+        self.words = []
+
+    def add(self, word):
+        """Add a spawned word."""
+        self.words.append(word)
+
+    def type_char(self, char):
+        """Give char to the first word expecting it. Returns that word or None."""
+        for word in self.words:
+            if not word.completed and word.type_char(char):
+                if word.completed:
+                    self.words.remove(word)
+                return word
+        return None
+
+
+def run(matcher, count, font, seed=0):
+    """Type KEYSTROKES random letters. Returns (microseconds per keystroke, words completed)."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        matcher.add(FallingWord(rng.choice(VOCABULARY), 0, 0, 1, font))
+    keys = [rng.choice(string.ascii_lowercase) for _ in range(KEYSTROKES)]
+    completed = 0
+    seconds = 0.0
+    for char in keys:
+        start = time.perf_counter()
+        word = matcher.type_char(char)
+        seconds += time.perf_counter() - start
+        if word is not None and word.completed:
+            completed += 1
+            matcher.add(FallingWord(rng.choice(VOCABULARY), 0, 0, 1, font))
+    return seconds * 1e6 / KEYSTROKES, completed
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    init_pygame(headless=True)
+    font = pygame.font.Font(None, 24)
+    print(f"{'words':>6} {'linear us':>10} {'index us':>9} {'locked us':>10} {'completed':>10}")
+    for count in WORD_COUNTS:
+        linear_us, linear_done = run(LinearMatcher(), count, font)
+        index_us, index_done = run(WordIndex(), count, font)
+        locked_us, _ = run(WordIndex(locked=True), count, font)
+        assert linear_done == index_done, "index and linear scan disagree"
+        print(f"{count:>6} {linear_us:10.2f} {index_us:9.2f} {locked_us:10.2f} {index_done:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark Typing Rain word measuring and spawn placement.
+
+Times FallingWord.get_rect as it was (rasterizing the word to read its size)
+against the cached Rect, and checking a spawn position against the words
+near the top by scanning them all against an IntervalSet query:
+    python -m benchmarks.bench_typing_layout
+"""
+
+import random
+import time
+
+import pygame
+
+from games.typing.constants import LEVEL_WORDS, WORD_COLOR, WORD_SPACING, font_sizes
+from games.typing.entities import FallingWord
+from games.typing.layout import IntervalSet
+from shared.base_game import init_pygame
+
+LANE_COUNTS = [10, 100, 1000, 10000]
+QUERIES = 20000
+WORDS = [word for words in LEVEL_WORDS.values() for word in words]
+
+
+def rendered_rect(word):
+    """Measure a word the way get_rect used to: by rendering it."""
+    surface = word.font.render(word.text, True, WORD_COLOR)
+    return pygame.Rect(word.x, word.y, surface.get_width(), surface.get_height())
+
+
+def time_calls(func, items):
+    """Return microseconds per func(item) call."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) * 1e6 / len(items)
+
+
+def make_lanes(count, width, seed=0):
+    """Build count disjoint 40-pixel lanes spread over a width-pixel line, as (start, end) pairs."""
+    rng = random.Random(seed)
+    starts = sorted(rng.sample(range(0, width, 50), count))
+    return [(start, start + 40) for start in starts]
+
+
+def main():
+    """Run the benchmark and print the results."""
+    init_pygame(headless=True)
+    font = pygame.font.Font(pygame.font.get_default_font(), font_sizes()["word"])
+    rng = random.Random(0)
+    words = [FallingWord(rng.choice(WORDS), 0, 0, 1, font) for _ in range(QUERIES)]
+    print(
+        f"get_rect: rendered {time_calls(rendered_rect, words):.2f} us, cached {time_calls(FallingWord.get_rect, words):.3f} us"
+    )
+
+    print(f"\n{'lanes':>6} {'scan us':>9} {'interval us':>12}")
+    for count in LANE_COUNTS:
+        width = 50 * count
+        lanes = make_lanes(count, width)
+        intervals = IntervalSet()
+        for start, end in lanes:
+            intervals.add(start, end)
+        queries = [(x - WORD_SPACING, x + 60 + WORD_SPACING) for x in (rng.randrange(width) for _ in range(QUERIES))]
+        scan_us = time_calls(lambda q: any(start < q[1] and q[0] < end for start, end in lanes), queries)
+        interval_us = time_calls(lambda q: intervals.overlaps(*q), queries)
+        print(f"{count:>6} {scan_us:9.2f} {interval_us:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
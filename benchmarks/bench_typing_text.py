@@ -0,0 +1,106 @@
+"""Benchmark drawing Typing Rain's falling words from glyph atlases.
+
+Compares rasterizing each word's typed and remaining parts with font.render
+every frame against composing them from glyph atlas blits, and measuring
+word widths by rendering against the atlas's cached widths. Words are drawn
+to an 800x600 display surface of SDL's dummy video driver, so the atlases
+are converted to the display format as in the game. First, every word is
+checked to draw the same pixels from the atlases as with font.render, at
+each point of being typed:
+    python -m benchmarks.bench_typing_text
+"""
+
+import random
+import time
+
+import pygame
+
+from games.typing.constants import LEVEL_WORDS, WORD_COLOR, TYPED_COLOR, font_sizes
+from games.typing.entities import FallingWord
+from games.typing.glyph_atlas import glyph_atlas
+from shared.base_game import init_pygame
+
+WORD_COUNTS = [20, 200, 1000]
+FRAMES = 100
+
+
+def make_words(font, count, seed=0):
+    """Build falling words at random positions with random typed prefixes."""
+    rng = random.Random(seed)
+    words = [word for level_words in LEVEL_WORDS.values() for word in level_words]
+    falling = []
+    for _ in range(count):
+        word = FallingWord(rng.choice(words), rng.randint(0, 700), rng.randint(0, 550), 1, font)
+        word.typed_chars = rng.randint(0, len(word.text) - 1)
+        falling.append(word)
+    return falling
+
+
+def render_frame(surface, words):
+    """Draw every word by rasterizing its two parts, as before the atlas."""
+    for word in words:
+        x = word.x
+        if word.typed_chars:
+            typed = word.font.render(word.get_typed_text(), True, TYPED_COLOR)
+            surface.blit(typed, (x, word.y))
+            x += typed.get_width()
+        surface.blit(word.font.render(word.get_remaining_text(), True, WORD_COLOR), (x, word.y))
+
+
+def atlas_frame(surface, words):
+    """Draw every word from the glyph atlases in one blits() call, as the game does."""
+    surface.blits([entry for word in words for entry in word.blits()], doreturn=False)
+
+
+def check_matches_render(font, surface):
+    """Assert every word draws the same pixels from the atlases as with font.render, however far typed."""
+    texts = dict.fromkeys(word for level_words in LEVEL_WORDS.values() for word in level_words)
+    for text in texts:
+        word = FallingWord(text, 0, 0, 1, font)
+        for typed in range(len(word.text)):
+            word.typed_chars = typed
+            frames = []
+            for draw in (render_frame, atlas_frame):
+                surface.fill((0, 0, 0))
+                draw(surface, [word])
+                frames.append(pygame.image.tobytes(surface, "RGB"))
+            assert frames[0] == frames[1], f"{text!r} typed {typed} is drawn differently from the atlas"
+    return len(texts)
+
+
+def time_frames(draw, surface, words):
+    """Return ms per frame of draw over FRAMES frames."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(surface, words)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def time_widths(measure, words):
+    """Return microseconds per word width."""
+    start = time.perf_counter()
+    for word in words:
+        measure(word.text)
+    return (time.perf_counter() - start) * 1e6 / len(words)
+
+
+def main():
+    """Run the benchmark and print a results table."""
+    init_pygame(headless=True)
+    surface = pygame.display.set_mode((800, 600))
+    font = pygame.font.Font(pygame.font.get_default_font(), font_sizes()["word"])
+    atlas = glyph_atlas(font, WORD_COLOR)
+    print(f"{check_matches_render(font, surface)} words draw as with font.render\n")
+
+    print(f"{'words':>6} {'render ms':>10} {'atlas ms':>9} {'render us/width':>16} {'atlas us/width':>15}")
+    for count in WORD_COUNTS:
+        words = make_words(font, count)
+        render_ms = time_frames(render_frame, surface, words)
+        atlas_ms = time_frames(atlas_frame, surface, words)
+        render_us = time_widths(lambda text: font.render(text, True, WORD_COLOR).get_width(), words)
+        atlas_us = time_widths(atlas.width, words)
+        print(f"{count:>6} {render_ms:10.3f} {atlas_ms:9.3f} {render_us:16.2f} {atlas_us:15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Frame-time regression suite for the four games.
+
+Each scenario drives a game through a scripted, seeded workload, one update
+and one drawn frame per loop, in a window of SDL's dummy video driver, and
+reports the FrameProfiler's frame-time percentiles and mean milliseconds per
+phase (input, update, draw, present). Save a run as a JSON baseline, then
+compare later runs against it; phases that got slower than the threshold are
+flagged and the command exits with status 1:
+    python -m benchmarks.frame_suite run --out baseline.json
+    python -m benchmarks.frame_suite compare baseline.json
+    python -m benchmarks.frame_suite compare baseline.json current.json --threshold 0.15
+
+Timings only compare meaningfully on the same machine and software versions,
+which the baseline records alongside them.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from games.pong.game import PongGame  # noqa: E402
+from games.pong.simulation import follow_policy  # noqa: E402
+from games.snake.entities import Direction, FreeCells, Snake  # noqa: E402
+from games.snake.game import SnakeGame  # noqa: E402
+from games.snake.simulation import DIRECTION_KEYS  # noqa: E402
+from games.space_combat.constants import ENEMY_COLOR, ENEMY_HEIGHT, ENEMY_SPEED, ENEMY_WIDTH  # noqa: E402
+from games.space_combat.constants import EXPLOSION_PARTICLES, MAX_PARTICLES  # noqa: E402
+from games.space_combat.game import SpaceCombatGame  # noqa: E402
+from games.space_combat.simulation import hunter_policy  # noqa: E402
+from games.typing.constants import MAX_LEVEL  # noqa: E402
+from games.typing.entities import FallingWord  # noqa: E402
+from games.typing.game import TypingGame  # noqa: E402
+from games.typing.simulation import FAST_INTERVAL, typist_policy  # noqa: E402
+from shared.batch import NO_KEYS, key_press  # noqa: E402
+
+FRAMES = 300
+WARMUP_FRAMES = 30
+DEFAULT_THRESHOLD = 0.10  # Relative slowdown flagged as a regression
+MIN_DELTA_MS = 0.05  # Slowdowns smaller than this are timer noise, whatever their ratio
+COMPARED = ("p50_ms", "p95_ms", "busy_ms", "input_ms", "update_ms", "draw_ms", "present_ms")
+
+SNAKE_LENGTH = 2000
+SNAKE_WINDOW = (1600, 1200)  # An 80x60 grid, room for the long snake
+PONG_TIME_SCALE = 10
+TYPING_WORDS = 200
+ENDLESS_HEALTH = 10**9  # Keeps the player alive so the load stays constant
+
+
+def cycle_next(cell, width, height):
+    """Get the cell after cell on a Hamiltonian cycle of a grid with an even height.
+
+    The cycle runs along the top row, zigzags down through columns 1 and up,
+    and returns up column 0, so a snake following it never hits itself.
+    """
+    x, y = cell
+    if y == 0:
+        return (x + 1, 0) if x < width - 1 else (x, 1)
+    if x == 0:
+        return (0, y - 1)
+    if y % 2:
+        if x > 1:
+            return (x - 1, y)
+        return (x, y + 1) if y < height - 1 else (0, y)
+    return (x + 1, y) if x < width - 1 else (x, y + 1)
+
+
+def direction_between(start, end):
+    """Get the Direction moving from one cell to the next."""
+    for direction in Direction:
+        if direction.value == (end[0] - start[0], end[1] - start[1]):
+            return direction
+    raise ValueError(f"{start} and {end} are not neighbors")
+
+
+def snake_long(seed):
+    """Snake with a 2,000-segment body following a collision-free cycle."""
+    game = SnakeGame(seed=seed)
+    pygame.display.set_mode(SNAKE_WINDOW, pygame.RESIZABLE)
+    game.handle_resize(*SNAKE_WINDOW)
+    width, height = SNAKE_WINDOW[0] // 20, SNAKE_WINDOW[1] // 20
+
+    # Lay the body out along the cycle, tail at (0, 0)
+    free_cells = FreeCells(width, height)
+    snake = Snake(0, 0, free_cells)
+    for _ in range(SNAKE_LENGTH - 1):
+        head = snake.get_head()
+        snake.next_direction = direction_between(head, cycle_next(head, width, height))
+        snake.move()
+    snake.direction = snake.next_direction
+    game.free_cells = free_cells
+    game.snake = snake
+    game.prev_head = snake.get_head()
+    game.prev_tail = snake.body[-1]
+    game.food.regenerate(free_cells)
+    game.request_full_redraw()
+
+    def act(game):
+        head = game.snake.get_head()
+        direction = direction_between(head, cycle_next(head, width, height))
+        if direction == game.snake.direction:
+            return NO_KEYS, ()
+        return NO_KEYS, (key_press(DIRECTION_KEYS[direction]),)
+
+    return game, act
+
+
+def space_combat_crowd(count):
+    """Build a Space Combat scenario kept topped up to count enemies."""
+
+    def scenario(seed):
+        game = SpaceCombatGame(seed=seed)
+        game.start_match(1)
+        game.player1.health = game.player1.max_health = ENDLESS_HEALTH
+        rng = random.Random(seed)
+        hunt = hunter_policy(rng)
+        max_x = game.window_width - ENEMY_WIDTH
+
+        def act(game):
+            missing = count - len(game.enemies)
+            if missing > 0:
+                # Spread the newcomers over the window's height above the top, so they arrive steadily
+                xs = [rng.randint(0, max_x) for _ in range(missing)]
+                ys = [-ENEMY_HEIGHT - rng.random() * game.window_height for _ in range(missing)]
+                game.enemies.spawn_many(xs, ys, ENEMY_SPEED, ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_COLOR)
+            return hunt(game)
+
+        return game, act
+
+    return scenario
+
+
+def space_combat_particles(seed):
+    """Space Combat with its particle pool kept at the 100k budget by explosions all over the window."""
+    game = SpaceCombatGame(seed=seed)
+    game.start_match(1)
+    game.player1.health = game.player1.max_health = ENDLESS_HEALTH
+    rng = random.Random(seed)
+    hunt = hunter_policy(rng)
+
+    def act(game):
+        centers = -(-(MAX_PARTICLES - len(game.particles)) // EXPLOSION_PARTICLES)
+        xs = [rng.uniform(0, game.window_width) for _ in range(centers)]
+        ys = [rng.uniform(0, game.window_height) for _ in range(centers)]
+        game.particles.burst(xs, ys)
+        return hunt(game)
+
+    return game, act
+
+
+def pong_fast(seed):
+    """Pong fast-forwarded 10x, the left paddle following the ball; matches restart."""
+    game = PongGame(seed=seed)
+    game.time_scale = PONG_TIME_SCALE
+    game.start_match()
+    follow = follow_policy(random.Random(seed))
+
+    def act(game):
+        if game.is_game_over():
+            game.start_match()
+        return follow(game)
+
+    return game, act
+
+
+def typing_crowd(seed):
+    """Typing Rain at level 10 with 200 words on screen, typed at 10 characters a second."""
+    game = TypingGame(seed=seed)
+    game.game_state.level = MAX_LEVEL
+    game.game_state.lives = ENDLESS_HEALTH
+    rng = random.Random(seed)
+    words = game.game_state.get_word_list()
+    type_chars = typist_policy(FAST_INTERVAL)(rng)
+
+    def act(game):
+        # Replace completed and fallen words anywhere on screen, keeping the count steady
+        for _ in range(TYPING_WORDS - len(game.falling_words)):
+            word = FallingWord(
+                rng.choice(words),
+                rng.randint(0, game.window_width - 100),
+                rng.randint(0, game.window_height - 50),
+                game.game_state.get_fall_speed(),
+                game.word_font,
+            )
+            game.falling_words.append(word)
+            game.word_index.add(word)
+        return type_chars(game)
+
+    return game, act
+
+
+SCENARIOS = {
+    "snake_2000_segments": snake_long,
+    "space_combat_1k_enemies": space_combat_crowd(1000),
+    "space_combat_10k_enemies": space_combat_crowd(10000),
+    "space_combat_100k_particles": space_combat_particles,
+    "pong_10x_speed": pong_fast,
+    "typing_level10_200_words": typing_crowd,
+}
+
+
+def run_scenario(build, frames=FRAMES, seed=0):
+    """Play a scenario and return its FrameProfiler summary."""
+    game, act = build(seed)
+    game.run_scripted(act, WARMUP_FRAMES, render=True, stop_on_game_over=False)
+    profiler = game.enable_profiler(history=frames)
+    game.run_scripted(act, frames, render=True, stop_on_game_over=False)
+    profiler.close()
+    return profiler.summary()
+
+
+def run_suite(names=None, frames=FRAMES):
+    """Run scenarios (default: all) and return the results document."""
+    results = {}
+    for name in names or SCENARIOS:
+        results[name] = run_scenario(SCENARIOS[name], frames)
+        stats = results[name]
+        print(
+            f"{name:>27} p50 {stats['p50_ms']:7.3f}  p95 {stats['p95_ms']:7.3f}  "
+            + "  ".join(f"{phase[:-3]} {stats[phase]:7.3f}" for phase in COMPARED[3:])
+            + "  ms",
+            flush=True,
+        )
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "frames": frames,
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Find metrics that got slower than threshold between two results documents.
+
+    Returns:
+        List of (scenario, metric, baseline ms, current ms) regressions
+    """
+    regressions = []
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric in COMPARED:
+            before, after = base[metric], stats[metric]
+            if after - before > MIN_DELTA_MS and after > before * (1 + threshold):
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def main(argv=None):
+    """Run the suite or compare against a baseline, from the command line."""
+    parser = argparse.ArgumentParser(description="Frame-time regression suite for the games.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the suite and optionally save the results")
+    run.add_argument("--out", help="save the results to this JSON file")
+    check = commands.add_parser("compare", help="flag slowdowns against a baseline")
+    check.add_argument("baseline", help="baseline JSON file")
+    check.add_argument("current", nargs="?", help="results JSON to check (default: run the suite now)")
+    check.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown flagged")
+    for command in (run, check):
+        command.add_argument("--only", action="append", choices=sorted(SCENARIOS), help="run just these scenarios")
+        command.add_argument("--frames", type=int, default=FRAMES, help="measured frames per scenario")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run_suite(args.only, args.frames)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(document, f, indent=2)
+            print(f"Saved to {args.out}")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.only, args.frames)
+    if current["machine"] != baseline["machine"]:
+        print("Warning: the baseline was recorded on a different machine or software versions")
+
+    regressions = compare(baseline, current, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name} {metric}: {before:.3f} -> {after:.3f} ms ({after / before - 1:+.0%})")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,13 @@ PADDLE_HEIGHT = 90
 PADDLE_SPEED = 5
 PADDLE_MARGIN = 20  # Distance from screen edge
 
+# AI settings
+AI_FOLLOW = "follow"  # Chase the ball's current y
+AI_PREDICT = "predict"  # Move to where the ball will cross the paddle
+AI_MODE = AI_FOLLOW  # Set to AI_PREDICT for the predicting AI, tuned by the two settings below
+AI_REACTION_DELAY = 8  # Updates the predicting AI waits before reacting to a new ball trajectory
+AI_ERROR = 30  # Max pixels the predicting AI's target is off by
+
 # Ball settings
 BALL_SIZE = 15
 BALL_SPEED_X = 4
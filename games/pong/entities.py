@@ -11,21 +11,44 @@ from .constants import (
     BALL_SIZE,
     BALL_SPEED_X,
     BALL_SPEED_Y,
+    AI_FOLLOW,
+    AI_PREDICT,
 )
 from . import constants as _c
+from .physics import MAX_BOUNCES_PER_STEP, swept_aabb, wall_time
+from .trajectory import bounce_speed_x, bounce_speed_y, plane_y
 
 
 class Paddle:
     """Paddle class for both player and AI."""
 
-    def __init__(self, x, y, is_ai=False):
-        """Initialize paddle at given position."""
+    def __init__(self, x, y, is_ai=False, ai_mode=AI_FOLLOW, reaction_delay=0, aim_error=0, rng=random):
+        """Initialize paddle at given position.
+
+        Args:
+            x, y: Top-left position
+            is_ai: Whether ai_update moves this paddle
+            ai_mode: AI_FOLLOW to chase the ball, AI_PREDICT to move to its predicted crossing
+            reaction_delay: Updates the predicting AI waits before reacting to a new trajectory
+            aim_error: Max pixels, either way, the predicting AI's target is off by
+            rng: random.Random (or the random module) the aim error is drawn from
+        """
+        self.rng = rng
         self.x = x
         self.y = y
         self.width = PADDLE_WIDTH
         self.height = PADDLE_HEIGHT
         self.speed = PADDLE_SPEED
         self.is_ai = is_ai
+        self.ai_mode = ai_mode
+        self.reaction_delay = reaction_delay
+        self.aim_error = aim_error
+        self.target_y = None  # Center y the predicting AI is heading for
+        self.predictions = 0
+        self._trajectory = None
+        self._react_in = None
+        self._approach = None
+        self._aim_offset = 0
 
     def move_up(self):
         """Move paddle up."""
@@ -43,51 +66,154 @@ class Paddle:
         """Get the center Y position of the paddle."""
         return self.y + self.height // 2
 
-    def ai_update(self, ball):
-        """Simple AI movement - follows the ball."""
+    def ai_update(self, ball, opponent=None):
+        """AI movement: follow the ball, or move to its predicted crossing.
+
+        Args:
+            ball: The ball
+            opponent: The other paddle; lets the predicting AI anticipate returns
+        """
         if not self.is_ai:
             return
 
+        if self.ai_mode == AI_PREDICT:
+            self._update_prediction(ball, opponent)
+            if self.target_y is None:
+                return
+            target_y = self.target_y
+        else:
+            target_y = ball.y + ball.size // 2
+
         paddle_center = self.get_center_y()
-        ball_center_y = ball.y + ball.size // 2
 
         # Add some delay/imperfection to make AI beatable
-        if abs(paddle_center - ball_center_y) > 5:
-            if paddle_center < ball_center_y:
+        if abs(paddle_center - target_y) > 5:
+            if paddle_center < target_y:
                 self.move_down()
-            elif paddle_center > ball_center_y:
+            elif paddle_center > target_y:
                 self.move_up()
 
+    def _update_prediction(self, ball, opponent):
+        """Re-aim reaction_delay updates after the ball's trajectory changes."""
+        trajectory = (ball.serves, ball.speed_x, ball.speed_y)
+        if trajectory != self._trajectory:
+            self._trajectory = trajectory
+            self._react_in = self.reaction_delay
+        if self._react_in is None:
+            return
+        if self._react_in > 0:
+            self._react_in -= 1
+            return
+        self._react_in = None
+        # Misjudge each approach by one fixed amount, so wall bounces don't re-roll it
+        approach = (ball.serves, ball.speed_x > 0)
+        if approach != self._approach:
+            self._approach = approach
+            self._aim_offset = self.rng.uniform(-self.aim_error, self.aim_error) if self.aim_error else 0
+        self.target_y = self.predict_target_y(ball, opponent) + self._aim_offset
+        self.predictions += 1
+
+    def contact_x(self, ball):
+        """Get the ball's x at the moment it touches this paddle's inner face."""
+        if self.x > _c.WINDOW_WIDTH // 2:
+            return self.x - ball.size
+        return self.x + self.width
+
+    def predict_target_y(self, ball, opponent=None):
+        """Predict the ball's center y when it next reaches this paddle.
+
+        A ball heading away is followed to the opponent, bounced with the
+        Ball.bounce_off_paddle rules as if the opponent stays put, and
+        followed back. Without an opponent the AI waits at mid-screen.
+        """
+        top = 0
+        bottom = _c.WINDOW_HEIGHT - ball.size
+        contact_x = self.contact_x(ball)
+        if (contact_x - ball.x) * ball.speed_x > 0:
+            y = plane_y(ball.x, ball.y, ball.speed_x, ball.speed_y, contact_x, top, bottom)
+        elif opponent is not None:
+            return_x = opponent.contact_x(ball)
+            return_y = plane_y(ball.x, ball.y, ball.speed_x, ball.speed_y, return_x, top, bottom)
+            speed_x = bounce_speed_x(ball.speed_x)
+            speed_y = bounce_speed_y(return_y, ball.size, opponent.get_center_y(), opponent.height)
+            y = plane_y(return_x, return_y, speed_x, speed_y, contact_x, top, bottom)
+        else:
+            return _c.WINDOW_HEIGHT / 2
+        return float(y) + ball.size // 2
+
 
 class Ball:
     """Ball class for the pong ball."""
 
-    def __init__(self, x, y):
-        """Initialize ball at given position."""
+    def __init__(self, x, y, rng=random):
+        """Initialize ball at given position.
+
+        Args:
+            x, y: Top-left position
+            rng: random.Random (or the random module) serve directions are drawn from
+        """
+        self.rng = rng
         self.x = x
         self.y = y
         self.size = BALL_SIZE
         self.speed_x = BALL_SPEED_X
         self.speed_y = BALL_SPEED_Y
+        self.serves = 0  # Counts reset_ball() calls, so AIs notice a new serve
         self.reset_ball()
 
     def reset_ball(self):
         """Reset ball to center with random direction."""
         self.x = _c.WINDOW_WIDTH // 2 - self.size // 2
         self.y = _c.WINDOW_HEIGHT // 2 - self.size // 2
+        self.serves += 1
 
         # Random direction
-        self.speed_x = BALL_SPEED_X if random.choice([True, False]) else -BALL_SPEED_X
-        self.speed_y = BALL_SPEED_Y if random.choice([True, False]) else -BALL_SPEED_Y
-
-    def update(self):
-        """Update ball position."""
-        self.x += self.speed_x
-        self.y += self.speed_y
-
-        # Bounce off top and bottom walls
-        if self.y <= 0 or self.y >= _c.WINDOW_HEIGHT - self.size:
-            self.speed_y = -self.speed_y
+        self.speed_x = BALL_SPEED_X if self.rng.choice([True, False]) else -BALL_SPEED_X
+        self.speed_y = BALL_SPEED_Y if self.rng.choice([True, False]) else -BALL_SPEED_Y
+
+    def update(self, dt=1.0, paddles=()):
+        """Move the ball dt frames along its velocity, bouncing off walls and paddles.
+
+        Collisions are swept: the earliest wall or paddle contact within the
+        move is found, the ball is placed exactly there and bounced, and the
+        rest of the move continues from that point. Large dt and high speeds
+        therefore neither tunnel through paddles nor sink into walls.
+
+        Args:
+            dt: Frames of motion to simulate
+            paddles: Paddles to bounce off (only when heading toward them)
+        """
+        remaining = dt
+        for _ in range(MAX_BOUNCES_PER_STEP):
+            dx = self.speed_x * remaining
+            dy = self.speed_y * remaining
+            hit_time = 1.0
+            hit = None
+
+            time = wall_time(self.y, self.size, dy, 0, _c.WINDOW_HEIGHT)
+            if time is not None:
+                hit_time = time
+                hit = "wall"
+
+            for paddle in paddles:
+                if (self.speed_x > 0) != (paddle.x > _c.WINDOW_WIDTH // 2):
+                    continue  # Heading away from this paddle's side
+                contact = swept_aabb(
+                    self.x, self.y, self.size, self.size, dx, dy, paddle.x, paddle.y, paddle.width, paddle.height
+                )
+                if contact is not None and contact[0] < hit_time:
+                    hit_time = contact[0]
+                    hit = paddle
+
+            self.x += dx * hit_time
+            self.y += dy * hit_time
+            remaining *= 1.0 - hit_time
+            if hit is None:
+                return
+            if hit == "wall":
+                self.speed_y = -self.speed_y
+            else:
+                self.bounce_off_paddle(hit)
 
     def get_rect(self):
         """Get pygame rect for collision detection."""
@@ -98,13 +224,8 @@ class Ball:
         # Reverse horizontal direction
         self.speed_x = -self.speed_x
 
-        # Add angle variation based on where ball hits paddle
-        paddle_center = paddle.get_center_y()
-        ball_center = self.y + self.size // 2
-        hit_pos = (ball_center - paddle_center) / (paddle.height // 2)
-
-        # Modify vertical speed based on hit position (-1 to 1)
-        self.speed_y = hit_pos * 3
+        # Modify vertical speed based on where the ball hits the paddle (-1 to 1)
+        self.speed_y = bounce_speed_y(self.y, self.size, paddle.get_center_y(), paddle.height)
 
         # Ensure minimum horizontal speed
         if abs(self.speed_x) < 2:
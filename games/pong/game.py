@@ -2,12 +2,16 @@
 
 import pygame
 from shared.base_game import BaseGame
+from shared.utils import render_text
 from .constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     FPS,
     WINNING_SCORE,
     PADDLE_MARGIN,
+    AI_MODE,
+    AI_REACTION_DELAY,
+    AI_ERROR,
     BACKGROUND_COLOR,
     PADDLE_COLOR,
     BALL_COLOR,
@@ -24,9 +28,23 @@ from .entities import Paddle, Ball
 class PongGame(BaseGame):
     """Main Pong game class."""
 
-    def __init__(self):
-        """Initialize the Pong game."""
-        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Pong")
+    fps = FPS
+    update_rate = FPS
+    # Frames simulated per update(); headless runs can raise it to fast-forward.
+    # Each frame still moves the paddles before the ball, as at 1x
+    time_scale = 1
+    dirty_rendering = True
+
+    def __init__(self, headless=False, seed=None, ai_mode=None):
+        """Initialize the Pong game.
+
+        Args:
+            headless: Run without a window; frames are only drawn on request
+            seed: Seed for the game's RNG stream (None = pick one at random)
+            ai_mode: Single-player AI, AI_FOLLOW or AI_PREDICT (None = AI_MODE)
+        """
+        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Pong", headless=headless, seed=seed)
+        self.ai_mode = AI_MODE if ai_mode is None else ai_mode
         self.score_font = pygame.font.Font(None, SCORE_FONT_SIZE)
         self.menu_font = pygame.font.Font(None, MENU_FONT_SIZE)
         self.instruction_font = pygame.font.Font(None, INSTRUCTION_FONT_SIZE)
@@ -34,8 +52,12 @@ class PongGame(BaseGame):
         # Game modes
         self.game_state = "menu"  # "menu", "playing", "game_over"
         self.two_player_mode = False
+        self.held_keys = None  # key state from the last input poll
+        self.drawn_state = None  # (game_state, paused, two_player_mode) the last frame showed
 
         self.reset_game()
+        # The hub plays every game in one process: put back the layout constants an earlier game resized
+        self.handle_resize(self.window_width, self.window_height)
 
     def handle_resize(self, w, h):
         """Handle window resize, updating pong constants and right paddle position."""
@@ -45,6 +67,10 @@ class PongGame(BaseGame):
         if hasattr(self, "right_paddle"):
             self.right_paddle.x = w - PADDLE_MARGIN - 15
 
+    def entity_count(self):
+        """Get the number of paddles plus the ball."""
+        return 3
+
     def reset_game(self):
         """Reset the game to initial state."""
         WINDOW_WIDTH = self.window_width
@@ -54,12 +80,21 @@ class PongGame(BaseGame):
         right_paddle_x = WINDOW_WIDTH - PADDLE_MARGIN - 15  # 15 is paddle width
         paddle_y = WINDOW_HEIGHT // 2 - 45  # 45 is half paddle height
 
-        self.left_paddle = Paddle(left_paddle_x, paddle_y, is_ai=False)
+        self.left_paddle = Paddle(left_paddle_x, paddle_y, is_ai=False, rng=self.rng)
         # Right paddle is AI only in single player mode
-        self.right_paddle = Paddle(right_paddle_x, paddle_y, is_ai=not self.two_player_mode)
+        self.right_paddle = Paddle(
+            right_paddle_x,
+            paddle_y,
+            is_ai=not self.two_player_mode,
+            ai_mode=self.ai_mode,
+            reaction_delay=AI_REACTION_DELAY,
+            aim_error=AI_ERROR,
+            rng=self.rng,
+        )
 
         # Initialize ball
-        self.ball = Ball(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+        self.ball = Ball(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, rng=self.rng)
+        self.ball_prev_pos = (self.ball.x, self.ball.y)
 
         # Game state
         self.left_score = 0
@@ -67,12 +102,25 @@ class PongGame(BaseGame):
         self.game_over = False
         self.winner = None
         self.paused = False
+        self.drawn_rects = None
+        self.drawn_scores = None
+        self.request_full_redraw()
+
+    def start_match(self, two_player_mode=False):
+        """Leave the menu and start a fresh match."""
+        self.two_player_mode = two_player_mode
+        self.game_state = "playing"
+        self.reset_game()
+
+    def is_game_over(self):
+        """Check if the match has been won."""
+        return self.game_state == "game_over"
 
     def handle_input(self):
-        """Handle input events."""
-        keys = pygame.key.get_pressed()
+        """Handle input events. Held keys are applied per update in update()."""
+        self.held_keys = self.key_state()
 
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return False
 
@@ -82,13 +130,9 @@ class PongGame(BaseGame):
             if event.type == pygame.KEYDOWN:
                 if self.game_state == "menu":
                     if event.key == pygame.K_1:
-                        self.two_player_mode = False
-                        self.game_state = "playing"
-                        self.reset_game()
+                        self.start_match(two_player_mode=False)
                     elif event.key == pygame.K_2:
-                        self.two_player_mode = True
-                        self.game_state = "playing"
-                        self.reset_game()
+                        self.start_match(two_player_mode=True)
                     elif event.key == pygame.K_ESCAPE:
                         return False
 
@@ -104,50 +148,60 @@ class PongGame(BaseGame):
                     elif event.key == pygame.K_p:
                         self.paused = not self.paused
 
-        # Handle continuous input during gameplay
-        if self.game_state == "playing" and not self.paused:
-            # Left paddle controls (W/S)
-            if keys[pygame.K_w]:
-                self.left_paddle.move_up()
-            if keys[pygame.K_s]:
-                self.left_paddle.move_down()
-
-            # Right paddle controls (Up/Down arrows) - only in two-player mode
-            if self.two_player_mode:
-                if keys[pygame.K_UP]:
-                    self.right_paddle.move_up()
-                if keys[pygame.K_DOWN]:
-                    self.right_paddle.move_down()
-
         return True
 
+    def apply_held_keys(self):
+        """Move paddles for keys held during the last input poll."""
+        keys = self.held_keys
+        if keys is None:
+            return
+
+        # Left paddle controls (W/S)
+        if keys[pygame.K_w]:
+            self.left_paddle.move_up()
+        if keys[pygame.K_s]:
+            self.left_paddle.move_down()
+
+        # Right paddle controls (Up/Down arrows) - only in two-player mode
+        if self.two_player_mode:
+            if keys[pygame.K_UP]:
+                self.right_paddle.move_up()
+            if keys[pygame.K_DOWN]:
+                self.right_paddle.move_down()
+
     def update(self):
-        """Update game state."""
+        """Update game state, simulating time_scale frames."""
         if self.game_state != "playing" or self.paused:
             return
 
-        # Update AI paddle only in single-player mode
-        if not self.two_player_mode:
-            self.right_paddle.ai_update(self.ball)
+        self.ball_prev_pos = (self.ball.x, self.ball.y)
+        for _ in range(self.time_scale):
+            self.step_frame()
+            if self.game_state != "playing":
+                break
 
-        # Update ball
-        self.ball.update()
+    def step_frame(self):
+        """Simulate one frame: move the paddles, then the ball against where they now are."""
+        # Handle continuous input during gameplay
+        self.apply_held_keys()
 
-        # Check paddle collisions
-        if self.ball.get_rect().colliderect(self.left_paddle.get_rect()) and self.ball.speed_x < 0:
-            self.ball.bounce_off_paddle(self.left_paddle)
+        # Update AI paddle only in single-player mode
+        if not self.two_player_mode:
+            self.right_paddle.ai_update(self.ball, self.left_paddle)
 
-        if self.ball.get_rect().colliderect(self.right_paddle.get_rect()) and self.ball.speed_x > 0:
-            self.ball.bounce_off_paddle(self.right_paddle)
+        # Update ball, bouncing off walls and paddles at their exact time of impact
+        self.ball.update(1, (self.left_paddle, self.right_paddle))
 
-        # Check scoring
+        # Check scoring (a served ball jumps to the center, so don't interpolate it)
         if self.ball.is_out_of_bounds_left():
             self.right_score += 1
             self.ball.reset_ball()
+            self.ball_prev_pos = (self.ball.x, self.ball.y)
 
         if self.ball.is_out_of_bounds_right():
             self.left_score += 1
             self.ball.reset_ball()
+            self.ball_prev_pos = (self.ball.x, self.ball.y)
 
         # Check win condition
         if self.left_score >= WINNING_SCORE:
@@ -171,89 +225,159 @@ class PongGame(BaseGame):
             pygame.draw.rect(self.screen, NET_COLOR, (net_x, y, net_width, net_height))
             y += net_height + net_gap
 
-    def draw(self):
-        """Draw the game."""
+    def frame_rects(self, alpha):
+        """Get the screen rects of everything that moves or changes during play.
+
+        Returns:
+            Dict of "left_paddle", "right_paddle", "ball" (interpolated by
+            alpha between updates), "left_score" and "right_score" rects
+        """
+        WINDOW_WIDTH = self.window_width
+        prev_x, prev_y = self.ball_prev_pos
+        ball_x = prev_x + (self.ball.x - prev_x) * alpha
+        ball_y = prev_y + (self.ball.y - prev_y) * alpha
+
+        # Position scores
+        left_score_rect = render_text(self.score_font, str(self.left_score), True, TEXT_COLOR).get_rect()
+        right_score_rect = render_text(self.score_font, str(self.right_score), True, TEXT_COLOR).get_rect()
+        left_score_rect.centerx = WINDOW_WIDTH // 4
+        left_score_rect.y = 50
+        right_score_rect.centerx = 3 * WINDOW_WIDTH // 4
+        right_score_rect.y = 50
+
+        return {
+            "left_paddle": self.left_paddle.get_rect(),
+            "right_paddle": self.right_paddle.get_rect(),
+            "ball": pygame.Rect(ball_x, ball_y, self.ball.size, self.ball.size),
+            "left_score": left_score_rect,
+            "right_score": right_score_rect,
+        }
+
+    def changed_regions(self, rects):
+        """Get the regions that differ from the last frame drawn.
+
+        Args:
+            rects: This frame's frame_rects()
+        """
+        drawn = self.drawn_rects
+        # A new score can render to a same-sized rect
+        scores_changed = (self.left_score, self.right_score) != self.drawn_scores
+        return [
+            rect.union(drawn[name])
+            for name, rect in rects.items()
+            if rect != drawn[name] or (scores_changed and name.endswith("_score"))
+        ]
+
+    def paint(self, clip, rects):
+        """Draw the playing field where it overlaps clip.
+
+        Args:
+            clip: Screen rect to draw (drawing outside it may be clipped away)
+            rects: This frame's frame_rects()
+        """
+        WINDOW_WIDTH = self.window_width
+        WINDOW_HEIGHT = self.window_height
+        self.screen.fill(BACKGROUND_COLOR, clip)
+
+        # Draw net
+        self.draw_net()
+
+        # Draw paddles
+        pygame.draw.rect(self.screen, PADDLE_COLOR, rects["left_paddle"])
+        pygame.draw.rect(self.screen, PADDLE_COLOR, rects["right_paddle"])
+
+        # Draw ball
+        pygame.draw.rect(self.screen, BALL_COLOR, rects["ball"])
+
+        # Draw scores
+        left_score_text = render_text(self.score_font, str(self.left_score), True, TEXT_COLOR)
+        right_score_text = render_text(self.score_font, str(self.right_score), True, TEXT_COLOR)
+        self.screen.blit(left_score_text, rects["left_score"])
+        self.screen.blit(right_score_text, rects["right_score"])
+
+        # Draw controls based on mode
+        if self.two_player_mode:
+            controls_text = render_text(
+                self.instruction_font, "P1: W/S, P2: ↑/↓, P: Pause, ESC: Menu", True, TEXT_COLOR
+            )
+        else:
+            controls_text = render_text(
+                self.instruction_font, "W/S: Move Paddle, P: Pause, ESC: Menu", True, TEXT_COLOR
+            )
+
+        controls_rect = controls_text.get_rect()
+        controls_rect.centerx = WINDOW_WIDTH // 2
+        controls_rect.y = WINDOW_HEIGHT - 30
+        self.screen.blit(controls_text, controls_rect)
+
+        # Draw pause message if paused
+        if self.paused:
+            pause_text = render_text(self.menu_font, "PAUSED", True, TEXT_COLOR)
+            pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+            self.screen.blit(pause_text, pause_rect)
+
+    def draw(self, alpha=1.0):
+        """Draw the game, interpolating the ball by alpha between updates.
+
+        During play only the paddles, ball and scores that changed since the
+        last frame are repainted, unless the screen changed wholesale.
+        """
         WINDOW_WIDTH = self.window_width
         WINDOW_HEIGHT = self.window_height
-        # Clear screen
-        self.screen.fill(BACKGROUND_COLOR)
+        screen_state = (self.game_state, self.paused, self.two_player_mode)
+        if screen_state != self.drawn_state:
+            self.request_full_redraw()
+            self.drawn_state = screen_state
+        full = self.begin_draw()
+
+        if self.game_state == "playing":
+            rects = self.frame_rects(alpha)
+            if full:
+                self.paint(self.screen.get_rect(), rects)
+            else:
+                self.redraw_regions(self.changed_regions(rects), lambda clip: self.paint(clip, rects))
+            self.drawn_rects = rects
+            self.drawn_scores = (self.left_score, self.right_score)
+
+        # The menu and game over screens are static: drawn once, then left as is
+        elif full and self.game_state == "menu":
+            self.screen.fill(BACKGROUND_COLOR)
 
-        if self.game_state == "menu":
             # Draw menu screen
-            title_text = self.menu_font.render("PONG", True, TEXT_COLOR)
+            title_text = render_text(self.menu_font, "PONG", True, TEXT_COLOR)
             title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
             self.screen.blit(title_text, title_rect)
 
-            select_text = self.instruction_font.render("Select Number of Players:", True, TEXT_COLOR)
+            select_text = render_text(self.instruction_font, "Select Number of Players:", True, TEXT_COLOR)
             select_rect = select_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(select_text, select_rect)
 
-            player1_text = self.instruction_font.render("Press 1 for Single Player (vs AI)", True, TEXT_COLOR)
+            player1_text = render_text(self.instruction_font, "Press 1 for Single Player (vs AI)", True, TEXT_COLOR)
             player1_rect = player1_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             self.screen.blit(player1_text, player1_rect)
 
-            player2_text = self.instruction_font.render("Press 2 for Two Players", True, TEXT_COLOR)
+            player2_text = render_text(self.instruction_font, "Press 2 for Two Players", True, TEXT_COLOR)
             player2_rect = player2_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
             self.screen.blit(player2_text, player2_rect)
 
-            quit_text = self.instruction_font.render("Press ESC to Quit", True, TEXT_COLOR)
+            quit_text = render_text(self.instruction_font, "Press ESC to Quit", True, TEXT_COLOR)
             quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
             self.screen.blit(quit_text, quit_rect)
 
-        elif self.game_state == "playing":
-            # Draw net
-            self.draw_net()
-
-            # Draw paddles
-            pygame.draw.rect(self.screen, PADDLE_COLOR, self.left_paddle.get_rect())
-            pygame.draw.rect(self.screen, PADDLE_COLOR, self.right_paddle.get_rect())
-
-            # Draw ball
-            pygame.draw.rect(self.screen, BALL_COLOR, self.ball.get_rect())
+        elif full and self.game_state == "game_over":
+            self.screen.fill(BACKGROUND_COLOR)
 
-            # Draw scores
-            left_score_text = self.score_font.render(str(self.left_score), True, TEXT_COLOR)
-            right_score_text = self.score_font.render(str(self.right_score), True, TEXT_COLOR)
-
-            # Position scores
-            left_score_rect = left_score_text.get_rect()
-            right_score_rect = right_score_text.get_rect()
-
-            left_score_rect.centerx = WINDOW_WIDTH // 4
-            left_score_rect.y = 50
-            right_score_rect.centerx = 3 * WINDOW_WIDTH // 4
-            right_score_rect.y = 50
-
-            self.screen.blit(left_score_text, left_score_rect)
-            self.screen.blit(right_score_text, right_score_rect)
-
-            # Draw controls based on mode
-            if self.two_player_mode:
-                controls_text = self.instruction_font.render("P1: W/S, P2: ↑/↓, P: Pause, ESC: Menu", True, TEXT_COLOR)
-            else:
-                controls_text = self.instruction_font.render("W/S: Move Paddle, P: Pause, ESC: Menu", True, TEXT_COLOR)
-
-            controls_rect = controls_text.get_rect()
-            controls_rect.centerx = WINDOW_WIDTH // 2
-            controls_rect.y = WINDOW_HEIGHT - 30
-            self.screen.blit(controls_text, controls_rect)
-
-            # Draw pause message if paused
-            if self.paused:
-                pause_text = self.menu_font.render("PAUSED", True, TEXT_COLOR)
-                pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-                self.screen.blit(pause_text, pause_rect)
-
-        elif self.game_state == "game_over":
             # Draw net
             self.draw_net()
 
             # Game over screen
-            winner_text = self.menu_font.render(f"{self.winner} Wins!", True, TEXT_COLOR)
-            score_text = self.instruction_font.render(
-                f"Final Score: {self.left_score} - {self.right_score}", True, TEXT_COLOR
+            winner_text = render_text(self.menu_font, f"{self.winner} Wins!", True, TEXT_COLOR)
+            score_text = render_text(
+                self.instruction_font, f"Final Score: {self.left_score} - {self.right_score}", True, TEXT_COLOR
+            )
+            restart_text = render_text(
+                self.instruction_font, "Press SPACE to return to menu, ESC to quit", True, TEXT_COLOR
             )
-            restart_text = self.instruction_font.render("Press SPACE to return to menu, ESC to quit", True, TEXT_COLOR)
 
             # Center the text
             winner_rect = winner_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
@@ -265,14 +389,3 @@ class PongGame(BaseGame):
             self.screen.blit(restart_text, restart_rect)
 
         self.present()
-
-    def run(self):
-        """Main game loop with custom timing."""
-        while self.running:
-            self.running = self.handle_input()
-            if self.running:
-                self.update()
-                self.draw()
-                self.clock.tick(FPS)
-
-        pygame.quit()
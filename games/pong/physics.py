@@ -0,0 +1,69 @@
+"""Continuous (swept) collision detection for the Pong ball."""
+
+import math
+
+# Collisions resolved per Ball.update before the remaining motion is dropped
+MAX_BOUNCES_PER_STEP = 8
+
+
+def _axis_times(position, size, delta, low, high):
+    """Get the (entry, exit) fractions of a move along one axis through [low, high).
+
+    The moving box spans [position, position + size); it overlaps the
+    static span while position + size > low and position < high.
+    """
+    if delta > 0:
+        return (low - size - position) / delta, (high - position) / delta
+    if delta < 0:
+        return (high - position) / delta, (low - size - position) / delta
+    if low - size < position < high:
+        return -math.inf, math.inf
+    return math.inf, -math.inf
+
+
+def swept_aabb(x, y, width, height, dx, dy, box_x, box_y, box_width, box_height):
+    """Find when a moving box first touches a static box.
+
+    Overlap follows Rect.colliderect: boxes that only share an edge do not
+    collide.
+
+    Args:
+        x, y, width, height: Moving box at the start of the move
+        dx, dy: Full displacement over the move
+        box_x, box_y, box_width, box_height: Static box
+
+    Returns:
+        (time, axis): fraction of the move (0-1) at first contact and the
+        axis of the face hit ("x" or "y"), or None if they never touch. A
+        box already overlapping reports time 0.
+    """
+    entry_x, exit_x = _axis_times(x, width, dx, box_x, box_x + box_width)
+    entry_y, exit_y = _axis_times(y, height, dy, box_y, box_y + box_height)
+    entry = max(entry_x, entry_y)
+    exit_ = min(exit_x, exit_y)
+    if entry >= exit_ or exit_ <= 0 or entry > 1:
+        return None
+    return max(entry, 0.0), "x" if entry_x >= entry_y else "y"
+
+
+def wall_time(y, size, dy, top, bottom):
+    """Get the fraction of a vertical move at which the box reaches a wall, or None.
+
+    Args:
+        y, size: Box top and height
+        dy: Full vertical displacement over the move
+        top, bottom: Wall lines the box must stay between
+
+    Returns:
+        Fraction of the move (0-1), 0 if the box is already past the wall
+        it is heading for
+    """
+    if dy < 0:
+        time = (top - y) / dy
+    elif dy > 0:
+        time = (bottom - size - y) / dy
+    else:
+        return None
+    if time > 1:
+        return None
+    return max(time, 0.0)
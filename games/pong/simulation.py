@@ -0,0 +1,83 @@
+"""Batch simulation hooks for Pong (see shared.batch).
+
+Policies play the left paddle with W/S against the game's right-paddle AI.
+"""
+
+import pygame
+from shared.batch import HeldKeys, NO_KEYS
+from .constants import BALL_SIZE
+from .game import PongGame
+
+PARAMETERS = {
+    "BALL_SPEED_X": (("games.pong.entities", "BALL_SPEED_X"),),
+    "BALL_SPEED_Y": (("games.pong.entities", "BALL_SPEED_Y"),),
+    "PADDLE_SPEED": (("games.pong.entities", "PADDLE_SPEED"),),
+    "AI_MODE": (("games.pong.game", "AI_MODE"),),  # follow or predict; the two below tune predict
+    "AI_REACTION_DELAY": (("games.pong.game", "AI_REACTION_DELAY"),),
+    "AI_ERROR": (("games.pong.game", "AI_ERROR"),),
+}
+
+UP = HeldKeys((pygame.K_w,))
+DOWN = HeldKeys((pygame.K_s,))
+FOLLOW_DEADZONE = 10  # Pixels the paddle center may be off the ball before it moves
+RANDOM_HOLD_UPDATES = 10  # Updates a random key choice is held for
+
+
+def idle_policy(rng):
+    """Never move."""
+
+    def act(game):
+        return NO_KEYS, ()
+
+    return act
+
+
+def follow_policy(rng):
+    """Keep the paddle's center on the ball's."""
+
+    def act(game):
+        offset = game.ball.y + BALL_SIZE // 2 - game.left_paddle.get_center_y()
+        if offset < -FOLLOW_DEADZONE:
+            return UP, ()
+        if offset > FOLLOW_DEADZONE:
+            return DOWN, ()
+        return NO_KEYS, ()
+
+    return act
+
+
+def random_policy(rng):
+    """Hold up, down or nothing, picked at random every RANDOM_HOLD_UPDATES updates."""
+    choices = (UP, DOWN, NO_KEYS)
+    held = NO_KEYS
+
+    def act(game):
+        nonlocal held
+        if game.steps % RANDOM_HOLD_UPDATES == 0:
+            held = rng.choice(choices)
+        return held, ()
+
+    return act
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "follow": follow_policy,
+    "random": random_policy,
+}
+
+
+def new_game(seed):
+    """Build a headless single-player Pong match."""
+    game = PongGame(headless=True, seed=seed)
+    game.start_match()
+    return game
+
+
+def episode_metrics(game):
+    """Get both scores and whether the player won the match."""
+    return {
+        "score": game.left_score,
+        "opponent_score": game.right_score,
+        "won": int(game.is_game_over() and game.left_score > game.right_score),
+    }
@@ -0,0 +1,49 @@
+"""Closed-form Pong ball trajectory prediction.
+
+Every function works on plain numbers and, element-wise, on NumPy arrays,
+so a batch simulation can predict thousands of paddles in one call.
+"""
+
+import numpy as np
+
+# Vertical speed added per unit of paddle hit offset (see Ball.bounce_off_paddle)
+BOUNCE_SPEED_Y = 3
+# Slowest horizontal speed a paddle bounce leaves the ball with
+MIN_BOUNCE_SPEED_X = 2
+
+
+def bounce_speed_x(speed_x):
+    """Get the ball's horizontal speed after a paddle bounce."""
+    speed_x = -speed_x
+    return np.where(np.abs(speed_x) < MIN_BOUNCE_SPEED_X, np.where(speed_x > 0, 2, -2), speed_x)
+
+
+def bounce_speed_y(ball_y, ball_size, paddle_center_y, paddle_height):
+    """Get the ball's vertical speed after hitting a paddle centered at paddle_center_y."""
+    hit_pos = (ball_y + ball_size // 2 - paddle_center_y) / (paddle_height // 2)
+    return hit_pos * BOUNCE_SPEED_Y
+
+
+def fold_y(y, top, bottom):
+    """Reflect an unbounded y back into [top, bottom], as wall bounces do."""
+    span = bottom - top
+    if np.any(span <= 0):
+        return np.clip(y, top, bottom)
+    offset = np.mod(y - top, 2 * span)
+    return top + span - np.abs(offset - span)
+
+
+def plane_y(x, y, speed_x, speed_y, plane_x, top, bottom):
+    """Get the ball's y when its x reaches plane_x, bouncing between top and bottom.
+
+    Args:
+        x, y: Ball position
+        speed_x, speed_y: Ball velocity per update; speed_x must head toward plane_x
+        plane_x: x the ball's x coordinate will reach
+        top, bottom: Range of y the ball's top edge moves within
+
+    Returns:
+        Predicted y of the ball's top edge at the crossing
+    """
+    time = np.abs(plane_x - x) / np.maximum(np.abs(speed_x), 1e-9)
+    return fold_y(y + speed_y * time, top, bottom)
@@ -12,7 +12,9 @@ GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 
 # Game settings
-GAME_SPEED = 3  # Lower number = slower snake (FPS)
+GAME_SPEED = 3  # Lower number = slower snake (moves per second)
+FPS = 60  # Render rate, independent of GAME_SPEED
+FOOD_SCORE = 10  # Points per food eaten
 
 # Colors
 SNAKE_HEAD_COLOR = GREEN
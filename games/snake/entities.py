@@ -1,6 +1,7 @@
-"""Snake game entities: Snake, Food, and Direction."""
+"""Snake game entities: Snake, Food, Direction, and the FreeCells index."""
 
 import random
+from collections import Counter, deque
 from enum import Enum
 from . import constants as _c
 
@@ -14,12 +15,94 @@ class Direction(Enum):
     RIGHT = (1, 0)
 
 
-class Snake:
-    """Represents the snake in the game."""
+class SnakeBody(deque):
+    """Deque of body segments, head first, that also supports list-style slicing."""
+
+    def __getitem__(self, index):
+        """Get a segment, or a list of segments for a slice."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+
+class FreeCells:
+    """Index of the empty cells of a grid with O(1) add, remove and random pick.
+
+    Empty cells live in a list; a dict maps each cell to its slot. Removing a
+    cell moves the last entry into its slot, so the list never has holes and
+    a uniform sample is one random index.
+    """
+
+    def __init__(self, width, height, occupied=()):
+        """Initialize the index with every cell of a width x height grid free.
+
+        Args:
+            width: Grid width in cells
+            height: Grid height in cells
+            occupied: Cells to mark as taken right away
+        """
+        self.width = width
+        self.height = height
+        self.cells = [(x, y) for y in range(height) for x in range(width)]
+        self.slots = {cell: slot for slot, cell in enumerate(self.cells)}
+        for cell in occupied:
+            self.discard(cell)
+
+    def __len__(self):
+        """Return the number of free cells."""
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        """Check if a cell is free."""
+        return cell in self.slots
+
+    def add(self, cell):
+        """Mark an on-grid cell as free."""
+        x, y = cell
+        if cell in self.slots or not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        self.slots[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def discard(self, cell):
+        """Mark a cell as taken, if it was free."""
+        slot = self.slots.pop(cell, None)
+        if slot is None:
+            return
+        last = self.cells.pop()
+        if slot < len(self.cells):
+            self.cells[slot] = last
+            self.slots[last] = slot
+
+    def sample(self, rng=random):
+        """Get a uniformly random free cell drawn from rng, or None when the grid is full."""
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
+
 
-    def __init__(self, start_x, start_y):
-        """Initialize snake at starting position."""
-        self.body = [(start_x, start_y)]
+class Snake:
+    """Represents the snake in the game.
+
+    The body is a deque so the head and tail ends change in O(1), and
+    `occupied` counts segments per cell so self-collision and "is this cell
+    taken" checks are O(1) regardless of length. When given a FreeCells
+    index, the snake keeps it in sync as cells are entered and vacated.
+    """
+
+    def __init__(self, start_x, start_y, free_cells=None):
+        """Initialize snake at starting position.
+
+        Args:
+            start_x: Starting grid column
+            start_y: Starting grid row
+            free_cells: Optional FreeCells index to keep up to date
+        """
+        self.body = SnakeBody([(start_x, start_y)])
+        self.occupied = Counter({(start_x, start_y): 1})  # cell -> segments on it
+        self.free_cells = free_cells
+        if free_cells is not None:
+            free_cells.discard((start_x, start_y))
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
 
@@ -29,7 +112,10 @@ class Snake:
         head_x, head_y = self.body[0]
         dx, dy = self.direction.value
         new_head = (head_x + dx, head_y + dy)
-        self.body.insert(0, new_head)
+        self.body.appendleft(new_head)
+        self.occupied[new_head] += 1
+        if self.free_cells is not None:
+            self.free_cells.discard(new_head)
 
     def grow(self):
         """Grow the snake (don't remove tail after moving)."""
@@ -39,7 +125,14 @@ class Snake:
     def shrink(self):
         """Remove the tail segment."""
         if len(self.body) > 0:
-            self.body.pop()
+            tail = self.body.pop()
+            remaining = self.occupied[tail] - 1
+            if remaining:
+                self.occupied[tail] = remaining
+            else:
+                del self.occupied[tail]
+                if self.free_cells is not None:
+                    self.free_cells.add(tail)
 
     def change_direction(self, new_direction):
         """Change snake direction if valid."""
@@ -61,8 +154,11 @@ class Snake:
 
     def check_self_collision(self):
         """Check if snake hit itself."""
-        head = self.body[0]
-        return head in self.body[1:]
+        return self.occupied[self.body[0]] > 1
+
+    def occupies(self, position):
+        """Check if any segment is on the given cell."""
+        return position in self.occupied
 
     def get_head(self):
         """Get the head position."""
@@ -72,22 +168,35 @@ class Snake:
 class Food:
     """Represents food in the game."""
 
-    def __init__(self):
-        """Initialize food at a random position."""
+    def __init__(self, rng=random):
+        """Initialize food at a random position.
+
+        Args:
+            rng: random.Random (or the random module) food positions are drawn from
+        """
+        self.rng = rng
         self.position = self._generate_position()
 
     def _generate_position(self):
         """Generate a random position for food."""
-        x = random.randint(0, _c.GRID_WIDTH - 1)
-        y = random.randint(0, _c.GRID_HEIGHT - 1)
+        x = self.rng.randint(0, _c.GRID_WIDTH - 1)
+        y = self.rng.randint(0, _c.GRID_HEIGHT - 1)
         return (x, y)
 
-    def regenerate(self, snake_body):
-        """Generate new food position avoiding snake body."""
-        while True:
-            self.position = self._generate_position()
-            if self.position not in snake_body:
-                break
+    def regenerate(self, free_cells):
+        """Move the food to a random free cell.
+
+        Args:
+            free_cells: FreeCells index of the cells not covered by the snake
+
+        Returns:
+            False if no cell is free (the snake fills the board), else True
+        """
+        position = free_cells.sample(self.rng)
+        if position is None:
+            return False
+        self.position = position
+        return True
 
     def get_position(self):
         """Get the food position."""
@@ -1,13 +1,17 @@
 """Main Snake game implementation."""
 
 import pygame
+from itertools import islice
 from shared.base_game import BaseGame
 from shared.constants import MEDIUM_FONT
+from shared.utils import render_text
 from .constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     GRID_SIZE,
     GAME_SPEED,
+    FPS,
+    FOOD_SCORE,
     SNAKE_HEAD_COLOR,
     SNAKE_BODY_COLOR,
     FOOD_COLOR,
@@ -15,17 +19,23 @@ from .constants import (
     TEXT_COLOR,
 )
 from . import constants as snake_const
-from .entities import Snake, Food, Direction
+from .entities import Snake, Food, Direction, FreeCells
 
 
 class SnakeGame(BaseGame):
     """Main Snake game class."""
 
-    def __init__(self):
+    fps = FPS
+    update_rate = GAME_SPEED
+    dirty_rendering = True
+
+    def __init__(self, headless=False, seed=None):
         """Initialize the Snake game."""
-        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Snake Game")
+        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Snake Game", headless=headless, seed=seed)
         self.font = pygame.font.Font(None, MEDIUM_FONT)
         self.reset_game()
+        # The hub plays every game in one process: put back the layout constants an earlier game resized
+        self.handle_resize(self.window_width, self.window_height)
 
     def handle_resize(self, w, h):
         """Handle window resize, updating snake constants."""
@@ -34,6 +44,13 @@ class SnakeGame(BaseGame):
         snake_const.WINDOW_HEIGHT = h
         snake_const.GRID_WIDTH = w // GRID_SIZE
         snake_const.GRID_HEIGHT = h // GRID_SIZE
+        # Re-index free cells for the new grid size
+        self.free_cells = FreeCells(snake_const.GRID_WIDTH, snake_const.GRID_HEIGHT, self.snake.occupied)
+        self.snake.free_cells = self.free_cells
+
+    def entity_count(self):
+        """Get the number of snake segments plus the food."""
+        return len(self.snake.body) + 1
 
     def reset_game(self):
         """Reset the game to initial state."""
@@ -42,19 +59,29 @@ class SnakeGame(BaseGame):
         # Initialize snake at center of screen
         center_x = WINDOW_WIDTH // GRID_SIZE // 2
         center_y = WINDOW_HEIGHT // GRID_SIZE // 2
-        self.snake = Snake(center_x, center_y)
-
-        # Initialize food
-        self.food = Food()
-        self.food.regenerate(self.snake.body)
+        self.free_cells = FreeCells(WINDOW_WIDTH // GRID_SIZE, WINDOW_HEIGHT // GRID_SIZE)
+        self.snake = Snake(center_x, center_y, self.free_cells)
+        self.prev_head = self.snake.get_head()
+        self.prev_tail = self.snake.body[-1]
+        # What the last frame showed, for redrawing only what changed
+        self.moves_since_draw = 0
+        self.drawn_game_over = False
+        self.drawn_rects = None
+        self.drawn_score = None
+        self.request_full_redraw()
 
         # Game state
         self.score = 0
         self.game_over = False
+        self.won = False
+
+        # Initialize food
+        self.food = Food(self.rng)
+        self.food.regenerate(self.free_cells)
 
     def handle_input(self):
         """Handle input events."""
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return False
 
@@ -87,8 +114,13 @@ class SnakeGame(BaseGame):
         if self.game_over:
             return
 
+        # Remember the ends of the snake so draw() can slide between updates
+        self.prev_head = self.snake.get_head()
+        self.prev_tail = self.snake.body[-1]
+
         # Move snake
         self.snake.move()
+        self.moves_since_draw += 1
 
         # Check collisions
         if self.snake.check_wall_collision() or self.snake.check_self_collision():
@@ -97,48 +129,140 @@ class SnakeGame(BaseGame):
 
         # Check food collision
         if self.snake.get_head() == self.food.get_position():
-            self.score += 10
+            self.score += FOOD_SCORE
             self.snake.grow()
-            self.food.regenerate(self.snake.body)
+            if not self.food.regenerate(self.free_cells):
+                # The snake covers every cell: nothing left to eat
+                self.won = True
+                self.game_over = True
         else:
             # Remove tail if no food eaten
             self.snake.shrink()
 
-    def draw(self):
-        """Draw the game."""
+    def segment_rect(self, start, end, alpha):
+        """Get the screen rect of a snake cell interpolated from grid cell start to end."""
+        x = (start[0] + (end[0] - start[0]) * alpha) * GRID_SIZE
+        y = (start[1] + (end[1] - start[1]) * alpha) * GRID_SIZE
+        return pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
+
+    def draw_segment(self, rect, color):
+        """Draw one snake cell at a screen rect, with a 1px background-colored border."""
+        # Two fills rather than an outline: pygame outlines the clipped rect,
+        # which would draw borders along the edges of redraw_regions() clips
+        self.screen.fill(BACKGROUND_COLOR, rect)
+        self.screen.fill(color, rect.inflate(-2, -2))
+
+    def frame_rects(self, alpha):
+        """Get the screen rects of everything that moves or changes this frame.
+
+        Returns:
+            Dict of "tail" (the vacated tail cell sliding out), "head" (sliding
+            in), "food" and "score" rects
+        """
+        body = self.snake.body
+        food_x, food_y = self.food.get_position()
+        score_text = render_text(self.font, f"Score: {self.score}", True, TEXT_COLOR)
+        return {
+            "tail": self.segment_rect(self.prev_tail, body[-1], alpha),
+            "head": self.segment_rect(self.prev_head, body[0], alpha),
+            "food": pygame.Rect(food_x * GRID_SIZE, food_y * GRID_SIZE, GRID_SIZE, GRID_SIZE),
+            "score": score_text.get_rect(topleft=(10, 10)),
+        }
+
+    def changed_regions(self, rects):
+        """Get the regions that differ from the last frame drawn.
+
+        Args:
+            rects: This frame's frame_rects()
+        """
+        drawn = self.drawn_rects
+        regions = []
+        for name, rect in rects.items():
+            # A new score can render to a same-sized rect
+            if rect != drawn[name] or (name == "score" and self.score != self.drawn_score):
+                regions.append(rect.union(drawn[name]))
+        # The cells the head and tail slide between change color as a whole
+        # when the snake moves, not just where the sliding rects were
+        for cell in (self.prev_head, self.prev_tail):
+            regions.append(self.segment_rect(cell, cell, 0))
+        return regions
+
+    def paint(self, clip, alpha, rects):
+        """Draw the playing field where it overlaps clip, sliding the head and tail by alpha.
+
+        Args:
+            clip: Screen rect to draw (drawing outside it may be clipped away)
+            alpha: How far the head and tail have slid between moves
+            rects: This frame's frame_rects()
+        """
+        screen = self.screen
+        screen.fill(BACKGROUND_COLOR, clip)
+
+        # Draw snake: the body sits on its cells, the vacated tail cell
+        # slides out and the head slides in from its previous cell
+        body = self.snake.body
+        if self.prev_tail != body[-1]:
+            self.draw_segment(rects["tail"], SNAKE_BODY_COLOR)
+        left, top = clip.left // GRID_SIZE, clip.top // GRID_SIZE
+        right, bottom = (clip.right - 1) // GRID_SIZE, (clip.bottom - 1) // GRID_SIZE
+        if (right - left + 1) * (bottom - top + 1) < len(body):
+            # Small region: look up the few cells it covers
+            occupied = self.snake.occupied
+            head = body[0]
+            for x in range(left, right + 1):
+                for y in range(top, bottom + 1):
+                    cell = (x, y)
+                    if occupied[cell] > (cell == head):
+                        self.draw_segment(self.segment_rect(cell, cell, 0), SNAKE_BODY_COLOR)
+        else:
+            for segment in islice(body, 1, None):
+                self.draw_segment(self.segment_rect(segment, segment, 0), SNAKE_BODY_COLOR)
+        self.draw_segment(rects["head"], SNAKE_HEAD_COLOR)
+
+        # Draw food
+        pygame.draw.rect(screen, FOOD_COLOR, rects["food"])
+
+        # Draw score
+        score_text = render_text(self.font, f"Score: {self.score}", True, TEXT_COLOR)
+        screen.blit(score_text, rects["score"])
+
+        # Draw controls
+        controls_text = render_text(self.font, "Use arrow keys to move, ESC to quit", True, TEXT_COLOR)
+        screen.blit(controls_text, (10, self.window_height - 30))
+
+    def draw(self, alpha=1.0):
+        """Draw the game, sliding the head and tail by alpha between moves.
+
+        Only the cells and text that changed since the last frame are
+        repainted, unless the screen changed wholesale.
+        """
         WINDOW_WIDTH = self.window_width
         WINDOW_HEIGHT = self.window_height
-        # Clear screen
-        self.screen.fill(BACKGROUND_COLOR)
+        # The snake's ends are only tracked one move back, so skipped moves need a full redraw
+        if self.game_over != self.drawn_game_over or self.moves_since_draw > 1:
+            self.request_full_redraw()
+        self.drawn_game_over = self.game_over
+        self.moves_since_draw = 0
+        full = self.begin_draw()
 
         if not self.game_over:
-            # Draw snake
-            for i, segment in enumerate(self.snake.body):
-                x = segment[0] * GRID_SIZE
-                y = segment[1] * GRID_SIZE
-                color = SNAKE_HEAD_COLOR if i == 0 else SNAKE_BODY_COLOR
-                pygame.draw.rect(self.screen, color, (x, y, GRID_SIZE, GRID_SIZE))
-                pygame.draw.rect(self.screen, BACKGROUND_COLOR, (x, y, GRID_SIZE, GRID_SIZE), 1)
-
-            # Draw food
-            food_x, food_y = self.food.get_position()
-            food_x *= GRID_SIZE
-            food_y *= GRID_SIZE
-            pygame.draw.rect(self.screen, FOOD_COLOR, (food_x, food_y, GRID_SIZE, GRID_SIZE))
-
-            # Draw score
-            score_text = self.font.render(f"Score: {self.score}", True, TEXT_COLOR)
-            self.screen.blit(score_text, (10, 10))
-
-            # Draw controls
-            controls_text = self.font.render("Use arrow keys to move, ESC to quit", True, TEXT_COLOR)
-            self.screen.blit(controls_text, (10, WINDOW_HEIGHT - 30))
+            rects = self.frame_rects(alpha)
+            if full:
+                self.paint(self.screen.get_rect(), alpha, rects)
+            else:
+                self.redraw_regions(self.changed_regions(rects), lambda clip: self.paint(clip, alpha, rects))
+            self.drawn_rects = rects
+            self.drawn_score = self.score
 
-        else:
+        elif full:
             # Game over screen
-            game_over_text = self.font.render("GAME OVER", True, FOOD_COLOR)
-            score_text = self.font.render(f"Final Score: {self.score}", True, TEXT_COLOR)
-            restart_text = self.font.render("Press SPACE to play again, ESC to quit", True, TEXT_COLOR)
+            self.screen.fill(BACKGROUND_COLOR)
+            if self.won:
+                game_over_text = render_text(self.font, "YOU WIN!", True, SNAKE_HEAD_COLOR)
+            else:
+                game_over_text = render_text(self.font, "GAME OVER", True, FOOD_COLOR)
+            score_text = render_text(self.font, f"Final Score: {self.score}", True, TEXT_COLOR)
+            restart_text = render_text(self.font, "Press SPACE to play again, ESC to quit", True, TEXT_COLOR)
 
             # Center the text
             game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
@@ -150,14 +274,3 @@ class SnakeGame(BaseGame):
             self.screen.blit(restart_text, restart_rect)
 
         self.present()
-
-    def run(self):
-        """Main game loop with custom timing."""
-        while self.running:
-            self.running = self.handle_input()
-            if self.running:
-                self.update()
-                self.draw()
-                self.clock.tick(GAME_SPEED)
-
-        pygame.quit()
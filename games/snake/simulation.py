@@ -0,0 +1,93 @@
+"""Batch simulation hooks for Snake (see shared.batch).
+
+Headless Snake runs one move per update, so GAME_SPEED only changes how
+many seconds of play an episode's moves stand for.
+"""
+
+import pygame
+from shared.batch import NO_KEYS, key_press
+from . import constants as _c
+from .entities import Direction
+from .game import SnakeGame
+
+PARAMETERS = {
+    "GAME_SPEED": (("games.snake.game", "SnakeGame.update_rate"),),
+}
+
+DIRECTION_KEYS = {
+    Direction.UP: pygame.K_UP,
+    Direction.DOWN: pygame.K_DOWN,
+    Direction.LEFT: pygame.K_LEFT,
+    Direction.RIGHT: pygame.K_RIGHT,
+}
+RANDOM_TURN_CHANCE = 0.2
+
+
+def straight_policy(rng):
+    """Never turn."""
+
+    def act(game):
+        return NO_KEYS, ()
+
+    return act
+
+
+def random_policy(rng):
+    """Press a random arrow key on about one move in five."""
+    keys = list(DIRECTION_KEYS.values())
+
+    def act(game):
+        if rng.random() < RANDOM_TURN_CHANCE:
+            return NO_KEYS, (key_press(rng.choice(keys)),)
+        return NO_KEYS, ()
+
+    return act
+
+
+def greedy_policy(rng):
+    """Turn toward the food, never onto a wall or the body if another move is safe."""
+
+    def is_safe(snake, cell):
+        x, y = cell
+        if not (0 <= x < _c.GRID_WIDTH and 0 <= y < _c.GRID_HEIGHT):
+            return False
+        # The tail moves away this update, unless the snake is about to eat
+        return not snake.occupies(cell) or cell == snake.body[-1]
+
+    def act(game):
+        snake = game.snake
+        head_x, head_y = snake.get_head()
+        food_x, food_y = game.food.get_position()
+        moves = []
+        for direction in Direction:
+            dx, dy = direction.value
+            if (dx, dy) == (-snake.direction.value[0], -snake.direction.value[1]):
+                continue  # The snake cannot reverse
+            cell = (head_x + dx, head_y + dy)
+            if is_safe(snake, cell):
+                moves.append((abs(food_x - cell[0]) + abs(food_y - cell[1]), rng.random(), direction))
+        if not moves:
+            return NO_KEYS, ()
+        best = min(moves)[2]
+        if best == snake.direction:
+            return NO_KEYS, ()
+        return NO_KEYS, (key_press(DIRECTION_KEYS[best]),)
+
+    return act
+
+
+POLICIES = {
+    "straight": straight_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+def new_game(seed):
+    """Build a headless Snake game."""
+    return SnakeGame(headless=True, seed=seed)
+
+
+def episode_metrics(game):
+    """Get the score and the snake's final length."""
+    return {"score": game.score, "length": len(game.snake.body)}
@@ -0,0 +1,187 @@
+"""Batched, NumPy-vectorized Snake environment for training agents.
+
+Runs N independent boards with the same rules as the interactive game:
+Snake.change_direction ignores reversals, Snake.move advances the head one
+cell, check_wall_collision and check_self_collision end the episode (the
+tail has not moved yet when self-collision is checked), eating scores
+FOOD_SCORE and skips the tail removal, and Food.regenerate picks a uniform
+free cell. A board whose snake covers every cell is a win and also ends the
+episode. Finished boards are reset automatically.
+"""
+
+import numpy as np
+
+from . import constants as _c
+from .entities import Direction
+
+# Action i asks the snake to turn to ACTIONS[i]; any negative action keeps going
+ACTIONS = tuple(Direction)
+_DX = np.array([direction.value[0] for direction in ACTIONS], dtype=np.int32)
+_DY = np.array([direction.value[1] for direction in ACTIONS], dtype=np.int32)
+_OPPOSITE = np.array([ACTIONS.index(Direction((-dx, -dy))) for dx, dy in (d.value for d in ACTIONS)], dtype=np.int64)
+_START_DIRECTION = ACTIONS.index(Direction.RIGHT)
+
+
+class VectorSnakeEnv:
+    """N Snake boards stepped together in one vectorized call.
+
+    State lives in arrays indexed by board: `grid` (N, height, width) counts
+    the snake segments on each cell, `head_x`/`head_y` hold the head cell,
+    `directions` the index into ACTIONS, `food` the flat food cell
+    (y * width + x), `lengths` and `scores`. Each body is a ring buffer of
+    flat cells so moving and shrinking touch two cells per board.
+    """
+
+    def __init__(self, num_boards, width=None, height=None, seed=None):
+        """Initialize the boards and start a fresh episode on each.
+
+        Args:
+            num_boards: Number of independent boards
+            width: Grid width in cells (defaults to the game's GRID_WIDTH)
+            height: Grid height in cells (defaults to the game's GRID_HEIGHT)
+            seed: Seed for the food placement random generator
+        """
+        self.num_boards = num_boards
+        self.width = _c.GRID_WIDTH if width is None else width
+        self.height = _c.GRID_HEIGHT if height is None else height
+        self.cells = self.width * self.height
+        self.rng = np.random.default_rng(seed)
+
+        n = num_boards
+        self.grid = np.zeros((n, self.height, self.width), dtype=np.uint8)
+        self._occupancy = self.grid.reshape(n, self.cells)
+        self._occupancy_flat = self.grid.reshape(-1)
+        # A snake covering the board has `cells` segments; one spare slot
+        # lets the new head be written before the tail is dropped
+        self._capacity = self.cells + 1
+        self._ring = np.zeros(n * self._capacity, dtype=np.int32)
+        self._head_slot = np.zeros(n, dtype=np.int64)
+        self._board_cells = np.arange(n, dtype=np.int64) * self.cells
+        self._board_ring = np.arange(n, dtype=np.int64) * self._capacity
+
+        self.head_x = np.zeros(n, dtype=np.int32)
+        self.head_y = np.zeros(n, dtype=np.int32)
+        self.directions = np.zeros(n, dtype=np.int64)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.lengths = np.zeros(n, dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.int64)
+        # Score each board had when its last episode ended
+        self.final_scores = np.zeros(n, dtype=np.int64)
+        self.wins = np.zeros(n, dtype=bool)
+        self.episodes = 0
+
+        self.reset()
+
+    def reset(self, boards=None):
+        """Start a new episode on the given boards (all boards by default).
+
+        Like SnakeGame.reset_game: a one-segment snake in the middle of the
+        grid heading right, score 0, and food on a random free cell.
+        """
+        if boards is None:
+            boards = np.arange(self.num_boards)
+        if len(boards) == 0:
+            return
+        center_x = self.width // 2
+        center_y = self.height // 2
+        center = center_y * self.width + center_x
+
+        self._occupancy[boards] = 0
+        self._occupancy[boards, center] = 1
+        self._head_slot[boards] = 0
+        self._ring[self._board_ring[boards]] = center
+        self.head_x[boards] = center_x
+        self.head_y[boards] = center_y
+        self.directions[boards] = _START_DIRECTION
+        self.lengths[boards] = 1
+        self.scores[boards] = 0
+        self._place_food(boards)
+
+    def _place_food(self, boards):
+        """Move the food of each board to a uniformly random free cell.
+
+        Returns:
+            Boolean array, False where the board had no free cell left
+        """
+        free = self._occupancy[boards] == 0
+        counts = free.sum(axis=1)
+        placed = counts > 0
+        picks = self.rng.integers(0, np.maximum(counts, 1))
+        # Index of the (pick + 1)-th free cell in each row
+        self.food[boards] = np.argmax(np.cumsum(free, axis=1) > picks[:, None], axis=1)
+        return placed
+
+    def step(self, actions):
+        """Advance every board by one move.
+
+        Args:
+            actions: Length-N integer array of ACTIONS indices (negative = no turn)
+
+        Returns:
+            (rewards, dones): food score gained this step and whether the
+            episode ended; ended boards have already been reset, with the
+            finished episode's score in final_scores
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        directions = self.directions
+        # Snake.change_direction: ignore no-ops and reversals
+        turn = (actions >= 0) & (actions != _OPPOSITE[directions])
+        np.copyto(directions, actions, where=turn)
+
+        # Snake.move
+        head_x = self.head_x + _DX[directions]
+        head_y = self.head_y + _DY[directions]
+        self.head_x = head_x
+        self.head_y = head_y
+        # check_wall_collision
+        on_grid = (head_x >= 0) & (head_x < self.width) & (head_y >= 0) & (head_y < self.height)
+        head = np.where(on_grid, head_y * self.width + head_x, 0)
+        occupancy_index = self._board_cells + head
+        self._occupancy_flat[occupancy_index] += on_grid
+        # check_self_collision, before the tail moves
+        alive = on_grid & (self._occupancy_flat[occupancy_index] == 1)
+
+        self._head_slot += 1
+        self._head_slot %= self._capacity
+        self._ring[self._board_ring + self._head_slot] = head
+
+        eaten = alive & (head == self.food)
+        rewards = eaten * _c.FOOD_SCORE
+        self.scores += rewards
+
+        # Snake.shrink unless food was eaten
+        shrink = alive & ~eaten
+        tail_slot = (self._head_slot - self.lengths) % self._capacity
+        tail = self._ring[self._board_ring + tail_slot]
+        self._occupancy_flat[self._board_cells + tail] -= shrink
+        self.lengths += eaten
+
+        dones = ~alive
+        self.wins[:] = False
+        eaters = np.flatnonzero(eaten)
+        if len(eaters):
+            # Food.regenerate; no free cell left means the snake filled the board
+            full = eaters[~self._place_food(eaters)]
+            self.wins[full] = True
+            dones[full] = True
+
+        finished = np.flatnonzero(dones)
+        if len(finished):
+            self.final_scores[finished] = self.scores[finished]
+            self.episodes += len(finished)
+            self.reset(finished)
+        return rewards, dones
+
+    def observation(self):
+        """Get a (N, 3, height, width) uint8 array of body, head and food planes."""
+        n = self.num_boards
+        planes = np.zeros((n, 3, self.cells), dtype=np.uint8)
+        planes[:, 0] = self._occupancy
+        boards = np.arange(n)
+        planes[boards, 1, self.head_y * self.width + self.head_x] = 1
+        planes[boards, 2, self.food] = 1
+        return planes.reshape(n, 3, self.height, self.width)
+
+    def food_positions(self):
+        """Get the food cells as an (N, 2) array of (x, y)."""
+        return np.stack((self.food % self.width, self.food // self.width), axis=1)
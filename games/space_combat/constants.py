@@ -32,6 +32,17 @@ PLAYER2_BULLET_COLOR = (100, 255, 100)
 ENEMY_COLOR = RED
 TEXT_COLOR = WHITE
 EXPLOSION_COLOR = RED
+EXPLOSION_COLORS = (EXPLOSION_COLOR, (255, 140, 0), (255, 220, 90))  # Particle colors, picked at random
+
+# Explosion particles
+MAX_PARTICLES = 100_000  # Hard budget; emitting past it drops the oldest particles
+EXPLOSION_PARTICLES = 40  # Particles per destroyed enemy
+PARTICLE_SPEED = (0.5, 4.0)  # Launch speed range, pixels per frame
+PARTICLE_LIFETIME = (15, 35)  # Lifetime range, frames
+PARTICLE_DRAG = 0.93  # Velocity kept per frame
+PARTICLE_GRAVITY = 0.05  # Downward pull, pixels per frame squared
+PARTICLE_SIZE = 2  # Square side, pixels
 
 # Scoring
 ENEMY_KILL_POINTS = 10
+ENEMY_COLLISION_DAMAGE = 20  # Health a player loses per enemy that rams it
@@ -14,8 +14,11 @@ from .constants import (
     PLAYER_SPEED,
     BULLET_SPEED,
     ENEMY_SPEED,
+    ENEMY_COLLISION_DAMAGE,
 )
 from . import constants as _c
+from .entity_store import StoreView
+from .sprites import enemy_sprite, player_sprite
 
 
 class Player:
@@ -33,6 +36,7 @@ class Player:
         self.body_color = body_color
         self.outline_color = outline_color
         self.bullet_color = bullet_color
+        self.rect = pygame.Rect(x, y, self.width, self.height)
 
     def move_left(self):
         """Move player left."""
@@ -51,57 +55,39 @@ class Player:
         self.y = min(_c.WINDOW_HEIGHT - self.height, self.y + self.speed)
 
     def get_rect(self):
-        """Get pygame rect for collision detection."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get pygame rect for collision detection. The same Rect is updated and returned each call."""
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
 
-    def take_damage(self, damage=20):
+    def take_damage(self, damage=ENEMY_COLLISION_DAMAGE):
         """Take damage and return True if still alive."""
         self.health = max(0, self.health - damage)
         return self.health > 0
 
-    def shoot(self):
-        """Create a bullet at the player's position."""
-        bullet_x = self.x + self.width // 2 - BULLET_WIDTH // 2
-        bullet_y = self.y
-        return Bullet(bullet_x, bullet_y, -BULLET_SPEED, self.bullet_color)
+    def shoot_into(self, bullets):
+        """Fire a bullet straight into an EntityStore, without creating a Bullet. Returns its index."""
+        return bullets.spawn(
+            self.x + self.width // 2 - BULLET_WIDTH // 2,
+            self.y,
+            -BULLET_SPEED,
+            BULLET_WIDTH,
+            BULLET_HEIGHT,
+            self.bullet_color,
+        )
 
     def draw(self, surface):
-        """Draw player as a spaceship pointing upward."""
-        cx = self.x + self.width // 2
-
-        # Main body polygon — swept-wing arrow pointing up
-        body = [
-            (cx, self.y),  # nose tip
-            (cx + 7, self.y + 18),  # right shoulder
-            (self.x + self.width, self.y + self.height),  # right wing tip
-            (cx + 5, self.y + self.height - 5),  # right wing inner notch
-            (cx, self.y + self.height - 7),  # center back notch
-            (cx - 5, self.y + self.height - 5),  # left wing inner notch
-            (self.x, self.y + self.height),  # left wing tip
-            (cx - 7, self.y + 18),  # left shoulder
-        ]
-        pygame.draw.polygon(surface, self.body_color, body)
-        pygame.draw.polygon(surface, self.outline_color, body, 1)
-
-        # Engine exhaust flame
-        pygame.draw.rect(surface, (255, 160, 0), (cx - 4, self.y + self.height - 5, 8, 5))
-        pygame.draw.circle(surface, (255, 80, 0), (cx, self.y + self.height), 4)
-
-        # Cockpit dome
-        pygame.draw.ellipse(surface, (160, 225, 255), (cx - 5, self.y + 7, 10, 9))
-        pygame.draw.ellipse(surface, (220, 245, 255), (cx - 3, self.y + 8, 6, 5))
-
-
-class Enemy:
-    """Enemy spaceship class."""
+        """Draw player as a spaceship pointing upward, from the cached sprite."""
+        surface.blit(player_sprite(self.width, self.height, self.body_color, self.outline_color), (self.x, self.y))
+
+
+class Enemy(StoreView):
+    """Enemy spaceship class, optionally a view onto an EntityStore slot."""
+
+    __slots__ = ()
 
     def __init__(self, x, y):
         """Initialize enemy at given position."""
-        self.x = x
-        self.y = y
-        self.width = ENEMY_WIDTH
-        self.height = ENEMY_HEIGHT
-        self.speed = ENEMY_SPEED
+        self._init_detached(x, y, ENEMY_SPEED, ENEMY_WIDTH, ENEMY_HEIGHT)
 
     def update(self):
         """Update enemy position."""
@@ -111,55 +97,30 @@ class Enemy:
         """Check if enemy is off screen."""
         return self.y > _c.WINDOW_HEIGHT
 
-    def get_rect(self):
-        """Get pygame rect for collision detection."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+    @staticmethod
+    def off_screen_mask(y, window_height):
+        """Vectorized `is_off_screen` over an array of y positions."""
+        return y > window_height
 
     @staticmethod
-    def spawn_random():
-        """Spawn enemy at random x position at top of screen."""
-        x = random.randint(0, _c.WINDOW_WIDTH - ENEMY_WIDTH)
-        return Enemy(x, -ENEMY_HEIGHT)
+    def spawn_random_into(enemies, rng=random):
+        """Spawn an enemy at a random x position straight into an EntityStore. Returns its index."""
+        x = rng.randint(0, _c.WINDOW_WIDTH - ENEMY_WIDTH)
+        return enemies.spawn(x, -ENEMY_HEIGHT, ENEMY_SPEED, ENEMY_WIDTH, ENEMY_HEIGHT)
 
     def draw(self, surface):
-        """Draw enemy as an angular alien fighter pointing downward."""
-        cx = self.x + self.width // 2
-
-        # Main body — wide angular craft with swept wings pointing down
-        body = [
-            (cx, self.y + self.height),  # front tip (nose pointing down)
-            (cx + 5, self.y + 12),  # right inner
-            (self.x + self.width, self.y + 4),  # right wing outer tip
-            (self.x + self.width - 4, self.y),  # right wing leading edge
-            (cx + 5, self.y + 5),  # right inner top
-            (cx - 5, self.y + 5),  # left inner top
-            (self.x + 4, self.y),  # left wing leading edge
-            (self.x, self.y + 4),  # left wing outer tip
-            (cx - 5, self.y + 12),  # left inner
-        ]
-        pygame.draw.polygon(surface, (200, 30, 30), body)
-        pygame.draw.polygon(surface, (255, 90, 90), body, 1)
-
-        # Wing accent lines
-        pygame.draw.line(surface, (255, 100, 100), (self.x + 6, self.y + 3), (cx - 2, self.y + 10), 1)
-        pygame.draw.line(surface, (255, 100, 100), (self.x + self.width - 6, self.y + 3), (cx + 2, self.y + 10), 1)
-
-        # Glowing sensor / eye
-        pygame.draw.circle(surface, (255, 50, 50), (cx, self.y + 7), 4)
-        pygame.draw.circle(surface, (255, 210, 210), (cx, self.y + 7), 2)
-
-
-class Bullet:
-    """Bullet class for player shots."""
+        """Draw enemy as an angular alien fighter pointing downward, from the cached sprite."""
+        surface.blit(enemy_sprite(self.width, self.height), (self.x, self.y))
+
+
+class Bullet(StoreView):
+    """Bullet class for player shots, optionally a view onto an EntityStore slot."""
+
+    __slots__ = ()
 
     def __init__(self, x, y, speed, color=(255, 255, 0)):
         """Initialize bullet at given position with given speed."""
-        self.x = x
-        self.y = y
-        self.width = BULLET_WIDTH
-        self.height = BULLET_HEIGHT
-        self.speed = speed
-        self.color = color
+        self._init_detached(x, y, speed, BULLET_WIDTH, BULLET_HEIGHT, color)
 
     def update(self):
         """Update bullet position."""
@@ -169,26 +130,7 @@ class Bullet:
         """Check if bullet is off screen."""
         return self.y < 0 or self.y > _c.WINDOW_HEIGHT
 
-    def get_rect(self):
-        """Get pygame rect for collision detection."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Explosion:
-    """Simple explosion effect."""
-
-    def __init__(self, x, y):
-        """Initialize explosion at given position."""
-        self.x = x
-        self.y = y
-        self.radius = 5
-        self.max_radius = 25
-        self.growth_rate = 2
-
-    def update(self):
-        """Update explosion animation."""
-        self.radius += self.growth_rate
-
-    def is_finished(self):
-        """Check if explosion animation is finished."""
-        return self.radius >= self.max_radius
+    @staticmethod
+    def off_screen_mask(y, window_height):
+        """Vectorized `is_off_screen` over an array of y positions."""
+        return (y < 0) | (y > window_height)
@@ -0,0 +1,372 @@
+"""Structure-of-arrays storage for Space Combat bullets and enemies.
+
+Entity state lives in contiguous NumPy columns so movement, off-screen
+culling and overlap tests run as single vectorized passes. `Enemy` and
+`Bullet` objects are thin views onto one slot of a store.
+"""
+
+import numpy as np
+import pygame
+
+from .spatial_hash import DEFAULT_CELL_SIZE
+
+# Columns every store keeps, with their dtypes
+_COLUMNS = {
+    "x": np.float64,
+    "y": np.float64,
+    "speed": np.float64,
+    "width": np.int32,
+    "height": np.int32,
+}
+_NO_PAIRS = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+
+
+def _column(name):
+    """Build a property that reads/writes one column of the owning store."""
+
+    def fget(self):
+        store = self._store
+        if store is None:
+            return self._values[name]
+        return getattr(store, name)[self._slot].item()
+
+    def fset(self, value):
+        store = self._store
+        if store is None:
+            self._values[name] = value
+        else:
+            getattr(store, name)[self._slot] = value
+
+    return property(fget, fset, doc=f"Entity {name}, stored in the owning EntityStore.")
+
+
+class StoreView:
+    """Base class for entities that can be held by an EntityStore.
+
+    A view built directly (e.g. `Enemy(x, y)`) keeps its values in a small
+    dict until it is appended to a store, which copies them into its arrays.
+    """
+
+    __slots__ = ("_store", "_slot", "_values", "_rect")
+
+    x = _column("x")
+    y = _column("y")
+    speed = _column("speed")
+    width = _column("width")
+    height = _column("height")
+
+    def _init_detached(self, x, y, speed, width, height, color=(0, 0, 0)):
+        """Initialize a view that is not yet part of any store."""
+        self._store = None
+        self._slot = -1
+        self._rect = None
+        self._values = {"x": x, "y": y, "speed": speed, "width": width, "height": height, "color": color}
+
+    @property
+    def color(self):
+        """Entity color as an (r, g, b) tuple."""
+        store = self._store
+        if store is None:
+            return self._values["color"]
+        return tuple(store.color[self._slot].tolist())
+
+    @color.setter
+    def color(self, value):
+        store = self._store
+        if store is None:
+            self._values["color"] = value
+        else:
+            store.color[self._slot] = value[:3]
+
+    def get_rect(self):
+        """Get pygame rect for collision detection. The same Rect is updated and returned each call."""
+        rect = self._rect
+        if rect is None:
+            rect = self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        else:
+            rect.update(self.x, self.y, self.width, self.height)
+        return rect
+
+    def _detach(self):
+        """Copy this view's values out of its store so it outlives its slot."""
+        store = self._store
+        slot = self._slot
+        self._values = {name: getattr(store, name)[slot].item() for name in _COLUMNS}
+        self._values["color"] = tuple(store.color[slot].tolist())
+        self._store = None
+        self._slot = -1
+
+    @staticmethod
+    def off_screen_mask(y, window_height):
+        """Vectorized off-screen test. Subclasses mirror their `is_off_screen`."""
+        return y > window_height
+
+
+class EntityStore:
+    """Contiguous NumPy storage for one kind of entity.
+
+    Live entities occupy slots [0, len(store)) in spawn order, so index i of
+    the store means the same as index i of the list it replaces and collision
+    pair indices keep working. Views returned by indexing are cached per slot
+    and re-pointed whenever the store compacts.
+    """
+
+    def __init__(self, view_class, capacity=256):
+        """Initialize an empty store whose items are `view_class` views."""
+        self.view_class = view_class
+        self._count = 0
+        self._capacity = 0
+        self._views = {}
+        for name, dtype in _COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.color = np.zeros((0, 3), dtype=np.uint8)
+        self.alive = np.zeros(0, dtype=bool)
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity):
+        """Resize every column to hold at least `capacity` entities."""
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, self._capacity * 2)
+        for name in (*_COLUMNS, "color", "alive"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def __len__(self):
+        """Return the number of live entities."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Get a view of the entity at `index`, creating and caching it on first use."""
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("entity index out of range")
+        view = self._views.get(index)
+        if view is None:
+            view = self.view_class.__new__(self.view_class)
+            view._store = self
+            view._slot = index
+            view._values = None
+            view._rect = None
+            self._views[index] = view
+        return view
+
+    def __iter__(self):
+        """Iterate over views of the live entities in spawn order."""
+        for index in range(self._count):
+            yield self[index]
+
+    def spawn(self, x, y, speed, width, height, color=(0, 0, 0)):
+        """Add one entity by value without creating a view. Returns its index."""
+        slot = self._count
+        self._grow(slot + 1)
+        self.x[slot] = x
+        self.y[slot] = y
+        self.speed[slot] = speed
+        self.width[slot] = width
+        self.height[slot] = height
+        self.color[slot] = color[:3]
+        self.alive[slot] = True
+        self._count = slot + 1
+        return slot
+
+    def spawn_many(self, xs, ys, speed, width, height, color=(0, 0, 0)):
+        """Add many entities in one vectorized write. Scalars are broadcast."""
+        xs = np.asarray(xs, dtype=np.float64)
+        start = self._count
+        end = start + len(xs)
+        self._grow(end)
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.speed[start:end] = speed
+        self.width[start:end] = width
+        self.height[start:end] = height
+        self.color[start:end] = color[:3]
+        self.alive[start:end] = True
+        self._count = end
+
+    def append(self, entity):
+        """Move a view (detached or from another store) into this store."""
+        if entity._store is self:
+            raise ValueError("entity is already in this store")
+        if entity._store is not None:
+            entity._store.remove(entity)
+        values = entity._values
+        slot = self.spawn(values["x"], values["y"], values["speed"], values["width"], values["height"], values["color"])
+        entity._store = self
+        entity._slot = slot
+        entity._values = None
+        self._views[slot] = entity
+
+    def clear(self):
+        """Remove every entity."""
+        for view in self._views.values():
+            view._detach()
+        self._views.clear()
+        self._count = 0
+
+    def kill(self, indices):
+        """Flag the entities at `indices` as dead. They are dropped by `compact`."""
+        self.alive[np.asarray(indices, dtype=np.intp)] = False
+
+    def compact(self):
+        """Drop dead entities in one stable pass. Returns how many were removed."""
+        count = self._count
+        alive = self.alive[:count].copy()
+        keep = np.flatnonzero(alive)
+        kept = len(keep)
+        if kept == count:
+            return 0
+
+        for name in (*_COLUMNS, "color", "alive"):
+            column = getattr(self, name)
+            column[:kept] = column[keep]
+
+        if self._views:
+            new_slots = np.cumsum(alive) - 1
+            views = {}
+            for slot, view in self._views.items():
+                if alive[slot]:
+                    new_slot = int(new_slots[slot])
+                    view._slot = new_slot
+                    views[new_slot] = view
+                else:
+                    view._detach()
+            self._views = views
+
+        self._count = kept
+        return count - kept
+
+    def pop(self, index=-1):
+        """Remove and return the entity at `index`, like `list.pop`."""
+        view = self[index]
+        self.alive[view._slot] = False
+        self.compact()
+        return view
+
+    def remove(self, entity):
+        """Remove a view of this store, like `list.remove`."""
+        if entity._store is not self:
+            raise ValueError("entity is not in this store")
+        self.pop(entity._slot)
+
+    def step(self):
+        """Advance every entity by its speed along y in one vectorized pass."""
+        count = self._count
+        self.y[:count] += self.speed[:count]
+
+    def cull_off_screen(self, window_height):
+        """Kill every entity the view class reports as off screen."""
+        count = self._count
+        self.alive[:count] &= ~self.view_class.off_screen_mask(self.y[:count], window_height)
+
+    def update(self, window_height):
+        """Move, cull and compact in three vectorized passes. Returns removed count."""
+        self.step()
+        self.cull_off_screen(window_height)
+        return self.compact()
+
+    def boxes(self):
+        """Get integer (x, y, width, height) columns, truncated like pygame.Rect."""
+        count = self._count
+        return (
+            np.trunc(self.x[:count]).astype(np.int64),
+            np.trunc(self.y[:count]).astype(np.int64),
+            self.width[:count].astype(np.int64),
+            self.height[:count].astype(np.int64),
+        )
+
+    def color_rects(self):
+        """Get (color, (x, y, width, height)) pairs for drawing without views."""
+        count = self._count
+        xs, ys, ws, hs = (column.tolist() for column in self.boxes())
+        colors = self.color[:count].tolist()
+        return list(zip(colors, zip(xs, ys, ws, hs)))
+
+    def overlap_mask(self, x, y, width, height):
+        """Get a bool array of live entities overlapping one box (Rect.colliderect rules)."""
+        if width <= 0 or height <= 0:
+            return np.zeros(self._count, dtype=bool)
+        xs, ys, ws, hs = self.boxes()
+        hit = (xs < x + width) & (x < xs + ws) & (ys < y + height) & (y < ys + hs)
+        hit &= (ws > 0) & (hs > 0) & self.alive[: self._count]
+        return hit
+
+    def overlap_pairs(self, other, cell_size=DEFAULT_CELL_SIZE):
+        """Find every overlapping (self index, other index) pair of live entities.
+
+        `other` is bucketed into a dense grid of cells (counts plus start
+        offsets, built with array operations). Its boxes are grown up and
+        left by our largest box, so each of our boxes only has to look in
+        the single cell holding its top-left corner. Only those candidates
+        get the exact box test, which also drops entities killed but not
+        compacted yet. Pairs come back sorted by self index, then other
+        index.
+        """
+        if not self._count or not other._count:
+            return _NO_PAIRS
+
+        ax, ay, aw, ah = self.boxes()
+        bx, by, bw, bh = other.boxes()
+        reach_w = int(aw.max()) - 1
+        reach_h = int(ah.max()) - 1
+        b_cx, b_cy, b_owner = _cell_entries(bx - reach_w, by - reach_h, bw + reach_w, bh + reach_h, cell_size)
+
+        # Dense grid over the cells `other` touches; our boxes outside it cannot hit
+        min_cx, min_cy = b_cx.min(), b_cy.min()
+        grid_w = int(b_cx.max() - min_cx) + 1
+        grid_h = int(b_cy.max() - min_cy) + 1
+        b_cell = (b_cx - min_cx) * grid_h + (b_cy - min_cy)
+        order = np.lexsort((b_owner, b_cell))
+        b_owner = b_owner[order]
+        cell_counts = np.bincount(b_cell, minlength=grid_w * grid_h)
+        cell_starts = np.cumsum(cell_counts) - cell_counts
+
+        a_cx = ax // cell_size - min_cx
+        a_cy = ay // cell_size - min_cy
+        a_owner = np.flatnonzero((a_cx >= 0) & (a_cx < grid_w) & (a_cy >= 0) & (a_cy < grid_h))
+        a_cell = a_cx[a_owner] * grid_h + a_cy[a_owner]
+        counts = cell_counts[a_cell]
+        total = int(counts.sum())
+        if not total:
+            return _NO_PAIRS
+
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        a_idx = np.repeat(a_owner, counts)
+        b_idx = b_owner[np.repeat(cell_starts[a_cell], counts) + offsets]
+
+        cax, cay, caw, cah = ax[a_idx], ay[a_idx], aw[a_idx], ah[a_idx]
+        cbx, cby, cbw, cbh = bx[b_idx], by[b_idx], bw[b_idx], bh[b_idx]
+        hit = (cax < cbx + cbw) & (cbx < cax + caw) & (cay < cby + cbh) & (cby < cay + cah)
+        hit &= (caw > 0) & (cah > 0) & (cbw > 0) & (cbh > 0) & self.alive[a_idx] & other.alive[b_idx]
+
+        # Each of our boxes reads one cell and `other` appears once per cell, so
+        # the pairs are unique and already ordered by (self index, other index)
+        return a_idx[hit], b_idx[hit]
+
+
+def _cell_entries(xs, ys, ws, hs, cell_size):
+    """Expand boxes into one (cell x, cell y, owner index) entry per covered grid cell."""
+    min_cx = xs // cell_size
+    min_cy = ys // cell_size
+    max_cx = (xs + np.maximum(ws, 1) - 1) // cell_size
+    max_cy = (ys + np.maximum(hs, 1) - 1) // cell_size
+    span_x = int((max_cx - min_cx).max()) + 1
+    span_y = int((max_cy - min_cy).max()) + 1
+    if span_x == 1 and span_y == 1:
+        return min_cx, min_cy, np.arange(len(xs))
+
+    owners = np.arange(len(xs))
+    cx_parts, cy_parts, owner_parts = [], [], []
+    for dx in range(span_x):
+        for dy in range(span_y):
+            covered = (min_cx + dx <= max_cx) & (min_cy + dy <= max_cy)
+            cx_parts.append(min_cx[covered] + dx)
+            cy_parts.append(min_cy[covered] + dy)
+            owner_parts.append(owners[covered])
+    return np.concatenate(cx_parts), np.concatenate(cy_parts), np.concatenate(owner_parts)
@@ -1,8 +1,10 @@
 """Main Space Combat game implementation."""
 
+import numpy as np
 import pygame
 from shared.base_game import BaseGame
 from shared.constants import MEDIUM_FONT, LARGE_FONT
+from shared.utils import render_text
 from .constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
@@ -19,29 +21,51 @@ from .constants import (
     TEXT_COLOR,
     EXPLOSION_COLOR,
     ENEMY_KILL_POINTS,
+    ENEMY_COLLISION_DAMAGE,
 )
 from . import constants as sc_const
-from .entities import Player, Enemy, Explosion
-from .physics import check_bullet_enemy_collisions, check_player_enemy_collisions
+from .entities import Player, Enemy, Bullet
+from .entity_store import EntityStore
+from .particles import ParticleSystem
+from .physics import check_bullet_enemy_collisions, resolve_player_enemy_collisions
+from .sprites import enemy_blits, sprite_cache
 
 
 class SpaceCombatGame(BaseGame):
     """Main Space Combat game class."""
 
-    def __init__(self):
+    fps = FPS
+    update_rate = FPS
+
+    def __init__(self, headless=False, seed=None):
         """Initialize the Space Combat game."""
-        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Space Combat")
+        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, "Space Combat", headless=headless, seed=seed)
         self.font = pygame.font.Font(None, MEDIUM_FONT)
         self.large_font = pygame.font.Font(None, LARGE_FONT)
         self.num_players = 1
         self.selecting = True  # show player-select screen first
+        self.held_keys = None  # key state from the last input poll
+        # Entity storage is kept across matches so its memory is reused
+        self.bullets1 = EntityStore(Bullet)
+        self.bullets2 = EntityStore(Bullet)
+        self.enemies = EntityStore(Enemy)
+        self.particles = ParticleSystem()
         self.reset_game(self.num_players)
+        # The hub plays every game in one process: put back the layout constants an earlier game resized
+        self.handle_resize(self.window_width, self.window_height)
 
     def handle_resize(self, w, h):
         """Handle window resize, updating space combat constants."""
         super().handle_resize(w, h)
         sc_const.WINDOW_WIDTH = w
         sc_const.WINDOW_HEIGHT = h
+        # Sprites were converted to the old display surface's pixel format
+        sprite_cache.clear()
+
+    def entity_count(self):
+        """Get the number of players, bullets, enemies and explosion particles."""
+        players = 1 if self.player2 is None else 2
+        return players + len(self.bullets1) + len(self.bullets2) + len(self.enemies) + len(self.particles)
 
     def reset_game(self, num_players=None):
         """Reset the game to initial state."""
@@ -70,11 +94,12 @@ class SpaceCombatGame(BaseGame):
         else:
             self.player2 = None
 
-        # Initialize game objects
-        self.bullets1 = []
-        self.bullets2 = []
-        self.enemies = []
-        self.explosions = []
+        # Clear game objects
+        self.bullets1.clear()
+        self.bullets2.clear()
+        self.enemies.clear()
+        self.particles.clear()
+        self.particles.reseed(self.seed)
 
         # Game state
         self.score1 = 0
@@ -84,11 +109,16 @@ class SpaceCombatGame(BaseGame):
         self.shoot_cooldown1 = 0
         self.shoot_cooldown2 = 0
 
+    def start_match(self, num_players=1):
+        """Leave the player-select screen and start a fresh match."""
+        self.selecting = False
+        self.reset_game(num_players)
+
     def handle_input(self):
-        """Handle input events."""
-        keys = pygame.key.get_pressed()
+        """Handle input events. Held keys are applied per update in update()."""
+        self.held_keys = self.key_state()
 
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return False
 
@@ -98,63 +128,76 @@ class SpaceCombatGame(BaseGame):
             if event.type == pygame.KEYDOWN:
                 if self.selecting:
                     if event.key == pygame.K_1:
-                        self.selecting = False
-                        self.reset_game(1)
+                        self.start_match(1)
                     elif event.key == pygame.K_2:
-                        self.selecting = False
-                        self.reset_game(2)
+                        self.start_match(2)
                     elif event.key == pygame.K_ESCAPE:
                         return False
                 elif self.game_over:
                     if event.key == pygame.K_SPACE:
                         self.selecting = True
-                    elif event.key == pygame.K_r and (pygame.key.get_mods() & pygame.KMOD_SHIFT):
+                    elif event.key == pygame.K_r and (self.key_mods() & pygame.KMOD_SHIFT):
                         self.reset_game()
                         self.game_over = False
                     elif event.key == pygame.K_ESCAPE:
                         return False
                 else:
-                    if event.key == pygame.K_r and (pygame.key.get_mods() & pygame.KMOD_SHIFT):
+                    if event.key == pygame.K_r and (self.key_mods() & pygame.KMOD_SHIFT):
                         self.selecting = True
                     elif event.key == pygame.K_ESCAPE:
                         return False
 
-        # Handle continuous input during gameplay
-        if not self.selecting and not self.game_over:
-            # Player 1: WASD + LCtrl
-            if self.player1.health > 0:
-                if keys[pygame.K_a]:
-                    self.player1.move_left()
-                if keys[pygame.K_d]:
-                    self.player1.move_right()
-                if keys[pygame.K_w]:
-                    self.player1.move_up()
-                if keys[pygame.K_s]:
-                    self.player1.move_down()
-                if keys[pygame.K_LCTRL] and self.shoot_cooldown1 <= 0:
-                    self.bullets1.append(self.player1.shoot())
-                    self.shoot_cooldown1 = 10
-            # Player 2: Arrow keys + Right Ctrl
-            if self.player2 is not None and self.player2.health > 0:
-                if keys[pygame.K_LEFT]:
-                    self.player2.move_left()
-                if keys[pygame.K_RIGHT]:
-                    self.player2.move_right()
-                if keys[pygame.K_UP]:
-                    self.player2.move_up()
-                if keys[pygame.K_DOWN]:
-                    self.player2.move_down()
-                if keys[pygame.K_RCTRL] and self.shoot_cooldown2 <= 0:
-                    self.bullets2.append(self.player2.shoot())
-                    self.shoot_cooldown2 = 10
-
         return True
 
+    def apply_held_keys(self):
+        """Move and fire for keys held during the last input poll."""
+        keys = self.held_keys
+        if keys is None:
+            return
+
+        # Player 1: WASD + LCtrl
+        if self.player1.health > 0:
+            if keys[pygame.K_a]:
+                self.player1.move_left()
+            if keys[pygame.K_d]:
+                self.player1.move_right()
+            if keys[pygame.K_w]:
+                self.player1.move_up()
+            if keys[pygame.K_s]:
+                self.player1.move_down()
+            if keys[pygame.K_LCTRL] and self.shoot_cooldown1 <= 0:
+                self.player1.shoot_into(self.bullets1)
+                self.shoot_cooldown1 = 10
+        # Player 2: Arrow keys + Right Ctrl
+        if self.player2 is not None and self.player2.health > 0:
+            if keys[pygame.K_LEFT]:
+                self.player2.move_left()
+            if keys[pygame.K_RIGHT]:
+                self.player2.move_right()
+            if keys[pygame.K_UP]:
+                self.player2.move_up()
+            if keys[pygame.K_DOWN]:
+                self.player2.move_down()
+            if keys[pygame.K_RCTRL] and self.shoot_cooldown2 <= 0:
+                self.player2.shoot_into(self.bullets2)
+                self.shoot_cooldown2 = 10
+
+    def _explode(self, enemy_indices):
+        """Burst explosion particles from the centers of enemies, read straight from the store."""
+        enemies = self.enemies
+        self.particles.burst(
+            enemies.x[enemy_indices] + enemies.width[enemy_indices] // 2,
+            enemies.y[enemy_indices] + enemies.height[enemy_indices] // 2,
+        )
+
     def update(self):
         """Update game state."""
         if self.selecting or self.game_over:
             return
 
+        # Handle continuous input during gameplay
+        self.apply_held_keys()
+
         # Update cooldowns
         if self.shoot_cooldown1 > 0:
             self.shoot_cooldown1 -= 1
@@ -164,30 +207,16 @@ class SpaceCombatGame(BaseGame):
         # Spawn enemies
         self.enemy_spawn_timer += 1
         if self.enemy_spawn_timer >= ENEMY_SPAWN_RATE:
-            self.enemies.append(Enemy.spawn_random())
+            Enemy.spawn_random_into(self.enemies, self.rng)
             self.enemy_spawn_timer = 0
 
-        # Update bullets
-        for bullet in self.bullets1[:]:
-            bullet.update()
-            if bullet.is_off_screen():
-                self.bullets1.remove(bullet)
-        for bullet in self.bullets2[:]:
-            bullet.update()
-            if bullet.is_off_screen():
-                self.bullets2.remove(bullet)
-
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update()
-            if enemy.is_off_screen():
-                self.enemies.remove(enemy)
-
-        # Update explosions
-        for explosion in self.explosions[:]:
-            explosion.update()
-            if explosion.is_finished():
-                self.explosions.remove(explosion)
+        # Update bullets and enemies (vectorized move, cull and compact)
+        self.bullets1.update(sc_const.WINDOW_HEIGHT)
+        self.bullets2.update(sc_const.WINDOW_HEIGHT)
+        self.enemies.update(sc_const.WINDOW_HEIGHT)
+
+        # Integrate explosion particles, culling the expired ones in the same pass
+        self.particles.update(self.window_width, self.window_height)
 
         # Check bullet-enemy collisions (P1 first, P2 avoids double-scoring same enemy)
         enemy_kills = set()
@@ -197,8 +226,6 @@ class SpaceCombatGame(BaseGame):
             bullets1_to_remove.add(b_idx)
             if e_idx not in enemy_kills:
                 enemy_kills.add(e_idx)
-                enemy = self.enemies[e_idx]
-                self.explosions.append(Explosion(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2))
                 self.score1 += ENEMY_KILL_POINTS
 
         bullets2_to_remove = set()
@@ -206,34 +233,26 @@ class SpaceCombatGame(BaseGame):
             bullets2_to_remove.add(b_idx)
             if e_idx not in enemy_kills:
                 enemy_kills.add(e_idx)
-                enemy = self.enemies[e_idx]
-                self.explosions.append(Explosion(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2))
                 self.score2 += ENEMY_KILL_POINTS
 
-        for b_idx in sorted(bullets1_to_remove, reverse=True):
-            if b_idx < len(self.bullets1):
-                self.bullets1.pop(b_idx)
-        for b_idx in sorted(bullets2_to_remove, reverse=True):
-            if b_idx < len(self.bullets2):
-                self.bullets2.pop(b_idx)
-        for e_idx in sorted(enemy_kills, reverse=True):
-            if e_idx < len(self.enemies):
-                self.enemies.pop(e_idx)
-
-        # Check player-enemy collisions (only for living players)
-        if self.player1.health > 0:
-            for e_idx in sorted(check_player_enemy_collisions(self.player1, self.enemies), reverse=True):
-                enemy = self.enemies[e_idx]
-                self.explosions.append(Explosion(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2))
-                self.enemies.pop(e_idx)
-                self.player1.take_damage()
-
-        if self.player2 is not None and self.player2.health > 0:
-            for e_idx in sorted(check_player_enemy_collisions(self.player2, self.enemies), reverse=True):
-                enemy = self.enemies[e_idx]
-                self.explosions.append(Explosion(enemy.x + enemy.width // 2, enemy.y + enemy.height // 2))
-                self.enemies.pop(e_idx)
-                self.player2.take_damage()
+        # Drop hit bullets with one compaction per store; killed enemies go with the rammers below
+        self.bullets1.kill(list(bullets1_to_remove))
+        self.bullets1.compact()
+        self.bullets2.kill(list(bullets2_to_remove))
+        self.bullets2.compact()
+        self.enemies.kill(list(enemy_kills))
+
+        # Check player-enemy collisions for both players in one pass (P1 first), then compact the enemies once
+        players = (self.player1, self.player2)
+        for player, hits in zip(players, resolve_player_enemy_collisions(players, self.enemies)):
+            if not len(hits):
+                continue
+            player.take_damage(len(hits) * ENEMY_COLLISION_DAMAGE)
+            self.enemies.kill(hits)
+
+        # Every enemy shot or rammed this frame explodes in one burst, then the store compacts once
+        self._explode(np.flatnonzero(~self.enemies.alive[: len(self.enemies)]))
+        self.enemies.compact()
 
         # Game over when all active players are dead
         p2_dead = self.player2 is None or self.player2.health <= 0
@@ -245,20 +264,20 @@ class SpaceCombatGame(BaseGame):
         WINDOW_WIDTH = self.window_width
         WINDOW_HEIGHT = self.window_height
         self.screen.fill(BACKGROUND_COLOR)
-        title = self.large_font.render("SPACE COMBAT", True, PLAYER_COLOR)
+        title = render_text(self.large_font, "SPACE COMBAT", True, PLAYER_COLOR)
         self.screen.blit(title, title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100)))
-        prompt = self.font.render("Select number of players", True, TEXT_COLOR)
+        prompt = render_text(self.font, "Select number of players", True, TEXT_COLOR)
         self.screen.blit(prompt, prompt.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30)))
-        opt1 = self.font.render("Press  1  —  1 Player  (WASD + LCtrl)", True, PLAYER_COLOR)
+        opt1 = render_text(self.font, "Press  1  —  1 Player  (WASD + LCtrl)", True, PLAYER_COLOR)
         self.screen.blit(opt1, opt1.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20)))
-        opt2 = self.font.render("Press  2  —  2 Players  (P2: Arrows + RCtrl)", True, PLAYER2_COLOR)
+        opt2 = render_text(self.font, "Press  2  —  2 Players  (P2: Arrows + RCtrl)", True, PLAYER2_COLOR)
         self.screen.blit(opt2, opt2.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60)))
-        esc = self.font.render("ESC: Quit", True, TEXT_COLOR)
+        esc = render_text(self.font, "ESC: Quit", True, TEXT_COLOR)
         self.screen.blit(esc, esc.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 110)))
         self.present()
 
-    def draw(self):
-        """Draw the game."""
+    def draw(self, alpha=1.0):
+        """Draw the game. Updates run at the frame rate, so alpha is not used."""
         WINDOW_WIDTH = self.window_width
         WINDOW_HEIGHT = self.window_height
         if self.selecting:
@@ -275,35 +294,34 @@ class SpaceCombatGame(BaseGame):
             if self.player2 is not None and self.player2.health > 0:
                 self.player2.draw(self.screen)
 
-            # Draw bullets (color stored per bullet)
-            for bullet in self.bullets1 + self.bullets2:
-                pygame.draw.rect(self.screen, bullet.color, bullet.get_rect())
+            # Draw bullets (color stored per bullet) straight from the store arrays
+            for bullets in (self.bullets1, self.bullets2):
+                for color, rect in bullets.color_rects():
+                    pygame.draw.rect(self.screen, color, rect)
 
-            # Draw enemies
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
+            # Draw enemies: one cached sprite each, pushed in a single blits() call
+            self.screen.blits(enemy_blits(self.enemies), doreturn=False)
 
-            # Draw explosions
-            for explosion in self.explosions:
-                pygame.draw.circle(self.screen, EXPLOSION_COLOR, (int(explosion.x), int(explosion.y)), explosion.radius)
+            # Draw explosion particles in one batched pass
+            self.particles.draw(self.screen, BACKGROUND_COLOR)
 
             # Draw HUD
             hp_bar_w, hp_bar_h = 150, 10
 
             if self.num_players == 1:
                 # Centered score
-                score_text = self.font.render(f"Score: {self.score1}", True, TEXT_COLOR)
+                score_text = render_text(self.font, f"Score: {self.score1}", True, TEXT_COLOR)
                 self.screen.blit(score_text, (WINDOW_WIDTH // 2 - score_text.get_width() // 2, 10))
                 # P1 health bar (left)
-                p1_label = self.font.render("HP", True, PLAYER_COLOR)
+                p1_label = render_text(self.font, "HP", True, PLAYER_COLOR)
                 self.screen.blit(p1_label, (10, 35))
             else:
                 # P1 score + label (left)
-                p1_label = self.font.render(f"P1  {self.score1} pts", True, PLAYER_COLOR)
+                p1_label = render_text(self.font, f"P1  {self.score1} pts", True, PLAYER_COLOR)
                 self.screen.blit(p1_label, (10, 10))
                 # P2 score + label (right)
                 p2_hud_x = WINDOW_WIDTH - 160
-                p2_label = self.font.render(f"P2  {self.score2} pts", True, PLAYER2_COLOR)
+                p2_label = render_text(self.font, f"P2  {self.score2} pts", True, PLAYER2_COLOR)
                 self.screen.blit(p2_label, (p2_hud_x, 10))
 
             # P1 health bar
@@ -312,7 +330,7 @@ class SpaceCombatGame(BaseGame):
             p1_hp_color = (0, 255, 0) if p1_pct > 0.5 else (255, 255, 0) if p1_pct > 0.25 else (255, 60, 60)
             pygame.draw.rect(self.screen, p1_hp_color, (10, 35, int(hp_bar_w * p1_pct), hp_bar_h))
             if self.player1.health <= 0:
-                self.screen.blit(self.font.render("DEAD", True, (255, 80, 80)), (10, 49))
+                self.screen.blit(render_text(self.font, "DEAD", True, (255, 80, 80)), (10, 49))
 
             # P2 health bar (2-player mode only)
             if self.player2 is not None:
@@ -322,19 +340,19 @@ class SpaceCombatGame(BaseGame):
                 p2_hp_color = (0, 255, 0) if p2_pct > 0.5 else (255, 255, 0) if p2_pct > 0.25 else (255, 60, 60)
                 pygame.draw.rect(self.screen, p2_hp_color, (p2_hud_x, 35, int(hp_bar_w * p2_pct), hp_bar_h))
                 if self.player2.health <= 0:
-                    self.screen.blit(self.font.render("DEAD", True, (255, 80, 80)), (p2_hud_x, 49))
+                    self.screen.blit(render_text(self.font, "DEAD", True, (255, 80, 80)), (p2_hud_x, 49))
 
             # Draw controls
             if self.num_players == 2:
                 ctrl = "P1: WASD+LCtrl  |  P2: Arrows+RCtrl  |  Shift+R: Restart"
             else:
                 ctrl = "Move: WASD  |  Shoot: LCtrl  |  Shift+R: Restart  |  ESC: Quit"
-            controls_text = self.font.render(ctrl, True, TEXT_COLOR)
+            controls_text = render_text(self.font, ctrl, True, TEXT_COLOR)
             self.screen.blit(controls_text, (WINDOW_WIDTH // 2 - controls_text.get_width() // 2, WINDOW_HEIGHT - 30))
 
         else:
             # Game over screen
-            game_over_text = self.large_font.render("GAME OVER", True, EXPLOSION_COLOR)
+            game_over_text = render_text(self.large_font, "GAME OVER", True, EXPLOSION_COLOR)
             if self.num_players == 2:
                 if self.score1 > self.score2:
                     result = f"P1 Wins!  ({self.score1} vs {self.score2})"
@@ -345,10 +363,10 @@ class SpaceCombatGame(BaseGame):
                 else:
                     result = f"Tie!  ({self.score1} pts each)"
                     result_color = TEXT_COLOR
-                score_text = self.font.render(result, True, result_color)
+                score_text = render_text(self.font, result, True, result_color)
             else:
-                score_text = self.font.render(f"Final Score: {self.score1}", True, TEXT_COLOR)
-            restart_text = self.font.render("SPACE: menu  |  Shift+R: replay  |  ESC: quit", True, TEXT_COLOR)
+                score_text = render_text(self.font, f"Final Score: {self.score1}", True, TEXT_COLOR)
+            restart_text = render_text(self.font, "SPACE: menu  |  Shift+R: replay  |  ESC: quit", True, TEXT_COLOR)
 
             # Center the text
             game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
@@ -360,14 +378,3 @@ class SpaceCombatGame(BaseGame):
             self.screen.blit(restart_text, restart_rect)
 
         self.present()
-
-    def run(self):
-        """Main game loop with custom timing."""
-        while self.running:
-            self.running = self.handle_input()
-            if self.running:
-                self.update()
-                self.draw()
-                self.clock.tick(FPS)
-
-        pygame.quit()
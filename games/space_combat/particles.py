@@ -0,0 +1,231 @@
+"""Array-backed particle system for Space Combat explosions.
+
+Every live particle of every explosion sits in one pool of NumPy columns:
+position, velocity, remaining lifetime, fade rate and color. A frame costs
+one vectorized integrate-and-cull step and one batched draw that writes the
+particles' pixels straight into the target surface, so the cost depends on
+the particle count rather than on the number of explosions.
+"""
+
+import numpy as np
+
+from .constants import (
+    MAX_PARTICLES,
+    EXPLOSION_PARTICLES,
+    EXPLOSION_COLORS,
+    PARTICLE_SPEED,
+    PARTICLE_LIFETIME,
+    PARTICLE_DRAG,
+    PARTICLE_GRAVITY,
+    PARTICLE_SIZE,
+)
+
+FADE_LEVELS = 16  # Shades a particle passes through from its color to the background
+
+# Columns every pool keeps, with their dtypes
+_COLUMNS = {
+    "x": np.float32,
+    "y": np.float32,
+    "vx": np.float32,
+    "vy": np.float32,
+    "life": np.float32,  # Frames left
+    "fade": np.float32,  # FADE_LEVELS / lifetime: life * fade is the particle's shade
+    "color": np.uint8,  # Index into the palette
+}
+
+
+class ParticleSystem:
+    """Pool of particles integrated, culled and drawn as whole arrays.
+
+    Live particles occupy slots [0, len(system)) in emission order, oldest
+    first. Emitting past the budget drops the oldest particles, so the
+    per-frame cost is capped however many explosions go off at once.
+    """
+
+    def __init__(self, budget=MAX_PARTICLES, palette=EXPLOSION_COLORS, capacity=1024, seed=None):
+        """Initialize an empty pool.
+
+        Args:
+            budget: Most particles alive at once
+            palette: (r, g, b) colors particles are emitted with, by index
+            capacity: Slots allocated up front; the pool doubles up to budget
+            seed: Seed for the particles' own random stream, so explosions
+                never draw from (and shift) the game's RNG
+        """
+        self.budget = budget
+        self.palette = tuple(palette)
+        self._count = 0
+        self._capacity = 0
+        for name, dtype in _COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._shades = {}  # (pixel format, background) -> pixel per (palette index, fade level)
+        self.dropped = 0  # Particles dropped early to stay within budget
+        self.reseed(seed)
+        self._grow(min(max(1, capacity), budget))
+
+    def reseed(self, seed=None):
+        """Restart the particles' random stream."""
+        self.rng = np.random.default_rng(seed)
+
+    def _grow(self, capacity):
+        """Resize every column to hold at least capacity particles (at most budget)."""
+        if capacity <= self._capacity:
+            return
+        capacity = min(max(capacity, self._capacity * 2), self.budget)
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def __len__(self):
+        """Return the number of live particles."""
+        return self._count
+
+    def clear(self):
+        """Remove every particle, keeping the memory."""
+        self._count = 0
+
+    def emit(self, xs, ys, vxs, vys, lifetimes, colors):
+        """Add particles from equal-length arrays, dropping the oldest beyond the budget.
+
+        Args:
+            xs, ys: Start positions
+            vxs, vys: Velocities, pixels per frame
+            lifetimes: Frames each particle lives (at least 1)
+            colors: Palette indices
+        """
+        skip = max(0, len(xs) - self.budget)  # More than the whole budget keeps the newest part
+        new = len(xs) - skip
+        count = self._count
+        drop = max(0, count + new - self.budget)
+        if drop:
+            for name in _COLUMNS:
+                column = getattr(self, name)
+                column[: count - drop] = column[drop:count]
+            count -= drop
+        self.dropped += drop + skip
+        self._grow(count + new)
+
+        end = count + new
+        lifetimes = np.asarray(lifetimes[skip:], dtype=np.float32)
+        self.x[count:end] = xs[skip:]
+        self.y[count:end] = ys[skip:]
+        self.vx[count:end] = vxs[skip:]
+        self.vy[count:end] = vys[skip:]
+        self.life[count:end] = lifetimes
+        self.fade[count:end] = FADE_LEVELS / lifetimes
+        self.color[count:end] = colors[skip:]
+        self._count = end
+
+    def burst(self, xs, ys, count=EXPLOSION_PARTICLES):
+        """Emit an explosion of count particles flying out in all directions from each (x, y) center."""
+        xs = np.asarray(xs, dtype=np.float32)
+        ys = np.asarray(ys, dtype=np.float32)
+        # Explosions that would be dropped within this very call are never generated
+        centers = min(len(xs), -(-self.budget // count))
+        self.dropped += (len(xs) - centers) * count
+        xs, ys = xs[len(xs) - centers :], ys[len(ys) - centers :]
+        total = centers * count
+        if not total:
+            return
+        rng = self.rng
+        angles = rng.random(total, dtype=np.float32) * np.float32(2 * np.pi)
+        low, high = PARTICLE_SPEED
+        speeds = low + rng.random(total, dtype=np.float32) * np.float32(high - low)
+        self.emit(
+            np.repeat(xs, count),
+            np.repeat(ys, count),
+            np.cos(angles) * speeds,
+            np.sin(angles) * speeds,
+            rng.integers(PARTICLE_LIFETIME[0], PARTICLE_LIFETIME[1] + 1, total),
+            rng.integers(0, len(self.palette), total, dtype=np.uint8),
+        )
+
+    def update(self, window_width, window_height):
+        """Integrate every particle one frame, then cull the expired and off-screen ones.
+
+        Survivors are compacted in one stable pass, keeping emission order.
+
+        Returns:
+            Number of particles removed
+        """
+        count = self._count
+        if not count:
+            return 0
+        x, y, vx, vy, life = (getattr(self, name)[:count] for name in ("x", "y", "vx", "vy", "life"))
+        x += vx
+        y += vy
+        vx *= PARTICLE_DRAG
+        vy *= PARTICLE_DRAG
+        vy += PARTICLE_GRAVITY
+        life -= 1
+
+        keep = life > 0
+        keep &= x > -PARTICLE_SIZE
+        keep &= x < window_width
+        keep &= y > -PARTICLE_SIZE
+        keep &= y < window_height
+        survivors = np.flatnonzero(keep)
+        kept = len(survivors)
+        if kept < count:
+            for name in _COLUMNS:
+                column = getattr(self, name)
+                column[:kept] = column[survivors]
+            self._count = kept
+        return count - kept
+
+    def _shade_table(self, surface, background):
+        """Get the mapped pixel of every (palette index, fade level) for surface's format."""
+        key = (surface.get_bitsize(), surface.get_masks(), surface.get_shifts(), tuple(background[:3]))
+        table = self._shades.get(key)
+        if table is None:
+            levels = np.arange(FADE_LEVELS + 1, dtype=np.float32) / FADE_LEVELS
+            background = np.asarray(background[:3], dtype=np.float32)
+            palette = np.asarray(self.palette, dtype=np.float32)
+            rgb = background + (palette[:, None, :] - background) * levels[None, :, None]
+            # map_rgb returns a signed int for surfaces with alpha; keep the 32-bit pattern
+            pixels = [surface.map_rgb(shade) & 0xFFFFFFFF for shade in rgb.round().reshape(-1, 3).tolist()]
+            table = self._shades[key] = np.array(pixels, dtype=np.uint32)
+        return table
+
+    def draw(self, surface, background=(0, 0, 0)):
+        """Draw every particle as a PARTICLE_SIZE square, fading into background as it ages.
+
+        Pixels are written straight into 16- and 32-bit surfaces, one scatter
+        per pixel of the square, and squares at an edge are nudged inside it.
+        Other formats fall back to a fill per particle.
+        """
+        count = self._count
+        if not count:
+            return
+        shades = self._shade_table(surface, background)
+        levels = (self.life[:count] * self.fade[:count]).astype(np.intp)
+        np.minimum(levels, FADE_LEVELS, out=levels)
+        levels += self.color[:count] * (FADE_LEVELS + 1)
+        pixels = shades[levels]
+
+        width, height = surface.get_size()
+        xs = np.clip(self.x[:count], 0, width - PARTICLE_SIZE).astype(np.intp)
+        ys = np.clip(self.y[:count], 0, height - PARTICLE_SIZE).astype(np.intp)
+        bytesize = surface.get_bytesize()
+        if bytesize not in (2, 4):
+            for x, y, pixel in zip(xs.tolist(), ys.tolist(), pixels.tolist()):
+                surface.fill(pixel, (x, y, PARTICLE_SIZE, PARTICLE_SIZE))
+            return
+
+        # The buffer locks the surface until it is released
+        buffer = surface.get_buffer()
+        try:
+            target = np.frombuffer(buffer, dtype=np.uint16 if bytesize == 2 else np.uint32)
+            row = surface.get_pitch() // bytesize
+            offsets = ys * row
+            offsets += xs
+            pixels = pixels.astype(target.dtype, copy=False)
+            for dy in range(PARTICLE_SIZE):
+                for dx in range(PARTICLE_SIZE):
+                    target[offsets + (dy * row + dx)] = pixels
+            del target
+        finally:
+            del buffer
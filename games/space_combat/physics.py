@@ -1,21 +1,60 @@
 """Physics and collision utilities for Space Combat game."""
 
+import numpy as np
+
+from .entity_store import EntityStore
+from .spatial_hash import SpatialHash, DEFAULT_CELL_SIZE
+
+# Enemy counts up to this are resolved in pure Python, which beats NumPy's per-call overhead there
+SMALL_ENEMY_COUNT = 48
+
 
 def check_collision(rect1, rect2):
     """Check if two rectangles collide."""
     return rect1.colliderect(rect2)
 
 
-def check_bullet_enemy_collisions(bullets, enemies):
+def _box(entity):
+    """Get an entity's integer (x, y, width, height) box, truncated like pygame.Rect."""
+    return int(entity.x), int(entity.y), int(entity.width), int(entity.height)
+
+
+def _boxes_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Check two boxes for overlap with the same rules as Rect.colliderect."""
+    if aw <= 0 or ah <= 0 or bw <= 0 or bh <= 0:
+        return False
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def check_bullet_enemy_collisions(bullets, enemies, cell_size=DEFAULT_CELL_SIZE):
     """Check collisions between bullets and enemies.
 
+    Enemies are bucketed into a spatial hash once, so each bullet is only
+    tested against the enemies that share a grid cell with it.
+
     Returns:
-        List of (bullet_index, enemy_index) tuples for collisions
+        List of (bullet_index, enemy_index) tuples for collisions, ordered by
+        bullet index and then enemy index
     """
     collisions = []
+    if not bullets or not enemies:
+        return collisions
+
+    if isinstance(bullets, EntityStore) and isinstance(enemies, EntityStore):
+        bullet_idx, enemy_idx = bullets.overlap_pairs(enemies, cell_size)
+        return list(zip(bullet_idx.tolist(), enemy_idx.tolist()))
+
+    grid = SpatialHash(cell_size)
+    enemy_boxes = []
+    for enemy_idx, enemy in enumerate(enemies):
+        box = _box(enemy)
+        enemy_boxes.append(box)
+        grid.insert(enemy_idx, *box)
+
     for bullet_idx, bullet in enumerate(bullets):
-        for enemy_idx, enemy in enumerate(enemies):
-            if check_collision(bullet.get_rect(), enemy.get_rect()):
+        bx, by, bw, bh = _box(bullet)
+        for enemy_idx in grid.query(bx, by, bw, bh):
+            if _boxes_overlap(bx, by, bw, bh, *enemy_boxes[enemy_idx]):
                 collisions.append((bullet_idx, enemy_idx))
     return collisions
 
@@ -26,9 +65,76 @@ def check_player_enemy_collisions(player, enemies):
     Returns:
         List of enemy indices that collided with player
     """
+    if isinstance(enemies, EntityStore):
+        return np.flatnonzero(enemies.overlap_mask(player.x, player.y, player.width, player.height)).tolist()
+
     collisions = []
     player_rect = player.get_rect()
     for enemy_idx, enemy in enumerate(enemies):
         if check_collision(player_rect, enemy.get_rect()):
             collisions.append(enemy_idx)
     return collisions
+
+
+def resolve_player_enemy_collisions(players, enemies):
+    """Find the enemies ramming each player, in one batched pass over the enemies.
+
+    Every player's box is tested against every enemy at once. An enemy
+    touching several players only counts against the first of them, as if
+    each player were resolved in turn and its enemies removed before the
+    next: player 1 resolves first.
+
+    Args:
+        players: Players in resolution order; None and dead (health <= 0)
+            entries get no hits
+        enemies: EntityStore of enemies; entities already killed (flagged but
+            not yet compacted) are ignored
+
+    Returns:
+        One ascending array of enemy indices per player
+    """
+    count = len(enemies)
+    live = [player is not None and player.health > 0 for player in players]
+    if not count or not any(live):
+        return [np.empty(0, dtype=np.intp) for _ in players]
+    if count <= SMALL_ENEMY_COUNT:
+        return _resolve_few_player_enemy_collisions(players, live, enemies)
+
+    # (players, 1) boxes against (enemies,) columns broadcast to one (players, enemies) test
+    px, py, pw, ph = (
+        np.array([[int(getattr(player, name)) if alive else 0] for player, alive in zip(players, live)])
+        for name in ("x", "y", "width", "height")
+    )
+    xs, ys, ws, hs = enemies.boxes()
+    hits = (xs < px + pw) & (px < xs + ws) & (ys < py + ph) & (py < ys + hs)
+    hits &= (pw > 0) & (ph > 0) & (ws > 0) & (hs > 0) & enemies.alive[:count]
+
+    # An enemy claimed by an earlier player is gone by the time later players resolve
+    claimed = np.zeros(count, dtype=bool)
+    for row in hits:
+        row &= ~claimed
+        claimed |= row
+    return [np.flatnonzero(row) for row in hits]
+
+
+def _resolve_few_player_enemy_collisions(players, live, enemies):
+    """resolve_player_enemy_collisions for a few enemies: one Python loop over their columns."""
+    boxes = []
+    for index, (player, alive) in enumerate(zip(players, live)):
+        if alive:
+            x, y, width, height = _box(player)
+            if width > 0 and height > 0:
+                boxes.append((index, x, y, x + width, y + height))
+    hits = [[] for _ in players]
+    count = len(enemies)
+    columns = [getattr(enemies, name)[:count].tolist() for name in ("x", "y", "width", "height", "alive")]
+    for index, (x, y, width, height, alive) in enumerate(zip(*columns)):
+        if not alive or width <= 0 or height <= 0:
+            continue
+        x, y = int(x), int(y)
+        # The first player touching the enemy claims it
+        for player, left, top, right, bottom in boxes:
+            if x < right and left < x + width and y < bottom and top < y + height:
+                hits[player].append(index)
+                break
+    return [np.array(row, dtype=np.intp) for row in hits]
@@ -0,0 +1,93 @@
+"""Batch simulation hooks for Space Combat (see shared.batch).
+
+Policies fly player 1 of a one-player match with A/D and fire with LCtrl.
+"""
+
+import pygame
+from shared.batch import HeldKeys, NO_KEYS
+from .game import SpaceCombatGame
+
+PARAMETERS = {
+    "ENEMY_SPAWN_RATE": (("games.space_combat.game", "ENEMY_SPAWN_RATE"),),
+    "ENEMY_SPEED": (("games.space_combat.entities", "ENEMY_SPEED"),),
+    "PLAYER_SPEED": (("games.space_combat.entities", "PLAYER_SPEED"),),
+}
+
+FIRE = HeldKeys((pygame.K_LCTRL,))
+LEFT_FIRE = HeldKeys((pygame.K_a, pygame.K_LCTRL))
+RIGHT_FIRE = HeldKeys((pygame.K_d, pygame.K_LCTRL))
+RANDOM_CHOICES = (NO_KEYS, FIRE, LEFT_FIRE, RIGHT_FIRE, HeldKeys((pygame.K_a,)), HeldKeys((pygame.K_d,)))
+RANDOM_HOLD_UPDATES = 15  # Updates a random key choice is held for
+AIM_TOLERANCE = 4  # Pixels the ship's center may be off its target's before it moves
+
+
+def idle_policy(rng):
+    """Sit still without firing."""
+
+    def act(game):
+        return NO_KEYS, ()
+
+    return act
+
+
+def turret_policy(rng):
+    """Sit still, firing whenever possible."""
+
+    def act(game):
+        return FIRE, ()
+
+    return act
+
+
+def random_policy(rng):
+    """Hold a random mix of move and fire keys, re-picked every RANDOM_HOLD_UPDATES updates."""
+    held = NO_KEYS
+
+    def act(game):
+        nonlocal held
+        if game.steps % RANDOM_HOLD_UPDATES == 0:
+            held = rng.choice(RANDOM_CHOICES)
+        return held, ()
+
+    return act
+
+
+def hunter_policy(rng):
+    """Line up under the lowest enemy and keep firing."""
+
+    def act(game):
+        enemies = game.enemies
+        count = len(enemies)
+        if not count:
+            return FIRE, ()
+        lowest = enemies.y[:count].argmax()
+        target = enemies.x[lowest] + enemies.width[lowest] / 2
+        player = game.player1
+        offset = target - (player.x + player.width / 2)
+        if offset < -AIM_TOLERANCE:
+            return LEFT_FIRE, ()
+        if offset > AIM_TOLERANCE:
+            return RIGHT_FIRE, ()
+        return FIRE, ()
+
+    return act
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "turret": turret_policy,
+    "random": random_policy,
+    "hunter": hunter_policy,
+}
+
+
+def new_game(seed):
+    """Build a headless one-player Space Combat match."""
+    game = SpaceCombatGame(headless=True, seed=seed)
+    game.start_match(1)
+    return game
+
+
+def episode_metrics(game):
+    """Get the score and the health left."""
+    return {"score": game.score1, "health": max(0, game.player1.health)}
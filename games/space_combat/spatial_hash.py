@@ -0,0 +1,64 @@
+"""Uniform-grid spatial hash used as a collision broad phase."""
+
+# Cell edge in pixels. Roughly twice the largest entity so most boxes touch
+# one to four cells.
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialHash:
+    """Buckets axis-aligned boxes into square grid cells.
+
+    Insert every candidate once per frame, then query with another box to get
+    the indices of everything that shares at least one cell with it.
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """Initialize an empty hash with the given cell size in pixels."""
+        self.cell_size = cell_size
+        self._cells = {}
+
+    def __len__(self):
+        """Return the number of occupied cells."""
+        return len(self._cells)
+
+    def clear(self):
+        """Remove every entry, keeping the cell size."""
+        self._cells.clear()
+
+    def _cell_span(self, x, y, width, height):
+        """Get the inclusive (min_cx, min_cy, max_cx, max_cy) cell range of a box."""
+        size = self.cell_size
+        return (
+            x // size,
+            y // size,
+            (x + max(width, 1) - 1) // size,
+            (y + max(height, 1) - 1) // size,
+        )
+
+    def insert(self, index, x, y, width, height):
+        """Add the box with the given index to every cell it overlaps."""
+        cells = self._cells
+        min_cx, min_cy, max_cx, max_cy = self._cell_span(x, y, width, height)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def query(self, x, y, width, height):
+        """Get the indices stored in any cell the box overlaps, in ascending order."""
+        cells = self._cells
+        min_cx, min_cy, max_cx, max_cy = self._cell_span(x, y, width, height)
+        if min_cx == max_cx and min_cy == max_cy:
+            # Single cell: the bucket is already in insertion order
+            return cells.get((min_cx, min_cy), ())
+
+        found = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
@@ -0,0 +1,155 @@
+"""Pre-rendered ship sprites for Space Combat.
+
+Each ship design is rasterized once per (size, color scheme) into a
+per-pixel-alpha Surface and then drawn with a single blit, instead of
+rebuilding its polygons and issuing several pygame.draw calls every frame.
+"""
+
+import pygame
+
+# Ship shapes reach one pixel past their right and bottom edges (polygon
+# end points), and the player's exhaust circle hangs 4 more pixels below
+SPRITE_PADDING = (1, 5)
+
+ENEMY_BODY_COLOR = (200, 30, 30)
+ENEMY_OUTLINE_COLOR = (255, 90, 90)
+ENEMY_ACCENT_COLOR = (255, 100, 100)
+ENEMY_EYE_COLOR = (255, 50, 50)
+ENEMY_PUPIL_COLOR = (255, 210, 210)
+
+
+def draw_player_ship(surface, x, y, width, height, body_color, outline_color):
+    """Draw the player spaceship, pointing upward, with its box at (x, y)."""
+    cx = x + width // 2
+
+    # Main body polygon — swept-wing arrow pointing up
+    body = [
+        (cx, y),  # nose tip
+        (cx + 7, y + 18),  # right shoulder
+        (x + width, y + height),  # right wing tip
+        (cx + 5, y + height - 5),  # right wing inner notch
+        (cx, y + height - 7),  # center back notch
+        (cx - 5, y + height - 5),  # left wing inner notch
+        (x, y + height),  # left wing tip
+        (cx - 7, y + 18),  # left shoulder
+    ]
+    pygame.draw.polygon(surface, body_color, body)
+    pygame.draw.polygon(surface, outline_color, body, 1)
+
+    # Engine exhaust flame
+    pygame.draw.rect(surface, (255, 160, 0), (cx - 4, y + height - 5, 8, 5))
+    pygame.draw.circle(surface, (255, 80, 0), (cx, y + height), 4)
+
+    # Cockpit dome
+    pygame.draw.ellipse(surface, (160, 225, 255), (cx - 5, y + 7, 10, 9))
+    pygame.draw.ellipse(surface, (220, 245, 255), (cx - 3, y + 8, 6, 5))
+
+
+def draw_enemy_ship(surface, x, y, width, height):
+    """Draw the enemy alien fighter, pointing downward, with its box at (x, y)."""
+    cx = x + width // 2
+
+    # Main body — wide angular craft with swept wings pointing down
+    body = [
+        (cx, y + height),  # front tip (nose pointing down)
+        (cx + 5, y + 12),  # right inner
+        (x + width, y + 4),  # right wing outer tip
+        (x + width - 4, y),  # right wing leading edge
+        (cx + 5, y + 5),  # right inner top
+        (cx - 5, y + 5),  # left inner top
+        (x + 4, y),  # left wing leading edge
+        (x, y + 4),  # left wing outer tip
+        (cx - 5, y + 12),  # left inner
+    ]
+    pygame.draw.polygon(surface, ENEMY_BODY_COLOR, body)
+    pygame.draw.polygon(surface, ENEMY_OUTLINE_COLOR, body, 1)
+
+    # Wing accent lines
+    pygame.draw.line(surface, ENEMY_ACCENT_COLOR, (x + 6, y + 3), (cx - 2, y + 10), 1)
+    pygame.draw.line(surface, ENEMY_ACCENT_COLOR, (x + width - 6, y + 3), (cx + 2, y + 10), 1)
+
+    # Glowing sensor / eye
+    pygame.draw.circle(surface, ENEMY_EYE_COLOR, (cx, y + 7), 4)
+    pygame.draw.circle(surface, ENEMY_PUPIL_COLOR, (cx, y + 7), 2)
+
+
+class SpriteCache:
+    """Ship sprites keyed by (design, size, colors).
+
+    A size or color change simply looks up a different key. clear() drops
+    everything, and should be called when the display surface is recreated
+    (window resize) so sprites are converted to the new pixel format.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.hits = 0
+        self.misses = 0
+        self._sprites = {}
+
+    def __len__(self):
+        """Return the number of cached sprites."""
+        return len(self._sprites)
+
+    def clear(self):
+        """Drop every cached sprite."""
+        self._sprites.clear()
+
+    def get(self, draw_ship, width, height, *colors):
+        """Get the sprite of a ship design, rasterizing it on first use.
+
+        Args:
+            draw_ship: draw_player_ship or draw_enemy_ship
+            width: Ship width in pixels
+            height: Ship height in pixels
+            *colors: Extra color arguments draw_ship takes
+
+        Returns:
+            Surface to blit at the ship's (x, y); shared, do not draw on it
+        """
+        key = (draw_ship, width, height, *colors)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        pad_x, pad_y = SPRITE_PADDING
+        sprite = pygame.Surface((width + pad_x, height + pad_y), pygame.SRCALPHA)
+        draw_ship(sprite, 0, 0, width, height, *colors)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        self._sprites[key] = sprite
+        return sprite
+
+
+# Cache shared by all Space Combat entities
+sprite_cache = SpriteCache()
+
+
+def player_sprite(width, height, body_color, outline_color):
+    """Get the cached player ship sprite for a size and color scheme."""
+    return sprite_cache.get(draw_player_ship, width, height, tuple(body_color), tuple(outline_color))
+
+
+def enemy_sprite(width, height):
+    """Get the cached enemy ship sprite for a size."""
+    return sprite_cache.get(draw_enemy_ship, width, height)
+
+
+def enemy_blits(enemies):
+    """Build a Surface.blits() sequence drawing every enemy in an EntityStore.
+
+    Args:
+        enemies: EntityStore of Enemy entities
+
+    Returns:
+        List of (sprite, (x, y)) pairs
+    """
+    xs, ys, widths, heights = (column.tolist() for column in enemies.boxes())
+    if len(set(widths)) <= 1 and len(set(heights)) <= 1:
+        if not xs:
+            return []
+        sprite = enemy_sprite(widths[0], heights[0])
+        return [(sprite, position) for position in zip(xs, ys)]
+    return [(enemy_sprite(w, h), (x, y)) for x, y, w, h in zip(xs, ys, widths, heights)]
@@ -1,4 +1,10 @@
-"""Constants specific to the Typing game."""
+"""Constants specific to the Typing game.
+
+Importing this module has no side effects: the system-dependent font sizes
+are only measured when first used.
+"""
+
+import os
 
 from shared.constants import BLACK, WHITE, GREEN, RED, YELLOW, CYAN
 
@@ -11,6 +17,7 @@ MAXIMIZE_WINDOW = False  # Start with normal resizable window
 # Game settings
 FPS = 60
 LIVES = 3
+LOCKED_TARGET = False  # Lock onto the first word typed until it is finished (Backspace releases it)
 
 # Level progression
 LEVEL_UP_SCORE = 30  # Points needed to advance to next level
@@ -25,12 +32,23 @@ BASE_SPAWN_RATE = 120  # 2 seconds at 60 FPS
 MIN_SPAWN_RATE = 30  # Fastest spawn rate
 
 
-# Word settings - System font sizes
+# Word settings - System font sizes, measured on first use (see font_sizes())
+# On-disk cache of measured font sizes, keyed by pygame, SDL_ttf and default font
+FONT_SIZE_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "python-games",
+    "font_sizes.json",
+)
+# Lazily resolved module attributes -> font_sizes() keys
+_FONT_SIZE_NAMES = {"WORD_FONT_SIZE": "word", "UI_FONT_SIZE": "ui", "TITLE_FONT_SIZE": "title"}
+_font_sizes = None
+
+
 def get_system_font_sizes():
     """Get appropriate font sizes based on system defaults."""
     import pygame
 
-    pygame.init()
+    pygame.font.init()
 
     # Get system default font
     default_font = pygame.font.Font(None, 0)  # Size 0 gets system default
@@ -54,11 +72,68 @@ def get_system_font_sizes():
     }
 
 
-# Get system-appropriate font sizes
-_font_sizes = get_system_font_sizes()
-WORD_FONT_SIZE = _font_sizes["word"]
-UI_FONT_SIZE = _font_sizes["ui"]
-TITLE_FONT_SIZE = _font_sizes["title"]
+def font_sizes():
+    """Get the word, ui and title font sizes, measuring them at most once per font.
+
+    The first call in a process looks the sizes up in FONT_SIZE_CACHE and
+    only measures (see get_system_font_sizes()) on a miss, storing the
+    result; the cache is keyed by the pygame and SDL_ttf versions and the
+    default font, so upgrading any of them measures again. Later calls
+    return the same dict, which must not be modified.
+
+    Returns:
+        Dict with "word", "ui" and "title" sizes in pixels
+    """
+    global _font_sizes
+    if _font_sizes is None:
+        import pygame.font
+
+        ttf_version = ".".join(map(str, pygame.font.get_sdl_ttf_version()))
+        key = f"pygame {pygame.version.ver}, SDL_ttf {ttf_version}, {pygame.font.get_default_font()}"
+        cache = _read_font_size_cache()
+        sizes = cache.get(key)
+        if not isinstance(sizes, dict) or set(sizes) != set(_FONT_SIZE_NAMES.values()):
+            sizes = get_system_font_sizes()
+            cache[key] = sizes
+            _write_font_size_cache(cache)
+        _font_sizes = sizes
+    return _font_sizes
+
+
+def _read_font_size_cache():
+    """Load the font size cache, or an empty one if it is missing or unreadable."""
+    import json
+
+    try:
+        with open(FONT_SIZE_CACHE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_font_size_cache(cache):
+    """Save the font size cache; failing to (e.g. a read-only home) only costs a re-measure."""
+    import json
+
+    try:
+        os.makedirs(os.path.dirname(FONT_SIZE_CACHE), exist_ok=True)
+        temp_path = f"{FONT_SIZE_CACHE}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        # Replace in one step so a concurrent reader never sees a half-written file
+        os.replace(temp_path, FONT_SIZE_CACHE)
+    except OSError:
+        pass
+
+
+def __getattr__(name):
+    """Resolve WORD_FONT_SIZE, UI_FONT_SIZE and TITLE_FONT_SIZE on first use, via font_sizes()."""
+    size = _FONT_SIZE_NAMES.get(name)
+    if size is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return font_sizes()[size]
+
 
 # Colors
 BACKGROUND_COLOR = BLACK
@@ -132,3 +207,8 @@ LEVEL_WORDS = {
 # Scoring
 SCORE_PER_CHAR = 1
 LEVEL_BONUS = 50
+
+# Spawn layout
+SPAWN_Y = -50  # Top of newly spawned words
+WORD_SPACING = 10  # Pixels kept clear around a spawned word, across and below
+SPAWN_ATTEMPTS = 8  # Random x positions tried before a spawn waits for room
@@ -11,19 +11,30 @@ from .constants import (
     LEVEL_WORDS,
     MAX_LEVEL,
 )
+from .glyph_atlas import glyph_atlas
 
 
 class FallingWord:
     """A word that falls from the top of the screen."""
 
     def __init__(self, text, x, y, fall_speed, font):
-        """Initialize a falling word."""
+        """Initialize a falling word.
+
+        Its size is measured once, from the glyph atlas's width cache
+        shared by every word with the same font, and kept in a Rect that
+        update() moves in place.
+        """
         self.text = text.lower()
         self.original_text = text.lower()
         self.x = x
         self.y = y
         self.fall_speed = fall_speed
         self.font = font
+        self.typed_atlas = glyph_atlas(font, TYPED_COLOR)
+        self.word_atlas = glyph_atlas(font, WORD_COLOR)
+        self.width = self.word_atlas.width(self.text)
+        self.height = self.word_atlas.height
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         self.typed_chars = 0  # Number of characters correctly typed
         self.completed = False
         self.missed = False
@@ -31,6 +42,7 @@ class FallingWord:
     def update(self):
         """Update word position."""
         self.y += self.fall_speed
+        self.rect.y = self.y
 
     def is_off_screen(self):
         """Check if word has fallen off the bottom of the screen."""
@@ -58,31 +70,29 @@ class FallingWord:
         """Get the part of the word that has been typed."""
         return self.text[: self.typed_chars]
 
-    def draw(self, screen):
-        """Draw the word on screen with typed portion in different color."""
-        if self.completed:
-            return
+    def blits(self):
+        """Get Surface.blits() entries drawing the word from glyph atlases.
 
-        # Draw typed portion in green
-        if self.typed_chars > 0:
-            typed_surface = self.font.render(self.get_typed_text(), True, TYPED_COLOR)
-            screen.blit(typed_surface, (self.x, self.y))
+        The typed portion is drawn in a different color; a completed word
+        draws nothing.
+        """
+        if self.completed:
+            return []
 
-            # Calculate x offset for remaining text
-            typed_width = typed_surface.get_width()
-        else:
-            typed_width = 0
+        # Typed portion in green, then the remaining portion in white right after it
+        typed_text = self.get_typed_text()
+        entries = self.typed_atlas.blits(typed_text, self.x, self.y)
+        remaining_x = self.x + self.typed_atlas.width(typed_text)
+        entries += self.word_atlas.blits(self.get_remaining_text(), remaining_x, self.y)
+        return entries
 
-        # Draw remaining portion in white
-        remaining_text = self.get_remaining_text()
-        if remaining_text:
-            remaining_surface = self.font.render(remaining_text, True, WORD_COLOR)
-            screen.blit(remaining_surface, (self.x + typed_width, self.y))
+    def draw(self, screen):
+        """Draw the word on screen with typed portion in different color."""
+        screen.blits(self.blits(), doreturn=False)
 
     def get_rect(self):
-        """Get pygame rect for collision detection."""
-        full_text = self.font.render(self.text, True, WORD_COLOR)
-        return pygame.Rect(self.x, self.y, full_text.get_width(), full_text.get_height())
+        """Get pygame rect for collision detection. It is updated in place; do not modify it."""
+        return self.rect
 
 
 class GameState:
@@ -1,8 +1,9 @@
 """Main Typing game implementation."""
 
 import pygame
-import random
-from shared.base_game import BaseGame
+from shared.base_game import BaseGame, init_pygame
+from shared.entity_list import EntityList
+from shared.utils import render_text
 from . import constants as typing_const
 from .constants import (
     WINDOW_WIDTH,
@@ -10,24 +11,40 @@ from .constants import (
     FULLSCREEN,
     MAXIMIZE_WINDOW,
     FPS,
-    WORD_FONT_SIZE,
-    UI_FONT_SIZE,
-    TITLE_FONT_SIZE,
     BACKGROUND_COLOR,
     WORD_COLOR,
     UI_COLOR,
     MISSED_COLOR,
+    LOCKED_TARGET,
+    SPAWN_Y,
+    WORD_SPACING,
+    SPAWN_ATTEMPTS,
+    font_sizes,
 )
 from .entities import FallingWord, GameState
+from .glyph_atlas import glyph_atlas
+from .layout import IntervalSet
+from .word_index import WordIndex
 
 
 class TypingGame(BaseGame):
     """Main Typing game class."""
 
-    def __init__(self):
-        """Initialize the Typing game."""
+    fps = FPS
+    update_rate = FPS
+
+    def __init__(self, headless=False, seed=None, locked_target=LOCKED_TARGET):
+        """Initialize the Typing game.
+
+        Args:
+            headless: Run without a window; frames are only drawn on request
+            seed: Seed for the game's RNG stream (None = pick one at random)
+            locked_target: Send keystrokes only to the word being typed until it is finished
+        """
         # Initialize pygame
-        pygame.init()
+        self.headless = headless
+        self.reseed(seed)
+        init_pygame(headless)
 
         # Store display mode
         self.is_fullscreen = FULLSCREEN
@@ -35,7 +52,13 @@ class TypingGame(BaseGame):
         # Update global constants for window dimensions
         global WINDOW_WIDTH, WINDOW_HEIGHT
 
-        if FULLSCREEN:
+        if headless:
+            # No window: simulate at the default window size, render off-screen on request
+            WINDOW_WIDTH = 800
+            WINDOW_HEIGHT = 600
+            self.screen = None
+            self.is_fullscreen = False
+        elif FULLSCREEN:
             # Create true fullscreen display (no title bar)
             info = pygame.display.Info()
             WINDOW_WIDTH = info.current_w
@@ -63,53 +86,97 @@ class TypingGame(BaseGame):
         self.running = True
         self.window_width = WINDOW_WIDTH
         self.window_height = WINDOW_HEIGHT
+        self.reset_step_counter()
 
         # Initialize fonts with system default font
         # Try to get system default font, fallback to pygame default
+        sizes = font_sizes()
         try:
             system_font_name = pygame.font.get_default_font()
-            self.word_font = pygame.font.Font(system_font_name, WORD_FONT_SIZE)
-            self.ui_font = pygame.font.Font(system_font_name, UI_FONT_SIZE)
-            self.title_font = pygame.font.Font(system_font_name, TITLE_FONT_SIZE)
+            self.word_font = pygame.font.Font(system_font_name, sizes["word"])
+            self.ui_font = pygame.font.Font(system_font_name, sizes["ui"])
+            self.title_font = pygame.font.Font(system_font_name, sizes["title"])
         except Exception:
             # Fallback to pygame's built-in font
-            self.word_font = pygame.font.Font(None, WORD_FONT_SIZE)
-            self.ui_font = pygame.font.Font(None, UI_FONT_SIZE)
-            self.title_font = pygame.font.Font(None, TITLE_FONT_SIZE)
+            self.word_font = pygame.font.Font(None, sizes["word"])
+            self.ui_font = pygame.font.Font(None, sizes["ui"])
+            self.title_font = pygame.font.Font(None, sizes["title"])
 
         # Initialize game state
         self.game_state = GameState()
-        self.falling_words = []
+        self.falling_words = EntityList()
+        self.word_index = WordIndex(locked=locked_target)  # Live words by next expected character
+        self.spawn_lanes = IntervalSet()  # x-ranges taken by words still near the spawn line
+        self.words_near_top = {}  # word -> start of its spawn lane, in spawn order
         self.spawn_timer = 0
         self.game_over = False
         self.current_input = ""
+        # The hub plays every game in one process: put back the layout constants an earlier game resized
+        self.handle_resize(self.window_width, self.window_height)
+
+    def entity_count(self):
+        """Get the number of falling words."""
+        return len(self.falling_words)
 
     def reset_game(self):
         """Reset the game to initial state."""
         self.game_state.reset()
-        self.falling_words = []
+        self.falling_words.clear()
+        self.word_index.clear()
+        self.spawn_lanes.clear()
+        self.words_near_top.clear()
         self.spawn_timer = 0
         self.game_over = False
         self.current_input = ""
 
     def spawn_word(self):
-        """Spawn a new falling word."""
+        """Spawn a new falling word at a random x clear of the words still near the top.
+
+        Returns:
+            True if it spawned; False if no clear spot turned up, so the
+            spawn should be retried on a later update
+        """
         word_list = self.game_state.get_word_list()
-        word = random.choice(word_list)
+        word = self.rng.choice(word_list)
 
-        # Random x position with some margin
-        word_surface = self.word_font.render(word, True, WORD_COLOR)
-        word_width = word_surface.get_width()
+        # Random x position with some margin, away from the words above the spawn line
+        word_width = glyph_atlas(self.word_font, WORD_COLOR).width(word.lower())
         max_x = WINDOW_WIDTH - word_width - 20
-        x = random.randint(20, max(20, max_x))
+        for _ in range(SPAWN_ATTEMPTS):
+            x = self.rng.randint(20, max(20, max_x))
+            if not self.spawn_lanes.overlaps(x - WORD_SPACING, x + word_width + WORD_SPACING):
+                break
+        else:
+            return False
 
         fall_speed = self.game_state.get_fall_speed()
-        falling_word = FallingWord(word, x, -50, fall_speed, self.word_font)
+        falling_word = FallingWord(word, x, SPAWN_Y, fall_speed, self.word_font)
         self.falling_words.append(falling_word)
+        self.word_index.add(falling_word)
+        self.spawn_lanes.add(x, x + falling_word.width)
+        self.words_near_top[falling_word] = x
+        return True
+
+    def leave_spawn_lane(self, word):
+        """Free the spawn lane of a word, if it still holds one."""
+        x = self.words_near_top.pop(word, None)
+        if x is not None:
+            self.spawn_lanes.remove(x)
+
+    def free_spawn_lanes(self):
+        """Free the lanes of the oldest words once they have fallen clear of the spawn line."""
+        near_top = self.words_near_top
+        while near_top:
+            word = next(iter(near_top))
+            if word.rect.top < SPAWN_Y + word.height + WORD_SPACING:
+                # Words behind it spawned later, so are no further down (unless a
+                # level-up sped them up, in which case they are freed a little late)
+                break
+            self.spawn_lanes.remove(near_top.pop(word))
 
     def handle_input(self):
         """Handle input events."""
-        for event in pygame.event.get():
+        for event in self.poll_events():
             if event.type == pygame.QUIT:
                 return False
 
@@ -130,8 +197,9 @@ class TypingGame(BaseGame):
                         # Toggle fullscreen mode
                         self.toggle_fullscreen()
                     elif event.key == pygame.K_BACKSPACE:
-                        # Clear current input
+                        # Clear current input and let go of the locked target
                         self.current_input = ""
+                        self.word_index.release()
                     else:
                         # Handle character input
                         char = event.unicode
@@ -153,23 +221,24 @@ class TypingGame(BaseGame):
         """Handle character input for typing."""
         char = char.lower()
 
-        # Try to match character with falling words
-        for word in self.falling_words:
-            if not word.completed and word.type_char(char):
-                if word.completed:
-                    # Word completed!
-                    self.game_state.add_score(len(word.text))
-                    self.falling_words.remove(word)
-
-                    # Check for level up
-                    if self.game_state.should_level_up():
-                        self.game_state.level_up()
-                break
+        # The index picks the word expecting this character, without scanning the screen
+        word = self.word_index.type_char(char)
+        if word is not None and word.completed:
+            # Word completed! It stops drawing and leaves falling_words on the next update
+            self.game_state.add_score(len(word.text))
+            self.leave_spawn_lane(word)
+
+            # Check for level up
+            if self.game_state.should_level_up():
+                self.game_state.level_up()
 
     def toggle_fullscreen(self):
         """Toggle between windowed, maximized, and fullscreen modes."""
         global FULLSCREEN, MAXIMIZE_WINDOW, WINDOW_WIDTH, WINDOW_HEIGHT
 
+        if self.headless:
+            return
+
         if not MAXIMIZE_WINDOW and not FULLSCREEN:
             # Currently windowed -> switch to maximized
             MAXIMIZE_WINDOW = True
@@ -211,44 +280,53 @@ class TypingGame(BaseGame):
 
         # Spawn new words
         self.spawn_timer += 1
-        if self.spawn_timer >= self.game_state.get_spawn_rate():
-            self.spawn_word()
+        if self.spawn_timer >= self.game_state.get_spawn_rate() and self.spawn_word():
             self.spawn_timer = 0
 
-        # Update falling words
-        for word in self.falling_words[:]:
-            word.update()
-
-            # Remove words that fell off screen
-            if word.is_off_screen():
-                if not word.completed:
-                    self.game_state.miss_word()
-                self.falling_words.remove(word)
+        # Update falling words, dropping completed ones and those that fell off screen in one pass
+        self.falling_words.update(self.step_word)
+        self.free_spawn_lanes()
+
+    def step_word(self, word):
+        """Move a falling word for one update.
+
+        Returns:
+            False if the word is done (completed or fallen off screen), else True
+        """
+        if word.completed:
+            return False
+        word.update()
+        if word.is_off_screen():
+            self.game_state.miss_word()
+            self.word_index.remove(word)
+            return False
+        return True
 
     def draw_ui(self):
         """Draw the user interface."""
         # Draw level
-        level_text = self.ui_font.render(f"Level: {self.game_state.level}", True, UI_COLOR)
+        level_text = render_text(self.ui_font, f"Level: {self.game_state.level}", True, UI_COLOR)
         self.screen.blit(level_text, (10, 10))
 
         # Draw score
-        score_text = self.ui_font.render(f"Score: {self.game_state.score}", True, UI_COLOR)
+        score_text = render_text(self.ui_font, f"Score: {self.game_state.score}", True, UI_COLOR)
         self.screen.blit(score_text, (10, 40))
 
         # Draw lives
-        lives_text = self.ui_font.render(f"Lives: {self.game_state.lives}", True, UI_COLOR)
+        lives_text = render_text(self.ui_font, f"Lives: {self.game_state.lives}", True, UI_COLOR)
         self.screen.blit(lives_text, (10, 70))
 
         # Draw accuracy
-        accuracy_text = self.ui_font.render(f"Accuracy: {self.game_state.accuracy:.1f}%", True, UI_COLOR)
+        accuracy_text = render_text(self.ui_font, f"Accuracy: {self.game_state.accuracy:.1f}%", True, UI_COLOR)
         self.screen.blit(accuracy_text, (10, 100))
 
         # Draw words typed
-        words_text = self.ui_font.render(f"Words: {self.game_state.words_typed}", True, UI_COLOR)
+        words_text = render_text(self.ui_font, f"Words: {self.game_state.words_typed}", True, UI_COLOR)
         self.screen.blit(words_text, (10, 130))
 
         # Draw controls
-        controls_text = self.ui_font.render(
+        controls_text = render_text(
+            self.ui_font,
             "Type the falling words! ESC: Quit, Backspace: Clear, F11: Cycle Window Mode, Drag to Resize",
             True,
             UI_COLOR,
@@ -274,62 +352,50 @@ class TypingGame(BaseGame):
 
         # Progress text
         if self.game_state.level < 10:
-            progress_text = self.ui_font.render(
-                f"Next Level: {self.game_state.score}/{next_level_score}", True, UI_COLOR
+            progress_text = render_text(
+                self.ui_font, f"Next Level: {self.game_state.score}/{next_level_score}", True, UI_COLOR
             )
         else:
-            progress_text = self.ui_font.render("MAX LEVEL!", True, UI_COLOR)
+            progress_text = render_text(self.ui_font, "MAX LEVEL!", True, UI_COLOR)
         self.screen.blit(progress_text, (bar_x, bar_y + 15))
 
-    def draw(self):
-        """Draw the game."""
+    def draw(self, alpha=1.0):
+        """Draw the game. Updates run at the frame rate, so alpha is not used."""
         # Clear screen
         self.screen.fill(BACKGROUND_COLOR)
 
         if not self.game_over:
-            # Draw falling words
-            for word in self.falling_words:
-                word.draw(self.screen)
+            # Draw falling words, in one batch of glyph blits
+            self.screen.blits([entry for word in self.falling_words for entry in word.blits()], doreturn=False)
 
             # Draw UI
             self.draw_ui()
 
         else:
             # Game over screen
-            game_over_text = self.title_font.render("GAME OVER", True, MISSED_COLOR)
+            game_over_text = render_text(self.title_font, "GAME OVER", True, MISSED_COLOR)
             game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
             self.screen.blit(game_over_text, game_over_rect)
 
             # Final stats
-            final_score_text = self.ui_font.render(f"Final Score: {self.game_state.score}", True, UI_COLOR)
+            final_score_text = render_text(self.ui_font, f"Final Score: {self.game_state.score}", True, UI_COLOR)
             final_score_rect = final_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             self.screen.blit(final_score_text, final_score_rect)
 
-            level_text = self.ui_font.render(f"Level Reached: {self.game_state.level}", True, UI_COLOR)
+            level_text = render_text(self.ui_font, f"Level Reached: {self.game_state.level}", True, UI_COLOR)
             level_rect = level_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
             self.screen.blit(level_text, level_rect)
 
-            accuracy_text = self.ui_font.render(f"Accuracy: {self.game_state.accuracy:.1f}%", True, UI_COLOR)
+            accuracy_text = render_text(self.ui_font, f"Accuracy: {self.game_state.accuracy:.1f}%", True, UI_COLOR)
             accuracy_rect = accuracy_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 10))
             self.screen.blit(accuracy_text, accuracy_rect)
 
-            words_text = self.ui_font.render(f"Words Typed: {self.game_state.words_typed}", True, UI_COLOR)
+            words_text = render_text(self.ui_font, f"Words Typed: {self.game_state.words_typed}", True, UI_COLOR)
             words_rect = words_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40))
             self.screen.blit(words_text, words_rect)
 
-            restart_text = self.ui_font.render("Press SPACE to play again, ESC to quit", True, UI_COLOR)
+            restart_text = render_text(self.ui_font, "Press SPACE to play again, ESC to quit", True, UI_COLOR)
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
             self.screen.blit(restart_text, restart_rect)
 
-        pygame.display.flip()
-
-    def run(self):
-        """Main game loop with custom timing."""
-        while self.running:
-            self.running = self.handle_input()
-            if self.running:
-                self.update()
-                self.draw()
-                self.clock.tick(FPS)
-
-        pygame.quit()
+        self.present()
@@ -0,0 +1,130 @@
+"""Glyph atlas text rendering for Typing Rain.
+
+Falling words are drawn every frame in two colors (typed prefix, remaining
+suffix) that change with each keystroke, so caching whole-word surfaces
+would miss constantly. Instead each character is rasterized once per
+(font, color) into a single atlas surface, and a word is composed from one
+atlas blit per character. Each glyph is placed where font.render puts it:
+its right edge ends the rendered width of the text up to it, so kerning and
+fractional advances come out as in a whole-word render. Widths are measured
+with font.size once per text and cached.
+"""
+
+import string
+from collections import OrderedDict
+
+import pygame
+
+# Characters rasterized up front; others are added on first use
+DEFAULT_CHARSET = string.ascii_lowercase
+# Atlases kept by glyph_atlas(); the least recently used beyond this are dropped
+MAX_ATLASES = 16
+
+
+class GlyphAtlas:
+    """Every glyph of a font in one color, packed in a single row of one surface."""
+
+    def __init__(self, font, color, charset=DEFAULT_CHARSET):
+        """Rasterize the charset.
+
+        Args:
+            font: pygame.font.Font to render with
+            color: Text color
+            charset: Characters to rasterize now
+        """
+        self.font = font
+        self.color = tuple(color)
+        self.height = 0
+        self.surface = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self._used_width = 0
+        self._areas = {}  # char -> Rect of its glyph in the atlas
+        self._widths = {}  # char -> rendered glyph width
+        self._layouts = {}  # text -> tuple of (glyph area, x offset) per character
+        self._text_widths = {}  # text -> rendered width
+        self.add(charset)
+
+    def add(self, chars):
+        """Rasterize any of chars not in the atlas yet, growing it as needed."""
+        glyphs = []
+        for char in dict.fromkeys(chars):
+            if char in self._areas:
+                continue
+            glyphs.append((char, self.font.render(char, True, self.color)))
+        if not glyphs:
+            return
+
+        width = self._used_width + sum(glyph.get_width() for _, glyph in glyphs)
+        height = max(self.height, *(glyph.get_height() for _, glyph in glyphs))
+        if width > self.surface.get_width() or height > self.surface.get_height():
+            # Grow geometrically so adding characters one at a time stays cheap
+            grown = pygame.Surface((max(width, 2 * self.surface.get_width()), height), pygame.SRCALPHA)
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+
+        x = self._used_width
+        for char, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0))
+            self._areas[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            self._widths[char] = glyph.get_width()
+            x += glyph.get_width()
+        self._used_width = x
+        self.height = height
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format for fast blits
+            self.surface = self.surface.convert_alpha()
+
+    def width(self, text):
+        """Get the pixel width text is drawn at, the same as font.render's, cached per text."""
+        width = self._text_widths.get(text)
+        if width is None:
+            width = self._text_widths[text] = self.font.size(text)[0] if text else 0
+        return width
+
+    def layout(self, text):
+        """Get the placement of text's glyphs, cached per text.
+
+        Returns:
+            Tuple of (atlas area, x offset from the text's left) per character
+        """
+        layout = self._layouts.get(text)
+        if layout is None:
+            if any(char not in self._areas for char in text):
+                self.add(text)
+            layout = self._layouts[text] = tuple(
+                (self._areas[char], self.width(text[:end]) - self._widths[char]) for end, char in enumerate(text, 1)
+            )
+        return layout
+
+    def blits(self, text, x, y):
+        """Get Surface.blits() entries drawing text with its top-left at (x, y).
+
+        Returns:
+            List of (atlas surface, position, area) tuples, one per character
+        """
+        surface = self.surface
+        return [(surface, (x + offset, y), area) for area, offset in self.layout(text)]
+
+    def draw(self, target, text, x, y):
+        """Draw text onto target with its top-left at (x, y)."""
+        target.blits(self.blits(text, x, y), doreturn=False)
+
+
+# Atlases keyed by (font, color), shared by all words, least recently used first
+_atlases = OrderedDict()
+
+
+def glyph_atlas(font, color):
+    """Get the shared atlas for a font and color, building it on first use.
+
+    At most MAX_ATLASES are kept, so fonts replaced over a session (say, on
+    resizes) don't pile up; a dropped atlas lives on in the words using it.
+    """
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color)
+        if len(_atlases) > MAX_ATLASES:
+            _atlases.popitem(last=False)
+    else:
+        _atlases.move_to_end(key)
+    return atlas
@@ -0,0 +1,52 @@
+"""Spawn layout helpers for Typing Rain."""
+
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    """Disjoint half-open [start, end) intervals, kept sorted by start.
+
+    Overlap queries bisect the starts, so checking a candidate range costs
+    O(log n) however many intervals are stored.
+    """
+
+    def __init__(self):
+        """Initialize an empty set."""
+        self._starts = []
+        self._ends = []
+
+    def __len__(self):
+        """Return the number of intervals."""
+        return len(self._starts)
+
+    def clear(self):
+        """Remove every interval."""
+        self._starts.clear()
+        self._ends.clear()
+
+    def overlaps(self, start, end):
+        """Check whether [start, end) overlaps any stored interval."""
+        i = bisect_right(self._starts, start)
+        # Only the interval starting at or before start, and the one after it, can reach the range
+        if i > 0 and self._ends[i - 1] > start:
+            return True
+        return i < len(self._starts) and self._starts[i] < end
+
+    def add(self, start, end):
+        """Store [start, end), which must not overlap a stored interval.
+
+        Raises:
+            ValueError: If it overlaps
+        """
+        if self.overlaps(start, end):
+            raise ValueError(f"[{start}, {end}) overlaps a stored interval")
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+
+    def remove(self, start):
+        """Remove the interval starting at start, if there is one."""
+        i = bisect_left(self._starts, start)
+        if i < len(self._starts) and self._starts[i] == start:
+            del self._starts[i]
+            del self._ends[i]
@@ -0,0 +1,74 @@
+"""Batch simulation hooks for Typing Rain (see shared.batch).
+
+Policies type one character every few updates, like a typist of a fixed
+speed; at 60 updates per second an interval of 12 is 5 characters a second.
+"""
+
+import string
+
+from shared.batch import NO_KEYS, key_press
+from .game import TypingGame
+
+PARAMETERS = {
+    "BASE_SPAWN_RATE": (("games.typing.constants", "BASE_SPAWN_RATE"),),
+    "MIN_SPAWN_RATE": (("games.typing.constants", "MIN_SPAWN_RATE"),),
+    "BASE_FALL_SPEED": (("games.typing.entities", "BASE_FALL_SPEED"),),
+    "SPEED_INCREASE_PER_LEVEL": (("games.typing.entities", "SPEED_INCREASE_PER_LEVEL"),),
+}
+
+SLOW_INTERVAL = 12  # Updates per character: 5 characters a second
+FAST_INTERVAL = 6  # 10 characters a second
+
+
+def typist_policy(interval):
+    """Build a policy that types the oldest word's next character every interval updates."""
+
+    def make(rng):
+        def act(game):
+            if game.steps % interval:
+                return NO_KEYS, ()
+            for word in game.falling_words:
+                if not word.completed:
+                    char = word.text[word.typed_chars]
+                    return NO_KEYS, (key_press(ord(char), char),)
+            return NO_KEYS, ()
+
+        return act
+
+    return make
+
+
+def random_policy(rng):
+    """Type a random letter every SLOW_INTERVAL updates."""
+
+    def act(game):
+        if game.steps % SLOW_INTERVAL:
+            return NO_KEYS, ()
+        char = rng.choice(string.ascii_lowercase)
+        return NO_KEYS, (key_press(ord(char), char),)
+
+    return act
+
+
+POLICIES = {
+    "typist": typist_policy(SLOW_INTERVAL),
+    "fast_typist": typist_policy(FAST_INTERVAL),
+    "random": random_policy,
+}
+
+
+def new_game(seed):
+    """Build a headless Typing Rain game."""
+    return TypingGame(headless=True, seed=seed)
+
+
+def episode_metrics(game):
+    """Get the score, level reached, words typed and missed, and accuracy."""
+    state = game.game_state
+    return {
+        "score": state.score,
+        "level": state.level,
+        "words_typed": state.words_typed,
+        "words_missed": state.words_missed,
+        "accuracy": state.accuracy,
+    }
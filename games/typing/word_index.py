@@ -0,0 +1,133 @@
+"""Keystroke matching index for Typing Rain.
+
+Live words are bucketed by the next character each one expects, so a
+keypress only looks at the bucket for that character instead of scanning
+every word on screen. Within a bucket the oldest word wins, as it did with
+the linear scan over spawn order.
+"""
+
+import heapq
+
+# Stale heap entries tolerated, beyond twice the live word count, before a rebuild
+STALE_SLACK = 64
+
+
+class WordIndex:
+    """Falling words bucketed by their next expected character.
+
+    Each bucket is a heap of (spawn serial, typed_chars, word) entries. An
+    entry is live only while the word is indexed and its typed_chars still
+    matches, so words that move on or leave the index are dropped lazily
+    when they surface; typing and removing a word are O(log n).
+
+    In locked mode the first word a keystroke matches becomes the target,
+    and later keystrokes only go to it until it is completed, removed or
+    released, like a typing trainer's locked target.
+    """
+
+    def __init__(self, locked=False):
+        """Initialize an empty index.
+
+        Args:
+            locked: Route keystrokes to one target word at a time
+        """
+        self.locked = locked
+        self.target = None
+        self._buckets = {}  # char -> heap of (serial, typed_chars, word)
+        self._serials = {}  # indexed word -> spawn serial
+        self._next_serial = 0
+        self._entries = 0
+
+    def __len__(self):
+        """Return the number of indexed words."""
+        return len(self._serials)
+
+    def __contains__(self, word):
+        """Check whether a word is indexed."""
+        return word in self._serials
+
+    def add(self, word):
+        """Index a newly spawned word; it ranks after every word already indexed."""
+        serial = self._next_serial
+        self._next_serial += 1
+        self._serials[word] = serial
+        self._push(word, serial)
+
+    def remove(self, word):
+        """Drop a word (missed or otherwise gone) from the index."""
+        if self._serials.pop(word, None) is None:
+            return
+        if word is self.target:
+            self.target = None
+        if self._entries > 2 * len(self._serials) + STALE_SLACK:
+            self._rebuild()
+
+    def clear(self):
+        """Drop every word."""
+        self.target = None
+        self._buckets.clear()
+        self._serials.clear()
+        self._entries = 0
+
+    def release(self):
+        """Unlock the current target, keeping what was typed of it."""
+        self.target = None
+
+    def type_char(self, char):
+        """Feed one keystroke to the word that should receive it.
+
+        Completed words are removed from the index; the caller keeps them in
+        its own list until it next compacts it.
+
+        Args:
+            char: Lowercase character typed
+
+        Returns:
+            The word that accepted the character, or None if none did
+        """
+        word = self.target
+        if word is not None:
+            if not word.type_char(char):
+                return None
+        else:
+            word = self._first(char)
+            if word is None:
+                return None
+            heapq.heappop(self._buckets[char])
+            self._entries -= 1
+            word.type_char(char)
+            if self.locked:
+                self.target = word
+
+        if word.completed:
+            self.remove(word)
+        else:
+            self._push(word, self._serials[word])
+            if self._entries > 2 * len(self._serials) + STALE_SLACK:
+                self._rebuild()
+        return word
+
+    def _push(self, word, serial):
+        """Add a word's entry to the bucket of its next character."""
+        bucket = self._buckets.setdefault(word.text[word.typed_chars], [])
+        heapq.heappush(bucket, (serial, word.typed_chars, word))
+        self._entries += 1
+
+    def _first(self, char):
+        """Get the oldest indexed word expecting char next, popping stale entries on the way."""
+        bucket = self._buckets.get(char)
+        serials = self._serials
+        while bucket:
+            serial, typed_chars, word = bucket[0]
+            if serials.get(word) == serial and word.typed_chars == typed_chars:
+                return word
+            heapq.heappop(bucket)
+            self._entries -= 1
+        return None
+
+    def _rebuild(self):
+        """Re-create the buckets from the indexed words, dropping stale entries."""
+        self._buckets.clear()
+        self._entries = 0
+        for word, serial in self._serials.items():
+            self._push(word, serial)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Game hub launcher.
+
+Run this script to pick and play every game from one window:
+    python play_hub.py
+"""
+
+from shared.hub import GameHub
+
+
+def main():
+    """Launch the game hub."""
+    print("Starting Python Games hub...")
+    print("Controls:")
+    print("  - Arrow keys + ENTER, or 1-4: Play a game")
+    print("  - ESC in a game: Back to the hub")
+    print("  - ESC: Quit")
+    print()
+
+    hub = GameHub()
+    hub.run()
+
+    print("Thanks for playing!")
+
+
+if __name__ == "__main__":
+    main()
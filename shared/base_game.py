@@ -1,37 +1,288 @@
 """Base game class that all games can inherit from."""
 
+import os
+import random
+import time
+
 import pygame
 from abc import ABC, abstractmethod
+from .profiler import FrameProfiler, TOGGLE_KEY as PROFILER_TOGGLE_KEY
+from .replay import InputFrame, InputRecorder, InputReplay
+
+
+def init_pygame(headless=False):
+    """Initialize the pygame subsystems the games use: display and font.
+
+    pygame.init() would also open the audio device and joysticks, which no
+    game uses and which can take a noticeable share of start-up. Calling
+    this again is cheap, so every game can call it and share one display.
+    With headless, SDL switches to its dummy video driver, which never opens
+    a window but keeps event and key polling working, so game input code
+    runs unchanged on display-less machines.
+    """
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.font.init()
 
 
 class BaseGame(ABC):
     """Abstract base class for all games."""
 
-    def __init__(self, window_width, window_height, title):
+    # Frame rate cap for the interactive loop (None = uncapped)
+    fps = None
+    # Fixed simulation updates per second (None = one update per rendered frame)
+    update_rate = None
+    # Catch-up updates allowed per frame before the loop drops time instead
+    max_updates_per_frame = 5
+    # FrameProfiler timing each loop phase, or None when profiling is off
+    profiler = None
+    # InputRecorder logging every frame's input, or None when not recording
+    recorder = None
+    # InputFrame handle_input() reads from instead of pygame during a replay
+    _replay_frame = None
+    # Repaint and present only the regions that changed (games opt in; see begin_draw)
+    dirty_rendering = False
+    # Share of the window the dirty rects may cover before a full flip is presented instead
+    max_dirty_fraction = 0.5
+    # Regions repainted this frame, when it is drawn in dirty-rect mode
+    dirty_rects = ()
+    _full_redraw = True
+    _full_frame = True
+    # Set when the window was closed, as opposed to the game being left with ESC
+    quit_requested = False
+
+    def __init__(self, window_width, window_height, title, headless=False, seed=None):
         """Initialize the base game.
 
         Args:
             window_width: Width of the game window
             window_height: Height of the game window
             title: Title of the game window
+            headless: Run without a window; frames are only drawn on request
+            seed: Seed for the game's RNG stream (None = pick one at random)
         """
-        pygame.init()
+        self.headless = headless
+        self.reseed(seed)
+        init_pygame(headless)
         self.window_width = window_width
         self.window_height = window_height
-        self.screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
-        pygame.display.set_caption(title)
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
+            pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         self.running = True
+        self.reset_step_counter()
 
     def present(self):
         """Display the current frame."""
-        pygame.display.flip()
+        if self.headless:
+            return
+        profiler = self.profiler
+        if profiler is None:
+            self._update_display()
+            return
+        start = time.perf_counter()
+        profiler.draw_overlay(self.screen)
+        self._update_display()
+        profiler.add("present", time.perf_counter() - start)
+
+    def _update_display(self):
+        """Flip the whole window, or only the dirty rects of a dirty-rect frame."""
+        if self._full_frame:
+            pygame.display.flip()
+            return
+        rects = self.dirty_rects
+        if not rects:
+            return
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > self.max_dirty_fraction * self.window_width * self.window_height:
+            # Many small uploads cost more than one big one
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def begin_draw(self):
+        """Start drawing a frame and decide how much of it to repaint.
+
+        Returns:
+            True if the whole frame must be drawn (dirty rendering is off,
+            nothing was drawn yet, the window was resized or exposed, the
+            game requested it, the profiler overlay is showing, or the game
+            is headless); False if only the regions that changed need
+            repainting, via redraw_regions()
+        """
+        profiler = self.profiler
+        full = (
+            not self.dirty_rendering
+            or self._full_redraw
+            or self.headless
+            or (profiler is not None and profiler.visible)
+        )
+        self._full_redraw = False
+        self._full_frame = full
+        self.dirty_rects = []
+        return full
+
+    def request_full_redraw(self):
+        """Make the next frame repaint and present the whole window."""
+        self._full_redraw = True
+
+    def redraw_regions(self, rects, paint):
+        """Repaint rects and mark them for presenting.
+
+        Args:
+            rects: pygame.Rects that changed since the last frame
+            paint: Function taking a rect that draws everything overlapping
+                it, in the same order a full draw would; drawing is clipped
+                to the rect, so the result matches a full redraw exactly
+        """
+        screen = self.screen
+        for rect in rects:
+            screen.set_clip(rect)
+            paint(rect)
+        screen.set_clip(None)
+        self.dirty_rects.extend(rects)
+
+    def reseed(self, seed=None):
+        """Restart the game's RNG stream. All game randomness must come from self.rng.
+
+        Args:
+            seed: Integer seed (None = pick one at random); kept in self.seed
+                so a recording can reproduce the session
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def poll_events(self):
+        """Get pending pygame events, handling engine hotkeys (F3: profiler) first.
+
+        During a replay the recorded events are returned instead; while
+        recording, the events are logged.
+        """
+        if self._replay_frame is not None:
+            events = self._replay_frame.events
+        else:
+            events = pygame.event.get()
+        if self.recorder is not None:
+            self.recorder.record_events(events)
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_TOGGLE_KEY:
+                self.toggle_profiler()
+            elif event.type == pygame.QUIT:
+                self.quit_requested = True
+            elif event.type == pygame.WINDOWEXPOSED:
+                # The window contents were lost; partial updates would leave holes
+                self.request_full_redraw()
+        return events
+
+    def key_state(self):
+        """Get the held-key state (pygame.key.get_pressed()), recorded or replayed."""
+        if self._replay_frame is not None:
+            keys = self._replay_frame.keys
+        else:
+            keys = pygame.key.get_pressed()
+        if self.recorder is not None:
+            self.recorder.record_keys(keys)
+        return keys
+
+    def key_mods(self):
+        """Get the modifier-key bits (pygame.key.get_mods()), recorded or replayed."""
+        if self._replay_frame is not None:
+            mods = self._replay_frame.mods
+        else:
+            mods = pygame.key.get_mods()
+        if self.recorder is not None:
+            self.recorder.record_mods(mods)
+        return mods
+
+    def start_recording(self, path):
+        """Log every following frame's input to path.
+
+        Start right after constructing the game so the recording begins
+        from the state the seed produces.
+
+        Returns:
+            The InputRecorder in use
+        """
+        self.stop_recording()
+        self.recorder = InputRecorder(path, type(self).__name__, self.seed, (self.window_width, self.window_height))
+        return self.recorder
+
+    def stop_recording(self):
+        """Finish and close the current recording, if any."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def enable_profiler(self, log_path=None, overlay=False, history=300):
+        """Start timing every loop phase.
+
+        Args:
+            log_path: Optional .csv or .jsonl file receiving one record per frame
+            overlay: Show the stats overlay right away
+            history: Number of frames kept for rolling statistics
+
+        Returns:
+            The FrameProfiler in use
+        """
+        if self.profiler is not None:
+            self.profiler.close()
+        self.profiler = FrameProfiler(history=history, log_path=log_path)
+        self.profiler.visible = overlay
+        return self.profiler
+
+    def toggle_profiler(self):
+        """Show or hide the profiler overlay, starting the profiler if needed."""
+        if self.profiler is None:
+            self.enable_profiler(overlay=True)
+        else:
+            self.profiler.toggle_overlay()
+        # Repaint whatever the overlay covered
+        self.request_full_redraw()
+
+    def entity_count(self):
+        """Get the number of live entities, for profiling. Override per game."""
+        return 0
+
+    def _timed(self, phase, func, *args):
+        """Call func, adding its run time to the profiler phase when profiling."""
+        profiler = self.profiler
+        if profiler is None:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        profiler.add(phase, time.perf_counter() - start)
+        return result
+
+    def _begin_frame(self):
+        """Start a profiler frame, if profiling."""
+        if self.profiler is not None:
+            self.profiler.begin_frame()
+
+    def _end_frame(self, updates):
+        """Finish a profiler frame and a recorded frame, if profiling or recording."""
+        if self.profiler is not None:
+            self.profiler.end_frame(updates, self.entity_count())
+        if self.recorder is not None:
+            self.recorder.end_frame(updates)
+
+    def resize_window(self, w, h):
+        """Set the window to w x h and run the game's resize handling, as a VIDEORESIZE would."""
+        if not self.headless:
+            pygame.display.set_mode((w, h), pygame.RESIZABLE)
+        self.handle_resize(w, h)
 
     def handle_resize(self, w, h):
         """Handle window resize. Override to add game-specific updates."""
         self.window_width = w
         self.window_height = h
         self.screen = pygame.display.get_surface()
+        self.request_full_redraw()
 
     @abstractmethod
     def handle_input(self):
@@ -44,20 +295,264 @@ class BaseGame(ABC):
         pass
 
     @abstractmethod
-    def draw(self):
-        """Draw the game."""
+    def draw(self, alpha=1.0):
+        """Draw the game.
+
+        Args:
+            alpha: How far (0-1) real time has advanced from the last update
+                toward the next one, for interpolating motion between updates
+        """
         pass
 
-    def run(self):
-        """Main game loop."""
+    def is_game_over(self):
+        """Check if the current episode has ended. Override if state lives elsewhere."""
+        return getattr(self, "game_over", False)
+
+    def reset_step_counter(self):
+        """Reset the update counter and steps-per-second measurement."""
+        self.steps = 0
+        self.steps_per_second = 0.0
+        self._sps_window_start = time.perf_counter()
+        self._sps_window_steps = 0
+
+    def _count_step(self):
+        """Record one update and refresh steps_per_second about once a second."""
+        self.steps += 1
+        now = time.perf_counter()
+        elapsed = now - self._sps_window_start
+        if elapsed >= 1.0:
+            self.steps_per_second = (self.steps - self._sps_window_steps) / elapsed
+            self._sps_window_start = now
+            self._sps_window_steps = self.steps
+
+    def step(self):
+        """Poll input and advance the game by one update. Returns False once quit."""
+        self.running = self._timed("input", self.handle_input)
+        if self.running:
+            self._timed("update", self.update)
+            self._count_step()
+        return self.running
+
+    def step_scripted(self, frame):
+        """Advance one update with handle_input() reading frame instead of pygame.
+
+        Args:
+            frame: InputFrame holding the keys, modifiers and events a script or
+                AI policy chose for this update
+
+        Returns:
+            False once quit
+        """
+        self._replay_frame = frame
+        try:
+            return self.step()
+        finally:
+            self._replay_frame = None
+
+    def run_scripted(self, act, max_steps, render=False, stop_on_game_over=True):
+        """Play one update per frame with input chosen by a script or AI policy.
+
+        Args:
+            act: Function taking the game and returning (held keys, key press
+                events) for the next update; held keys are indexed like
+                pygame.key.get_pressed()
+            max_steps: Stop after this many updates
+            render: Also draw every frame (off-screen when headless)
+            stop_on_game_over: Stop as soon as is_game_over() reports True
+
+        Returns:
+            Number of updates performed
+        """
+        start_steps = self.steps
+        while self.steps - start_steps < max_steps:
+            if stop_on_game_over and self.is_game_over():
+                break
+            self._begin_frame()
+            held, presses = act(self)
+            if not self.step_scripted(InputFrame(held, 0, presses, 1)):
+                break
+            if render:
+                self._timed("draw", self.render_frame)
+            self._end_frame(1)
+        return self.steps - start_steps
+
+    def render_frame(self):
+        """Draw the current state and return the surface it was drawn to.
+
+        In headless mode this draws to an off-screen Surface, created on
+        first use, so snapshots cost nothing unless asked for.
+        """
+        if self.screen is None:
+            self.screen = pygame.Surface((self.window_width, self.window_height))
+        self.draw()
+        return self.screen
+
+    def run_headless(self, max_steps=None, stop_on_game_over=True, render_every=0):
+        """Step the game as fast as the CPU allows without drawing.
+
+        Args:
+            max_steps: Stop after this many updates (None = no limit)
+            stop_on_game_over: Stop as soon as is_game_over() reports True
+            render_every: Also render an off-screen frame every N updates (0 = never)
+
+        Returns:
+            Number of updates performed
+        """
+        start_steps = self.steps
+        start_time = time.perf_counter()
+        while self.running:
+            if max_steps is not None and self.steps - start_steps >= max_steps:
+                break
+            if stop_on_game_over and self.is_game_over():
+                break
+            self._begin_frame()
+            if not self.step():
+                break
+            if render_every and self.steps % render_every == 0:
+                self._timed("draw", self.render_frame)
+            self._end_frame(1)
+
+        done = self.steps - start_steps
+        elapsed = time.perf_counter() - start_time
+        if elapsed > 0 and not self.steps_per_second:
+            # Runs shorter than one measurement window report their average
+            self.steps_per_second = done / elapsed
+        return done
+
+    def run_fixed_timestep(self):
+        """Interactive loop that decouples update() frequency from draw() frequency.
+
+        Real elapsed time is banked in an accumulator and spent in fixed
+        1 / update_rate steps, so simulation speed no longer depends on frame
+        rate. At most max_updates_per_frame catch-up steps run per frame; time
+        beyond that is dropped so a slow machine cannot spiral. The leftover
+        fraction of a step is passed to draw() as the interpolation alpha.
+        """
+        step_time = 1.0 / self.update_rate
+        max_updates = self.max_updates_per_frame
+        accumulator = 0.0
+        previous = time.perf_counter()
+
         while self.running:
-            self.running = self.handle_input()
-            if self.running:
-                self.update()
-                self.draw()
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+
+            self._begin_frame()
+            self.running = self._timed("input", self.handle_input)
+            if not self.running:
+                break
+
+            updates = 0
+            while accumulator >= step_time and updates < max_updates:
+                self._timed("update", self.update)
+                self._count_step()
+                accumulator -= step_time
+                updates += 1
+            if accumulator >= step_time:
+                # Too far behind: skip the backlog rather than spiral
+                accumulator %= step_time
+
+            self._timed("draw", self.draw, accumulator / step_time)
+            self._end_frame(updates)
+            if self.fps:
+                self.clock.tick(self.fps)
+
+    def run_replay(self, replay, render=None):
+        """Re-run a recorded session frame by frame, bit-exactly.
+
+        The game must have been constructed with the recording's seed (see
+        replay_session) and not stepped since. It is first resized to the
+        recording's window size, which also resets the layout constants an
+        earlier resize in this process may have left behind. Each frame then
+        feeds the recorded input to handle_input() and runs the recorded
+        number of updates.
+
+        Args:
+            replay: InputReplay, or the path of a recording file
+            render: Draw each frame at the game's frame rate (default: when
+                not headless); otherwise run as fast as the CPU allows
 
+        Returns:
+            Number of frames replayed
+        """
+        if not isinstance(replay, InputReplay):
+            replay = InputReplay.load(replay)
+        if replay.seed != self.seed:
+            raise ValueError(f"recording was made with seed {replay.seed}, game uses {self.seed}")
+        if render is None:
+            render = not self.headless
+        self.resize_window(*replay.window_size)
+
+        played = 0
+        try:
+            for frame in replay.frames:
+                self._replay_frame = frame
+                self._begin_frame()
+                self.running = self._timed("input", self.handle_input)
+                if not self.running:
+                    break
+                for _ in range(frame.updates):
+                    self._timed("update", self.update)
+                    self._count_step()
+                if render:
+                    self._timed("draw", self.render_frame)
+                self._end_frame(frame.updates)
+                played += 1
+                if render and self.fps:
+                    self.clock.tick(self.fps)
+        finally:
+            self._replay_frame = None
+        return played
+
+    def play(self):
+        """Main game loop, left when handle_input() returns False.
+
+        Unlike run() this keeps pygame and the window alive afterwards, so a
+        launcher can go on to another game in the same display.
+        """
+        if self.headless:
+            self.run_headless()
+        elif self.update_rate:
+            self.run_fixed_timestep()
+        else:
+            while self.running:
+                self._begin_frame()
+                if self.step():
+                    self._timed("draw", self.draw)
+                    self._end_frame(1)
+                    if self.fps:
+                        self.clock.tick(self.fps)
+
+    def run(self):
+        """Play the game, then shut pygame down."""
+        self.play()
+        if self.profiler is not None:
+            self.profiler.close()
+        self.stop_recording()
         pygame.quit()
 
     def quit_game(self):
         """Quit the game."""
         self.running = False
+
+
+def replay_session(game_class, path, headless=True, **kwargs):
+    """Build a game seeded from a recording and replay it.
+
+    Args:
+        game_class: BaseGame subclass that made the recording
+        path: Recording file
+        headless: Replay without a window, as fast as possible
+        **kwargs: Extra constructor arguments for game_class
+
+    Returns:
+        The game, in the state the recorded session ended in
+    """
+    init_pygame(headless)
+    replay = InputReplay.load(path)
+    if replay.game_name != game_class.__name__:
+        raise ValueError(f"{path} records {replay.game_name}, not {game_class.__name__}")
+    game = game_class(headless=headless, seed=replay.seed, **kwargs)
+    game.run_replay(replay)
+    return game
@@ -0,0 +1,370 @@
+"""Multiprocess batch simulation for balance and regression sweeps.
+
+Headless episodes of a game are fanned out over a ProcessPoolExecutor, one
+task per parameter combination, input policy and chunk of seeds. Workers
+send back one metrics row per episode; the parent streams every row to a
+CSV or JSONL file as it arrives and folds it into running per-group
+statistics, so memory stays flat however many episodes are run. Every
+combination and policy is played on the same seeds, so differences between
+them are not seed noise.
+
+A game takes part through a simulation module (see SIMULATIONS) providing:
+    PARAMETERS: name -> ((module, attribute path), ...) the value is patched
+        into, e.g. {"ENEMY_SPEED": (("games.space_combat.entities", "ENEMY_SPEED"),)}
+    POLICIES: name -> factory taking a random.Random and returning
+        act(game) -> (held keys, key presses) for the next update
+    new_game(seed): a headless game, ready to play
+    episode_metrics(game): dict of numeric results, including "score"
+
+Episodes can also be recorded (see shared.replay) and replayed one at a
+time with replay_episode, to debug a surprising row.
+"""
+
+import csv
+import importlib
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pygame
+
+from shared.replay import InputReplay
+
+# game key -> simulation module; imported when a batch for that game starts
+SIMULATIONS = {
+    "snake": "games.snake.simulation",
+    "pong": "games.pong.simulation",
+    "space_combat": "games.space_combat.simulation",
+    "typing": "games.typing.simulation",
+}
+
+DEFAULT_MAX_STEPS = 3600  # One minute of play at 60 updates per second
+DEFAULT_CHUNK_SIZE = 25  # Episodes per task; smaller streams sooner, larger cuts overhead
+TASKS_PER_WORKER = 4  # Tasks kept queued per worker, so no core idles between chunks
+
+# Default value of every patched parameter, per worker process
+_defaults = {}
+
+
+class HeldKeys(frozenset):
+    """Key state for scripted input, indexed by key like pygame.key.get_pressed().
+
+    Recordings store these keycodes as scancodes, like real key state, so
+    scripted sessions replay exactly.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        """Check whether key is held."""
+        return key in self
+
+
+NO_KEYS = HeldKeys()
+
+
+def key_press(key, unicode=""):
+    """Build the KEYDOWN event a policy sends for a key press."""
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=unicode, scancode=0)
+
+
+class RunningStats:
+    """Count, mean, standard deviation, min and max of a stream of numbers.
+
+    Welford's online update keeps it O(1) in memory and numerically stable.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        """Initialize with no values."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        """Fold one value in."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self):
+        """Sample standard deviation (0 for fewer than two values)."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class EpisodeWriter:
+    """Streams episode rows to a .csv or .jsonl file, one line per episode."""
+
+    def __init__(self, path):
+        """Open path for writing; its extension picks the format.
+
+        Raises:
+            ValueError: If the extension is neither .csv nor .jsonl
+        """
+        self.path = path
+        self._format = os.path.splitext(path)[1].lower()
+        if self._format not in (".csv", ".jsonl"):
+            raise ValueError(f"episode output must be a .csv or .jsonl file, got {path}")
+        self._file = open(path, "w", newline="" if self._format == ".csv" else None)
+        self._csv = None
+
+    def write(self, row):
+        """Write one episode's row."""
+        if self._format == ".jsonl":
+            self._file.write(json.dumps(row) + "\n")
+            return
+        if self._csv is None:
+            # Rows of one batch share their keys, so the first one fixes the header
+            self._csv = csv.DictWriter(self._file, fieldnames=list(row))
+            self._csv.writeheader()
+        self._csv.writerow(row)
+
+    def close(self):
+        """Flush and close the file."""
+        self._file.close()
+
+
+def load_simulation(game):
+    """Import a game's simulation module.
+
+    Raises:
+        KeyError: If the game has no simulation module
+    """
+    return importlib.import_module(SIMULATIONS[game])
+
+
+def parameter_grid(values):
+    """Expand {name: [values]} into one {name: value} dict per combination."""
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def _patch_target(module_name, path):
+    """Get (object, attribute name) for a dotted attribute path inside a module."""
+    owner = importlib.import_module(module_name)
+    *parents, attribute = path.split(".")
+    for name in parents:
+        owner = getattr(owner, name)
+    return owner, attribute
+
+
+def apply_parameters(simulation, params):
+    """Patch params into the game, restoring the default of every parameter not given."""
+    for name, targets in simulation.PARAMETERS.items():
+        for target in targets:
+            owner, attribute = _patch_target(*target)
+            if target not in _defaults:
+                _defaults[target] = getattr(owner, attribute)
+            setattr(owner, attribute, params.get(name, _defaults[target]))
+
+
+def episode_filename(game, policy, params, seed):
+    """Get the recording file name of one episode, e.g. pong-follow-BALL_SPEED_X=7-seed3.pgrp."""
+    settings = "".join(f"-{name}={value}" for name, value in params.items())
+    return f"{game}-{policy}{settings}-seed{seed}.pgrp"
+
+
+def play_episode(simulation, policy, seed, max_steps, record=None):
+    """Play one headless episode until game over or max_steps updates.
+
+    Args:
+        simulation: The game's simulation module
+        policy: Name of the input policy
+        seed: Episode seed
+        max_steps: Update cap
+        record: Optional path receiving a recording of the episode's input
+
+    Returns:
+        Dict of the game's episode metrics plus steps, duration (seconds of
+        game time) and steps_per_second (simulation speed)
+    """
+    game = simulation.new_game(seed)
+    # The policy gets its own, differently seeded stream so its choices neither shift nor mirror the game's
+    act = simulation.POLICIES[policy](random.Random(f"policy {seed}"))
+    if record is not None:
+        game.start_recording(record)
+    start = time.perf_counter()
+    try:
+        game.run_scripted(act, max_steps)
+    finally:
+        game.stop_recording()
+    elapsed = time.perf_counter() - start
+
+    metrics = simulation.episode_metrics(game)
+    metrics["steps"] = game.steps
+    metrics["duration"] = game.steps / (game.update_rate or game.fps)
+    metrics["steps_per_second"] = game.steps / elapsed if elapsed > 0 else 0.0
+    return metrics
+
+
+def replay_episode(game, path, params=None):
+    """Replay a recorded batch episode in this process.
+
+    Args:
+        game: Key of SIMULATIONS
+        path: Recording written by play_episode
+        params: The {name: value} parameters the episode was played with
+
+    Returns:
+        The replayed game, in the state the episode ended in
+    """
+    simulation = load_simulation(game)
+    apply_parameters(simulation, params or {})
+    replay = InputReplay.load(path)
+    replayed = simulation.new_game(replay.seed)
+    replayed.run_replay(replay)
+    return replayed
+
+
+def run_chunk(game, params, policy, seeds, max_steps, record_dir=None):
+    """Worker task: play one episode per seed with params applied.
+
+    Args:
+        record_dir: Optional directory receiving a recording of every episode
+            (named by episode_filename)
+
+    Returns:
+        List of episode rows (game, policy, params, seed, then metrics)
+    """
+    simulation = load_simulation(game)
+    apply_parameters(simulation, params)
+    rows = []
+    for seed in seeds:
+        record = None
+        if record_dir is not None:
+            record = os.path.join(record_dir, episode_filename(game, policy, params, seed))
+        row = {"game": game, "policy": policy, **params, "seed": seed}
+        row.update(play_episode(simulation, policy, seed, max_steps, record))
+        rows.append(row)
+    return rows
+
+
+class BatchSummary:
+    """Running statistics of every metric, per (policy, parameter combination)."""
+
+    def __init__(self, parameter_names):
+        """Initialize with no episodes."""
+        self.parameter_names = list(parameter_names)
+        self.groups = {}  # (policy, parameter values) -> {metric: RunningStats}
+        self.episodes = 0
+
+    def add(self, row):
+        """Fold one episode row in."""
+        key = (row["policy"], tuple(row[name] for name in self.parameter_names))
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {}
+        skip = {"game", "policy", "seed", *self.parameter_names}
+        for metric, value in row.items():
+            if metric not in skip:
+                stats = group.get(metric)
+                if stats is None:
+                    stats = group[metric] = RunningStats()
+                stats.add(value)
+        self.episodes += 1
+
+    def format_table(self):
+        """Get a text table of episodes, score, duration and speed per group."""
+        header = [*self.parameter_names, "policy", "episodes", "score mean", "score std", "duration s", "steps/s"]
+        widths = [max(12, len(column)) for column in header]
+        lines = [" ".join(f"{column:>{width}}" for column, width in zip(header, widths))]
+        for (policy, values), group in sorted(self.groups.items(), key=lambda item: (item[0][1], item[0][0])):
+            score = group["score"]
+            cells = [*values, policy, score.count, f"{score.mean:.2f}", f"{score.std:.2f}"]
+            cells += [f"{group['duration'].mean:.2f}", f"{group['steps_per_second'].mean:.0f}"]
+            lines.append(" ".join(f"{cell:>{width}}" for cell, width in zip(cells, widths)))
+        return "\n".join(lines)
+
+
+def run_batch(
+    game,
+    grid,
+    policies,
+    seeds,
+    max_steps=DEFAULT_MAX_STEPS,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    out=None,
+    record_dir=None,
+):
+    """Play every (parameter combination, policy, seed) episode across worker processes.
+
+    Args:
+        game: Key of SIMULATIONS
+        grid: {parameter name: [values]} to sweep (empty = defaults only)
+        policies: Policy names to play each combination with
+        seeds: Episode seeds, played for every combination and policy
+        max_steps: Update cap per episode
+        workers: Worker processes (None = one per CPU core)
+        chunk_size: Episodes per task
+        out: Optional .csv or .jsonl path receiving every episode row
+        record_dir: Optional directory receiving a recording of every
+            episode, for replay_episode
+
+    Returns:
+        BatchSummary of the run
+
+    Raises:
+        ValueError: For an unknown parameter or policy
+    """
+    simulation = load_simulation(game)
+    for name in grid:
+        if name not in simulation.PARAMETERS:
+            raise ValueError(f"{game} has no parameter {name}; choose from {', '.join(simulation.PARAMETERS)}")
+    for policy in policies:
+        if policy not in simulation.POLICIES:
+            raise ValueError(f"{game} has no policy {policy}; choose from {', '.join(simulation.POLICIES)}")
+
+    seeds = list(seeds)
+    tasks = (
+        (game, params, policy, seeds[start : start + chunk_size], max_steps, record_dir)
+        for params in parameter_grid(grid)
+        for policy in policies
+        for start in range(0, len(seeds), chunk_size)
+    )
+    workers = workers or os.cpu_count() or 1
+    if record_dir is not None:
+        os.makedirs(record_dir, exist_ok=True)
+    # Numpy's math libraries would start a thread pool per core in every worker
+    for variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(variable, "1")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    summary = BatchSummary(grid)
+    writer = EpisodeWriter(out) if out else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Only a few tasks per worker are in flight, so huge sweeps are never queued whole
+            pending = set()
+            for task in itertools.islice(tasks, workers * TASKS_PER_WORKER):
+                pending.add(executor.submit(run_chunk, *task))
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for row in future.result():
+                            if writer is not None:
+                                writer.write(row)
+                            summary.add(row)
+                        task = next(tasks, None)
+                        if task is not None:
+                            pending.add(executor.submit(run_chunk, *task))
+            except BaseException:
+                # A failed episode or Ctrl+C: don't wait for the queued chunks
+                executor.shutdown(cancel_futures=True)
+                raise
+    finally:
+        if writer is not None:
+            writer.close()
+    return summary
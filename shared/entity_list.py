@@ -0,0 +1,55 @@
+"""List of short-lived entities, updated and filtered in a single pass."""
+
+
+class EntityList:
+    """Holds live entities in order, compacting out the dead in place.
+
+    update() steps every live entity and keeps it only if the step says so.
+    Survivors are swapped down over the dead in the same pass, so the live
+    entities always fill one backing list, in spawn order, and expiring any
+    number of them costs one pass rather than a list.remove() (a linear
+    search) each.
+    """
+
+    def __init__(self):
+        """Initialize an empty list."""
+        self.items = []
+
+    def __len__(self):
+        """Return the number of live entities."""
+        return len(self.items)
+
+    def __iter__(self):
+        """Iterate over the live entities in spawn order."""
+        return iter(self.items)
+
+    def append(self, entity):
+        """Add an entity after the live ones."""
+        self.items.append(entity)
+        return entity
+
+    def update(self, step):
+        """Call step(entity) on every live entity and drop those it returns False for.
+
+        step may append entities; they join after the current live entities
+        and are not stepped until the next update.
+
+        Returns:
+            Number of entities dropped
+        """
+        items = self.items
+        count = len(items)
+        kept = 0
+        for index in range(count):
+            entity = items[index]
+            if step(entity):
+                if kept != index:
+                    items[kept], items[index] = entity, items[kept]
+                kept += 1
+        # Entities added by step sit after the dead ones; cut the dead out from between
+        del items[kept:count]
+        return count - kept
+
+    def clear(self):
+        """Drop every entity."""
+        self.items.clear()
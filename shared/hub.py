@@ -0,0 +1,165 @@
+"""Launcher hub: one process and one window for every game.
+
+The hub owns the pygame display and font subsystem for the whole session.
+Picking a game imports its module on first use, builds it in the same
+window and plays it; leaving the game with ESC comes back to the menu, so
+switching games costs a constructor call instead of a new interpreter,
+a pygame import and a new window.
+"""
+
+import importlib
+
+import pygame
+
+from .base_game import BaseGame
+from .constants import BLACK, WHITE, YELLOW, CYAN, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, SMALL_FONT, LARGE_FONT
+from .utils import render_text
+
+# (key, menu label, module, class name); a module is only imported once its game is picked
+GAMES = [
+    ("snake", "Snake", "games.snake.game", "SnakeGame"),
+    ("pong", "Pong", "games.pong.game", "PongGame"),
+    ("space_combat", "Space Combat", "games.space_combat.game", "SpaceCombatGame"),
+    ("typing", "Typing Rain", "games.typing.game", "TypingGame"),
+]
+
+MENU_FPS = 30
+ITEM_FONT = 40
+ITEM_SPACING = 50
+
+
+class GameHub(BaseGame):
+    """Menu that launches the games one after another in a shared window."""
+
+    fps = MENU_FPS
+
+    def __init__(self, headless=False, seed=None, games=GAMES):
+        """Initialize the hub and its window. No game module is imported yet.
+
+        Args:
+            headless: Run without a window; games launched are headless too
+            seed: Seed for the hub's RNG, which seeds every game launched
+                (None = pick one at random)
+            games: (key, label, module, class name) entries to offer
+        """
+        super().__init__(DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, "Python Games", headless=headless, seed=seed)
+        self.title = "Python Games"
+        self.games = list(games)
+        self.selected = 0
+        self.pending = None  # Key of the game picked from the menu, until it is launched
+        self.game = None  # Game being played, if any
+        self._classes = {}
+        self.title_font = pygame.font.Font(None, LARGE_FONT)
+        self.item_font = pygame.font.Font(None, ITEM_FONT)
+        self.hint_font = pygame.font.Font(None, SMALL_FONT)
+
+    def game_class(self, key):
+        """Get the class of a game, importing its module on first use.
+
+        Raises:
+            KeyError: If no game has that key
+        """
+        game_class = self._classes.get(key)
+        if game_class is None:
+            for entry_key, _, module_name, class_name in self.games:
+                if entry_key == key:
+                    game_class = getattr(importlib.import_module(module_name), class_name)
+                    break
+            else:
+                raise KeyError(key)
+            self._classes[key] = game_class
+        return game_class
+
+    def launch(self, key):
+        """Build a game in the hub's window, seeded from the hub's RNG.
+
+        The game's constructor resizes and retitles the existing window
+        instead of opening a new one.
+
+        Returns:
+            The new game, ready to play()
+        """
+        self.game = self.game_class(key)(headless=self.headless, seed=self.rng.randrange(2**63))
+        return self.game
+
+    def play_game(self, key):
+        """Launch a game, play it until it is left, and bring the menu back."""
+        game = self.launch(key)
+        try:
+            game.play()
+        finally:
+            if game.profiler is not None:
+                game.profiler.close()
+            game.stop_recording()
+            self.game = None
+        self.quit_requested = game.quit_requested
+        self.restore_window()
+
+    def restore_window(self):
+        """Give the window back its menu size and title after a game."""
+        if not self.headless:
+            self.screen = pygame.display.set_mode((self.window_width, self.window_height), pygame.RESIZABLE)
+            pygame.display.set_caption(self.title)
+        self.request_full_redraw()
+
+    def play(self):
+        """Show the menu and play the games picked from it until the hub is quit."""
+        while True:
+            self.pending = None
+            self.running = True
+            super().play()
+            if self.pending is None or self.quit_requested:
+                break
+            self.play_game(self.pending)
+            if self.quit_requested:
+                break
+
+    def handle_input(self):
+        """Move through the menu, or leave it to launch a game. Returns False to leave the menu."""
+        for event in self.poll_events():
+            if event.type == pygame.QUIT:
+                return False
+
+            if event.type == pygame.VIDEORESIZE:
+                self.handle_resize(event.w, event.h)
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+                elif event.key == pygame.K_UP:
+                    self.selected = (self.selected - 1) % len(self.games)
+                elif event.key == pygame.K_DOWN:
+                    self.selected = (self.selected + 1) % len(self.games)
+                elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
+                    self.pending = self.games[self.selected][0]
+                    return False
+                elif pygame.K_1 <= event.key < pygame.K_1 + len(self.games):
+                    self.selected = event.key - pygame.K_1
+                    self.pending = self.games[self.selected][0]
+                    return False
+
+        return True
+
+    def update(self):
+        """Nothing moves on the menu."""
+        pass
+
+    def draw(self, alpha=1.0):
+        """Draw the menu."""
+        self.begin_draw()
+        self.screen.fill(BLACK)
+        center_x = self.window_width // 2
+
+        title = render_text(self.title_font, self.title, True, YELLOW)
+        self.screen.blit(title, title.get_rect(center=(center_x, self.window_height // 4)))
+
+        top = self.window_height // 2 - (len(self.games) - 1) * ITEM_SPACING // 2
+        for i, (_, label, _, _) in enumerate(self.games):
+            color = CYAN if i == self.selected else WHITE
+            text = render_text(self.item_font, f"{i + 1}. {label}", True, color)
+            self.screen.blit(text, text.get_rect(center=(center_x, top + i * ITEM_SPACING)))
+
+        hint_text = f"Arrows + ENTER or 1-{len(self.games)}: play, ESC in a game: back here, ESC: quit"
+        hint = render_text(self.hint_font, hint_text, True, WHITE)
+        self.screen.blit(hint, hint.get_rect(center=(center_x, self.window_height - 40)))
+        self.present()
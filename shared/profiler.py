@@ -0,0 +1,197 @@
+"""Frame profiler and timing overlay shared by all games."""
+
+import csv
+import json
+import math
+import sys
+import time
+from collections import deque
+
+import pygame
+
+# Phases BaseGame times every frame, in loop order
+PHASES = ("input", "update", "draw", "present")
+
+# Per-frame record columns, in log order
+FIELDS = ("frame", "frame_ms", "busy_ms", *(f"{phase}_ms" for phase in PHASES), "updates", "entities", "alloc_blocks")
+
+# Key that shows/hides the overlay in every game
+TOGGLE_KEY = pygame.K_F3
+
+OVERLAY_FONT_SIZE = 20
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 170)
+OVERLAY_REFRESH_FRAMES = 15  # Re-render overlay text this often
+
+
+def percentile(sorted_values, fraction):
+    """Get the nearest-rank percentile of an already sorted sequence.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        The percentile value, or 0.0 for an empty sequence
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Rolling per-phase frame timings with an optional overlay and log file.
+
+    The last `history` frames are kept in ring buffers. Each frame records
+    the time spent in every phase, the wall time since the previous frame,
+    how many updates ran, the entity count and the net number of memory
+    blocks allocated (from sys.getallocatedblocks).
+    """
+
+    def __init__(self, history=300, log_path=None):
+        """Initialize the profiler.
+
+        Args:
+            history: Number of frames kept for rolling statistics
+            log_path: Optional .csv or .jsonl file that receives every frame record
+        """
+        self.history = history
+        self.frames = 0
+        self.visible = False
+        self._records = {field: deque(maxlen=history) for field in FIELDS[1:]}
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._frame_start = None
+        self._last_frame_start = None
+        self._blocks_start = 0
+        self._font = None
+        self._overlay = None
+
+        self.log_path = log_path
+        self._log_file = None
+        self._csv_writer = None
+        if log_path is not None:
+            self._log_file = open(log_path, "w", newline="")
+            if str(log_path).endswith(".csv"):
+                self._csv_writer = csv.writer(self._log_file)
+                self._csv_writer.writerow(FIELDS)
+
+    def begin_frame(self):
+        """Start timing a new frame."""
+        now = time.perf_counter()
+        self._last_frame_start = self._frame_start
+        self._frame_start = now
+        self._blocks_start = sys.getallocatedblocks()
+        for phase in PHASES:
+            self._current[phase] = 0.0
+
+    def add(self, phase, seconds):
+        """Add time spent in a phase during the current frame."""
+        self._current[phase] += seconds
+
+    def end_frame(self, updates=1, entities=0):
+        """Finish the current frame and record it.
+
+        Args:
+            updates: Number of update() calls made this frame
+            entities: Number of live entities in the game
+        """
+        if self._frame_start is None:
+            return
+        current = self._current
+        # draw() presents the frame itself, so present time is inside draw time
+        current["draw"] = max(0.0, current["draw"] - current["present"])
+
+        busy = sum(current.values())
+        if self._last_frame_start is None:
+            frame = busy
+        else:
+            frame = self._frame_start - self._last_frame_start
+
+        record = {
+            "frame_ms": frame * 1000,
+            "busy_ms": busy * 1000,
+            "updates": updates,
+            "entities": entities,
+            "alloc_blocks": sys.getallocatedblocks() - self._blocks_start,
+        }
+        for phase in PHASES:
+            record[f"{phase}_ms"] = current[phase] * 1000
+        for field, value in record.items():
+            self._records[field].append(value)
+
+        self.frames += 1
+        if self._log_file is not None:
+            self._write(record)
+
+    def _write(self, record):
+        """Append one frame record to the log file."""
+        row = {"frame": self.frames, **record}
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(
+                [f"{row[field]:.4f}" if isinstance(row[field], float) else row[field] for field in FIELDS]
+            )
+        else:
+            self._log_file.write(json.dumps(row) + "\n")
+
+    def summary(self):
+        """Get rolling statistics over the buffered frames.
+
+        Returns:
+            Dict with frame time p50/p95/p99, mean milliseconds per phase,
+            mean updates, entities and allocated blocks per frame, and fps
+        """
+        frames = sorted(self._records["frame_ms"])
+        count = len(frames)
+        stats = {
+            "frames": count,
+            "p50_ms": percentile(frames, 0.50),
+            "p95_ms": percentile(frames, 0.95),
+            "p99_ms": percentile(frames, 0.99),
+            "fps": 1000 * count / sum(frames) if count and sum(frames) else 0.0,
+        }
+        for field in ("busy_ms", *(f"{phase}_ms" for phase in PHASES), "updates", "entities", "alloc_blocks"):
+            values = self._records[field]
+            stats[field] = sum(values) / len(values) if values else 0.0
+        return stats
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.visible = not self.visible
+        self._overlay = None
+
+    def draw_overlay(self, surface):
+        """Draw the stats overlay in the top-right corner of surface."""
+        if not self.visible or surface is None:
+            return
+        if self._overlay is None or self.frames % OVERLAY_REFRESH_FRAMES == 0:
+            self._overlay = self._render_overlay()
+        surface.blit(self._overlay, (surface.get_width() - self._overlay.get_width() - 10, 10))
+
+    def _render_overlay(self):
+        """Render the current summary into a translucent panel."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, OVERLAY_FONT_SIZE)
+        stats = self.summary()
+        lines = [
+            f"{stats['fps']:.0f} fps  busy {stats['busy_ms']:.2f} ms",
+            f"frame p50 {stats['p50_ms']:.1f}  p95 {stats['p95_ms']:.1f}  p99 {stats['p99_ms']:.1f}",
+            *(f"{phase:<8}{stats[phase + '_ms']:.3f} ms" for phase in PHASES),
+            f"updates {stats['updates']:.2f}  entities {stats['entities']:.0f}",
+            f"alloc blocks/frame {stats['alloc_blocks']:+.0f}",
+        ]
+        rendered = [self._font.render(line, True, OVERLAY_COLOR) for line in lines]
+        line_height = self._font.get_linesize()
+        width = max(text.get_width() for text in rendered) + 12
+        panel = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BACKGROUND)
+        for i, text in enumerate(rendered):
+            panel.blit(text, (6, 6 + i * line_height))
+        return panel
+
+    def close(self):
+        """Flush and close the log file, if any."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            self._csv_writer = None
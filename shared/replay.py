@@ -0,0 +1,297 @@
+"""Compact binary input recording and bit-exact replay for game sessions.
+
+A recording holds the game's RNG seed and, for every frame, what the game's
+handle_input() consumed (pressed keys, modifier state, and QUIT, KEYDOWN and
+VIDEORESIZE events) plus how many update() calls the frame ran. With the
+same seed, feeding those frames back reproduces the session exactly, at any
+speed and with or without a window.
+
+File layout (all integers are unsigned LEB128 varints):
+    b"PGRP", version byte, seed, window width, window height, game name
+    (length + UTF-8), then one record per frame or run of frames.
+A record starts with a flags byte. FLAG_IDLE_RUN is followed by a count of
+frames with no new input and the same update count as the frame before.
+Otherwise the flags say which fields follow, in this order: the pressed key
+scancodes (count + values), the modifier bits, the events (count + events)
+and the update count. Fields that did not change since the previous frame
+are left out.
+"""
+
+import pygame
+
+MAGIC = b"PGRP"
+VERSION = 1
+
+FLAG_KEYS = 1
+FLAG_MODS = 2
+FLAG_EVENTS = 4
+FLAG_UPDATES = 8
+FLAG_IDLE_RUN = 16
+
+# Event type codes stored in recordings
+EVENT_QUIT = 0
+EVENT_KEYDOWN = 1
+EVENT_RESIZE = 2
+
+# Length of the pygame.key.get_pressed() tuple (SDL scancode count)
+KEY_STATE_SIZE = 512
+
+# Event types handle_input() methods consume
+RECORDED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE)
+
+
+def write_varint(out, value):
+    """Append a non-negative integer to a bytearray as an LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Read an LEB128 varint from data at pos. Returns (value, new pos)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# Indexing a ScancodeWrapper by keycode reads the entry at the key's scancode, so
+# this identity wrapper maps keycodes to scancodes (pygame has no direct call)
+_SCANCODES = pygame.key.ScancodeWrapper(range(KEY_STATE_SIZE))
+
+
+def pressed_scancodes(key_state):
+    """Get the scancodes held in a key state, as a tuple.
+
+    Args:
+        key_state: A pygame.key.get_pressed() result, or a set of held
+            keycodes as scripted input gives it (shared.batch.HeldKeys);
+            converting keycodes needs pygame's video subsystem initialized
+    """
+    if isinstance(key_state, (set, frozenset)):
+        return tuple(sorted({_SCANCODES[key] for key in key_state}))
+    return tuple(scancode for scancode, pressed in enumerate(key_state) if pressed)
+
+
+class InputFrame:
+    """Input one frame consumed, and how many updates it ran."""
+
+    __slots__ = ("keys", "mods", "events", "updates")
+
+    def __init__(self, keys, mods, events, updates):
+        """Initialize a frame.
+
+        Args:
+            keys: Key state, as pygame.key.get_pressed() returns it
+            mods: Modifier key bits (pygame.key.get_mods())
+            events: Tuple of pygame events
+            updates: Number of update() calls the frame ran
+        """
+        self.keys = keys
+        self.mods = mods
+        self.events = events
+        self.updates = updates
+
+
+class InputRecorder:
+    """Streams a session's per-frame input to a recording file."""
+
+    def __init__(self, path, game_name, seed, window_size):
+        """Open path and write the recording header.
+
+        Args:
+            path: File to write
+            game_name: Name of the recorded game class
+            seed: Seed of the game's RNG when the session started
+            window_size: (width, height) of the window when the session started
+        """
+        self.path = path
+        self.frames = 0
+        self._file = open(path, "wb")
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        write_varint(header, seed)
+        write_varint(header, window_size[0])
+        write_varint(header, window_size[1])
+        name = game_name.encode("utf-8")
+        write_varint(header, len(name))
+        header += name
+        self._file.write(header)
+
+        self._keys = ()
+        self._mods = 0
+        self._updates = 0
+        self._events = []
+        self._frame_keys = None
+        self._frame_mods = None
+        self._idle_run = 0
+
+    def record_events(self, events):
+        """Record the events handed to handle_input() this frame."""
+        self._events.extend(event for event in events if event.type in RECORDED_EVENT_TYPES)
+
+    def record_keys(self, key_state):
+        """Record the pygame.key.get_pressed() state handle_input() read this frame."""
+        self._frame_keys = pressed_scancodes(key_state)
+
+    def record_mods(self, mods):
+        """Record the pygame.key.get_mods() bits handle_input() read this frame."""
+        self._frame_mods = mods
+
+    def end_frame(self, updates):
+        """Finish the current frame, which ran `updates` update() calls."""
+        self.frames += 1
+        flags = 0
+        record = bytearray()
+        keys = self._frame_keys
+        if keys is not None and keys != self._keys:
+            flags |= FLAG_KEYS
+            write_varint(record, len(keys))
+            for scancode in keys:
+                write_varint(record, scancode)
+            self._keys = keys
+        mods = self._frame_mods
+        if mods is not None and mods != self._mods:
+            flags |= FLAG_MODS
+            write_varint(record, mods)
+            self._mods = mods
+        if self._events:
+            flags |= FLAG_EVENTS
+            write_varint(record, len(self._events))
+            for event in self._events:
+                self._write_event(record, event)
+        if updates != self._updates:
+            flags |= FLAG_UPDATES
+            write_varint(record, updates)
+            self._updates = updates
+
+        self._frame_keys = None
+        self._frame_mods = None
+        self._events.clear()
+
+        if not flags:
+            self._idle_run += 1
+            return
+        self._flush_idle_run()
+        self._file.write(bytes((flags,)) + record)
+
+    @staticmethod
+    def _write_event(record, event):
+        """Append one event to a frame record."""
+        if event.type == pygame.KEYDOWN:
+            record.append(EVENT_KEYDOWN)
+            write_varint(record, event.key)
+            write_varint(record, event.mod)
+            text = event.unicode.encode("utf-8")
+            write_varint(record, len(text))
+            record += text
+        elif event.type == pygame.VIDEORESIZE:
+            record.append(EVENT_RESIZE)
+            write_varint(record, event.w)
+            write_varint(record, event.h)
+        else:
+            record.append(EVENT_QUIT)
+
+    def _flush_idle_run(self):
+        """Write the pending run of idle frames, if any."""
+        if self._idle_run:
+            record = bytearray((FLAG_IDLE_RUN,))
+            write_varint(record, self._idle_run)
+            self._file.write(record)
+            self._idle_run = 0
+
+    def close(self):
+        """Write any pending frames and close the file."""
+        if self._file is not None:
+            self._flush_idle_run()
+            self._file.close()
+            self._file = None
+
+
+class InputReplay:
+    """A loaded recording: its header fields and the list of InputFrames."""
+
+    def __init__(self, game_name, seed, window_size, frames):
+        """Initialize a replay from already decoded parts."""
+        self.game_name = game_name
+        self.seed = seed
+        self.window_size = window_size
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path):
+        """Read and decode a recording file. pygame must already be initialized.
+
+        Raises:
+            ValueError: If the file is not a recording of a supported version
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if data[: len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+
+        pos = len(MAGIC) + 1
+        seed, pos = read_varint(data, pos)
+        width, pos = read_varint(data, pos)
+        height, pos = read_varint(data, pos)
+        length, pos = read_varint(data, pos)
+        game_name = data[pos : pos + length].decode("utf-8")
+        pos += length
+
+        frames = []
+        mods = 0
+        updates = 0
+        key_state = pygame.key.ScancodeWrapper((False,) * KEY_STATE_SIZE)
+        while pos < len(data):
+            flags = data[pos]
+            pos += 1
+            if flags & FLAG_IDLE_RUN:
+                count, pos = read_varint(data, pos)
+                idle = InputFrame(key_state, mods, (), updates)
+                frames.extend([idle] * count)
+                continue
+
+            if flags & FLAG_KEYS:
+                count, pos = read_varint(data, pos)
+                pressed = set()
+                for _ in range(count):
+                    scancode, pos = read_varint(data, pos)
+                    pressed.add(scancode)
+                key_state = pygame.key.ScancodeWrapper(scancode in pressed for scancode in range(KEY_STATE_SIZE))
+            if flags & FLAG_MODS:
+                mods, pos = read_varint(data, pos)
+            events = ()
+            if flags & FLAG_EVENTS:
+                count, pos = read_varint(data, pos)
+                events = []
+                for _ in range(count):
+                    event, pos = cls._read_event(data, pos)
+                    events.append(event)
+                events = tuple(events)
+            if flags & FLAG_UPDATES:
+                updates, pos = read_varint(data, pos)
+            frames.append(InputFrame(key_state, mods, events, updates))
+        return cls(game_name, seed, (width, height), frames)
+
+    @staticmethod
+    def _read_event(data, pos):
+        """Decode one event at pos. Returns (pygame event, new pos)."""
+        code = data[pos]
+        pos += 1
+        if code == EVENT_KEYDOWN:
+            key, pos = read_varint(data, pos)
+            mod, pos = read_varint(data, pos)
+            length, pos = read_varint(data, pos)
+            text = data[pos : pos + length].decode("utf-8")
+            return pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode=text), pos + length
+        if code == EVENT_RESIZE:
+            w, pos = read_varint(data, pos)
+            h, pos = read_varint(data, pos)
+            return pygame.event.Event(pygame.VIDEORESIZE, w=w, h=h, size=(w, h)), pos
+        return pygame.event.Event(pygame.QUIT), pos
@@ -1,7 +1,12 @@
 """Shared utility functions for all games."""
 
+from collections import OrderedDict
+
 import pygame
 
+# Memory budget for the default rendered-text cache
+TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
 
 def load_font(size=None, font_path=None):
     """Load a font with given size and optional path.
@@ -45,3 +50,103 @@ def distance(point1, point2):
     dx = point2[0] - point1[0]
     dy = point2[1] - point1[1]
     return (dx * dx + dy * dy) ** 0.5
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces with a bounded memory budget.
+
+    Surfaces are keyed by (font, text, antialias, color), so HUD and menu
+    strings that rarely change cost a dict lookup and a blit instead of a
+    full rasterization each frame. Cached surfaces are shared between
+    callers and must not be drawn on.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Pixel memory the cached surfaces may use before the
+                least recently used ones are evicted
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        """Return the number of cached surfaces."""
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias=True, color=(255, 255, 255)):
+        """Get a rendered surface for text, rasterizing it only on a cache miss.
+
+        Args:
+            font: pygame.font.Font to render with
+            text: String to render
+            antialias: Whether to antialias the glyphs
+            color: Text color
+
+        Returns:
+            pygame.Surface with the rendered text
+        """
+        key = (font, text, antialias, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.max_bytes:
+            return surface
+
+        self._surfaces[key] = surface
+        self.bytes_used += size
+        while self.bytes_used > self.max_bytes:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes_used -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface. Counters are kept."""
+        self._surfaces.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        """Get hit/miss counters and memory use.
+
+        Returns:
+            Dict with hits, misses, evictions, hit_rate, entries and bytes_used
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._surfaces),
+            "bytes_used": self.bytes_used,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias=True, color=(255, 255, 255)):
+    """Render text through the shared text cache.
+
+    Args:
+        font: pygame.font.Font to render with
+        text: String to render
+        antialias: Whether to antialias the glyphs
+        color: Text color
+
+    Returns:
+        Cached pygame.Surface; do not draw on it
+    """
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Batch simulation runner.
+
+Plays headless episodes of a game over a parameter grid, seeds and input
+policies on every CPU core, for balance and regression sweeps:
+    python simulate.py space_combat --param ENEMY_SPAWN_RATE=30,60,90 \\
+        --param ENEMY_SPEED=2,3 --policy hunter,random --episodes 1000 --out sweep.csv
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Workers import pygame too; one banner per core is noise
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from shared.batch import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_STEPS, SIMULATIONS, load_simulation, run_batch  # noqa: E402
+
+
+def parse_value(text):
+    """Parse a parameter value as an int, else a float, else keep the text."""
+    for parse in (int, float):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_args(argv):
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Play headless episodes of a game across every CPU core.")
+    parser.add_argument("game", choices=sorted(SIMULATIONS))
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="sweep a tunable constant over these values (repeatable; all combinations are played)",
+    )
+    parser.add_argument("--policy", default=None, help="comma-separated input policies (default: all)")
+    parser.add_argument("--episodes", type=int, default=100, help="episodes per combination and policy")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first episode; episode i uses seed + i")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS, help="update cap per episode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="episodes per worker task")
+    parser.add_argument("--out", default=None, help="stream every episode to this .csv or .jsonl file")
+    parser.add_argument("--record", default=None, metavar="DIR", help="save a replayable recording of every episode")
+    parser.add_argument("--list", action="store_true", help="list the game's parameters and policies, then exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run a batch from the command line."""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    simulation = load_simulation(args.game)
+    if args.list:
+        print(f"Parameters: {', '.join(simulation.PARAMETERS)}")
+        print(f"Policies: {', '.join(simulation.POLICIES)}")
+        return
+
+    grid = {}
+    for param in args.param:
+        name, _, values = param.partition("=")
+        if not values:
+            sys.exit(f"--param {param}: expected NAME=V1,V2,...")
+        grid[name] = [parse_value(value) for value in values.split(",")]
+    policies = args.policy.split(",") if args.policy else list(simulation.POLICIES)
+    seeds = range(args.seed, args.seed + args.episodes)
+
+    start = time.perf_counter()
+    try:
+        summary = run_batch(
+            args.game, grid, policies, seeds, args.max_steps, args.workers, args.chunk_size, args.out, args.record
+        )
+    except ValueError as error:
+        sys.exit(str(error))
+    elapsed = time.perf_counter() - start
+
+    print(summary.format_table())
+    print(f"\n{summary.episodes} episodes in {elapsed:.1f} s ({summary.episodes / elapsed:.1f} episodes/s)")
+    if args.out:
+        print(f"Episodes written to {args.out}")
+    if args.record:
+        print(f"Recordings saved in {args.record}")
+
+
+if __name__ == "__main__":
+    main()
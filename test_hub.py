@@ -0,0 +1,75 @@
+"""Test that games launched from the hub start from their own window size.
+
+The hub plays every game in one process, and games keep their layout in
+module constants that resizes change. Each game is launched headless,
+resized, left, and launched again: the new game's constants must match its
+window, and its first update must not end it. Runs under pytest or as a
+script.
+"""
+
+import importlib
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from games.snake import constants as snake_constants  # noqa: E402
+from shared.hub import GAMES, GameHub  # noqa: E402
+
+RESIZED = (400, 300)  # Window size the first launch is left at
+
+
+def check_relaunch(key):
+    """Resize a launched game, then launch it again and check the new one's layout constants.
+
+    Args:
+        key: The game's hub key
+
+    Returns:
+        The relaunched game
+    """
+    module_name = next(module for entry_key, _, module, _ in GAMES if entry_key == key)
+    constants = importlib.import_module(module_name.rsplit(".", 1)[0] + ".constants")
+    hub = GameHub(headless=True, seed=0)
+    hub.launch(key).resize_window(*RESIZED)
+    hub.restore_window()
+
+    game = hub.launch(key)
+    size = (game.window_width, game.window_height)
+    assert size != RESIZED, f"{key} kept the resized window"
+    assert (constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT) == size, f"{key} constants kept the resized window"
+
+    if hasattr(game, "start_match"):
+        game.start_match()
+    game.update()
+    assert not game.is_game_over(), f"{key} ended on its first update after a relaunch"
+    return game
+
+
+def test_snake_relaunch():
+    game = check_relaunch("snake")
+    assert (snake_constants.GRID_WIDTH, snake_constants.GRID_HEIGHT) == (
+        game.window_width // snake_constants.GRID_SIZE,
+        game.window_height // snake_constants.GRID_SIZE,
+    )
+
+
+def test_pong_relaunch():
+    check_relaunch("pong")
+
+
+def test_space_combat_relaunch():
+    game = check_relaunch("space_combat")
+    for _ in range(game.window_width):
+        game.player1.move_right()
+    assert game.player1.x == game.window_width - game.player1.width
+
+
+def test_typing_relaunch():
+    check_relaunch("typing")
+
+
+if __name__ == "__main__":
+    for key, _, _, _ in GAMES:
+        game = check_relaunch(key)
+        print(f"{key}: relaunched at {game.window_width}x{game.window_height}")
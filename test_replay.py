@@ -0,0 +1,140 @@
+"""Test that recorded sessions replay to the same final state, for every game.
+
+Each game is played headless by one of its batch simulation policies (some
+hold keys, some press them) while the input is recorded, then the recording
+is replayed into a fresh game and both final states are compared. Runs
+under pytest or as a script.
+"""
+
+import os
+import random
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from shared.base_game import replay_session  # noqa: E402
+from shared.batch import NO_KEYS, apply_parameters, episode_filename, key_press, load_simulation  # noqa: E402
+from shared.batch import replay_episode, run_chunk  # noqa: E402
+
+STEPS = 1500
+RESIZED = (480, 360)  # Window size of the sessions recorded after a resize
+
+# game key -> (policy, key pressed on the first frame to leave the menu, or None)
+SESSIONS = {
+    "snake": ("greedy", None),
+    "pong": ("follow", pygame.K_1),
+    "space_combat": ("hunter", pygame.K_1),
+    "typing": ("fast_typist", None),
+}
+
+
+def final_state(game, simulation):
+    """Get what a session must reproduce: metrics, steps and the RNG position."""
+    return simulation.episode_metrics(game), game.steps, game.rng.getstate()
+
+
+def record_session(key, path, seed=7, window_size=None):
+    """Play a headless session of a game with its policy, recording the input to path.
+
+    With window_size the game is resized to it before recording starts.
+    """
+    simulation = load_simulation(key)
+    policy, start_key = SESSIONS[key]
+    game = type(simulation.new_game(seed))(headless=True, seed=seed)
+    if window_size is not None:
+        game.resize_window(*window_size)
+    act = simulation.POLICIES[policy](random.Random(seed))
+
+    def scripted(game):
+        if start_key is not None and game.steps == 0:
+            return NO_KEYS, (key_press(start_key),)
+        return act(game)
+
+    game.start_recording(path)
+    game.run_scripted(scripted, STEPS)
+    game.stop_recording()
+    return game
+
+
+def check_round_trip(key, window_size=None):
+    """Record a session of one game, replay it and compare the final states.
+
+    With window_size the session is recorded at that size, and the replay
+    starts from the default layout, as in a new process.
+    """
+    simulation = load_simulation(key)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"{key}.pgrp")
+        live = record_session(key, path, window_size=window_size)
+        default_size = type(live)(headless=True)
+        if window_size is not None:
+            # Put the layout constants the resize changed back to their defaults
+            default_size.resize_window(default_size.window_width, default_size.window_height)
+        replayed = replay_session(type(live), path)
+    if window_size is not None:
+        default_size.resize_window(default_size.window_width, default_size.window_height)
+    assert final_state(replayed, simulation) == final_state(live, simulation), f"{key} replay diverged"
+    return simulation.episode_metrics(live)
+
+
+def test_snake_replay():
+    check_round_trip("snake")
+
+
+def test_pong_replay():
+    check_round_trip("pong")
+
+
+def test_space_combat_replay():
+    check_round_trip("space_combat")
+
+
+def test_typing_replay():
+    check_round_trip("typing")
+
+
+def test_replay_window_size():
+    for key in SESSIONS:
+        check_round_trip(key, window_size=RESIZED)
+
+
+# game key -> (policy, parameters) of a recorded batch episode
+BATCH_EPISODES = {
+    "snake": ("greedy", {}),
+    "pong": ("follow", {"PADDLE_SPEED": 7}),
+    "space_combat": ("hunter", {"ENEMY_SPAWN_RATE": 20}),
+    "typing": ("typist", {}),
+}
+
+
+def check_batch_round_trip(key, seed=3):
+    """Record a batch episode of one game through run_chunk, replay it and compare the results."""
+    simulation = load_simulation(key)
+    policy, params = BATCH_EPISODES[key]
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            (row,) = run_chunk(key, params, policy, [seed], STEPS, record_dir=directory)
+            replayed = replay_episode(key, os.path.join(directory, episode_filename(key, policy, params, seed)), params)
+    finally:
+        apply_parameters(simulation, {})
+    metrics = simulation.episode_metrics(replayed)
+    assert {name: row[name] for name in metrics} == metrics, f"{key} batch replay diverged"
+    assert row["steps"] == replayed.steps, f"{key} batch replay ran {replayed.steps} steps, not {row['steps']}"
+    return metrics
+
+
+def test_batch_episode_replay():
+    for key in BATCH_EPISODES:
+        check_batch_round_trip(key)
+
+
+if __name__ == "__main__":
+    for key in SESSIONS:
+        print(f"{key}: replay matches, {check_round_trip(key)}")
+    for key in SESSIONS:
+        print(f"{key}: replay at {RESIZED} matches, {check_round_trip(key, window_size=RESIZED)}")
+    for key in BATCH_EPISODES:
+        print(f"{key}: batch episode replay matches, {check_batch_round_trip(key)}")